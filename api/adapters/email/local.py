@@ -0,0 +1,24 @@
+import asyncio
+import logging
+import random
+
+from .fake import FakeEmailAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class LocalEmailAdapter(FakeEmailAdapter):
+    """Offline stand-in for the email provider with its latency and failure rate."""
+
+    def __init__(self, latency: float = 0.0, failure_rate: float = 0.0) -> None:
+        super().__init__()
+        self.latency = latency
+        self.failure_rate = failure_rate
+
+    async def send(self, email: str, subject: str, body: str) -> None:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if random.random() < self.failure_rate:
+            raise ConnectionError(f"Email to {email} was not delivered")
+        logger.info("Email to %s: %s", email, subject)
+        await super().send(email, subject, body)
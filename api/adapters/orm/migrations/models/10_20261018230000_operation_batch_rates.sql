@@ -0,0 +1,6 @@
+-- upgrade --
+ALTER TABLE "ormoperationbatch" ADD COLUMN IF NOT EXISTS "rates" JSONB;
+ALTER TABLE "ormoperationbatch" ADD COLUMN IF NOT EXISTS "rates_date" TIMESTAMPTZ;
+-- downgrade --
+ALTER TABLE "ormoperationbatch" DROP COLUMN IF EXISTS "rates_date";
+ALTER TABLE "ormoperationbatch" DROP COLUMN IF EXISTS "rates";
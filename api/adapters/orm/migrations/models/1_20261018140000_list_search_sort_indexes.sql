@@ -0,0 +1,31 @@
+-- upgrade --
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS "idx_ormcompany_name_trgm" ON "ormcompany" USING GIN ((UPPER(CAST("name" AS VARCHAR))) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS "idx_ormcompany_name" ON "ormcompany" ("name");
+CREATE INDEX IF NOT EXISTS "idx_ormcompany_created_date" ON "ormcompany" ("created_date");
+CREATE INDEX IF NOT EXISTS "idx_ormcompany_updated_date" ON "ormcompany" ("updated_date");
+CREATE INDEX IF NOT EXISTS "idx_orminvoiceitem_descripion_trgm" ON "orminvoiceitem" USING GIN ((UPPER(CAST("descripion" AS VARCHAR))) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS "idx_orminvoice_created_date" ON "orminvoice" ("created_date");
+CREATE INDEX IF NOT EXISTS "idx_orminvoice_updated_date" ON "orminvoice" ("updated_date");
+CREATE INDEX IF NOT EXISTS "idx_ormoperation_created_date" ON "ormoperation" ("created_date");
+CREATE INDEX IF NOT EXISTS "idx_ormoperation_updated_date" ON "ormoperation" ("updated_date");
+CREATE INDEX IF NOT EXISTS "idx_ormoperation_status" ON "ormoperation" ("status");
+CREATE INDEX IF NOT EXISTS "idx_ormoperation_sender_amount" ON "ormoperation" ("sender_amount");
+CREATE INDEX IF NOT EXISTS "idx_ormoperation_recipient_amount" ON "ormoperation" ("recipient_amount");
+CREATE INDEX IF NOT EXISTS "idx_ormsenderbankaccount_created_date" ON "ormsenderbankaccount" ("created_date");
+CREATE INDEX IF NOT EXISTS "idx_ormrecipientbankaccount_created_date" ON "ormrecipientbankaccount" ("created_date");
+-- downgrade --
+DROP INDEX IF EXISTS "idx_ormcompany_name_trgm";
+DROP INDEX IF EXISTS "idx_ormcompany_name";
+DROP INDEX IF EXISTS "idx_ormcompany_created_date";
+DROP INDEX IF EXISTS "idx_ormcompany_updated_date";
+DROP INDEX IF EXISTS "idx_orminvoiceitem_descripion_trgm";
+DROP INDEX IF EXISTS "idx_orminvoice_created_date";
+DROP INDEX IF EXISTS "idx_orminvoice_updated_date";
+DROP INDEX IF EXISTS "idx_ormoperation_created_date";
+DROP INDEX IF EXISTS "idx_ormoperation_updated_date";
+DROP INDEX IF EXISTS "idx_ormoperation_status";
+DROP INDEX IF EXISTS "idx_ormoperation_sender_amount";
+DROP INDEX IF EXISTS "idx_ormoperation_recipient_amount";
+DROP INDEX IF EXISTS "idx_ormsenderbankaccount_created_date";
+DROP INDEX IF EXISTS "idx_ormrecipientbankaccount_created_date";
@@ -0,0 +1,22 @@
+-- upgrade --
+DROP INDEX IF EXISTS "idx_ormcompany_created_date";
+CREATE INDEX IF NOT EXISTS "idx_ormcompany_created_date_id" ON "ormcompany" ("created_date", "id");
+DROP INDEX IF EXISTS "idx_orminvoice_created_date";
+CREATE INDEX IF NOT EXISTS "idx_orminvoice_created_date_id" ON "orminvoice" ("created_date", "id");
+DROP INDEX IF EXISTS "idx_ormoperation_created_date";
+CREATE INDEX IF NOT EXISTS "idx_ormoperation_created_date_id" ON "ormoperation" ("created_date", "id");
+DROP INDEX IF EXISTS "idx_ormsenderbankaccount_created_date";
+CREATE INDEX IF NOT EXISTS "idx_ormsenderbankaccount_created_date_id" ON "ormsenderbankaccount" ("created_date", "id");
+DROP INDEX IF EXISTS "idx_ormrecipientbankaccount_created_date";
+CREATE INDEX IF NOT EXISTS "idx_ormrecipientbankaccount_created_date_id" ON "ormrecipientbankaccount" ("created_date", "id");
+-- downgrade --
+DROP INDEX IF EXISTS "idx_ormcompany_created_date_id";
+CREATE INDEX IF NOT EXISTS "idx_ormcompany_created_date" ON "ormcompany" ("created_date");
+DROP INDEX IF EXISTS "idx_orminvoice_created_date_id";
+CREATE INDEX IF NOT EXISTS "idx_orminvoice_created_date" ON "orminvoice" ("created_date");
+DROP INDEX IF EXISTS "idx_ormoperation_created_date_id";
+CREATE INDEX IF NOT EXISTS "idx_ormoperation_created_date" ON "ormoperation" ("created_date");
+DROP INDEX IF EXISTS "idx_ormsenderbankaccount_created_date_id";
+CREATE INDEX IF NOT EXISTS "idx_ormsenderbankaccount_created_date" ON "ormsenderbankaccount" ("created_date");
+DROP INDEX IF EXISTS "idx_ormrecipientbankaccount_created_date_id";
+CREATE INDEX IF NOT EXISTS "idx_ormrecipientbankaccount_created_date" ON "ormrecipientbankaccount" ("created_date");
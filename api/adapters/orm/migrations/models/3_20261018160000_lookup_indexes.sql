@@ -0,0 +1,46 @@
+-- upgrade --
+-- users are not merged automatically, the upgrade stops until duplicate emails and phones are cleaned up
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM "ormuser" GROUP BY "email" HAVING COUNT(*) > 1) THEN
+        RAISE EXCEPTION 'ormuser has duplicate emails, merge these users before upgrading';
+    END IF;
+    IF EXISTS (SELECT 1 FROM "ormuser" WHERE "phone" IS NOT NULL GROUP BY "phone" HAVING COUNT(*) > 1) THEN
+        RAISE EXCEPTION 'ormuser has duplicate phones, merge these users before upgrading';
+    END IF;
+END $$;
+-- codes shared by several users are ambiguous, they are dropped and requested again
+UPDATE "ormuser" SET "email_code" = NULL WHERE "email_code" IN (SELECT "email_code" FROM "ormuser" GROUP BY "email_code" HAVING COUNT(*) > 1);
+UPDATE "ormuser" SET "password_code" = NULL WHERE "password_code" IN (SELECT "password_code" FROM "ormuser" GROUP BY "password_code" HAVING COUNT(*) > 1);
+-- repeated invites of an email to a company keep the latest one
+DELETE FROM "orminviteusertocompany" WHERE "id" IN (SELECT "id" FROM (SELECT "id", ROW_NUMBER() OVER (PARTITION BY "email", "company_id" ORDER BY "created_date" DESC, "id") AS "n" FROM "orminviteusertocompany" WHERE "company_id" IS NOT NULL) AS "invites" WHERE "n" > 1);
+UPDATE "orminviteusertocompany" SET "invitation_code" = md5(random()::text || "id"::text) WHERE "invitation_code" IN (SELECT "invitation_code" FROM "orminviteusertocompany" GROUP BY "invitation_code" HAVING COUNT(*) > 1);
+CREATE UNIQUE INDEX IF NOT EXISTS "uid_ormuser_email" ON "ormuser" ("email");
+CREATE UNIQUE INDEX IF NOT EXISTS "uid_ormuser_phone" ON "ormuser" ("phone") WHERE "phone" IS NOT NULL;
+CREATE UNIQUE INDEX IF NOT EXISTS "uid_ormuser_email_code" ON "ormuser" ("email_code") WHERE "email_code" IS NOT NULL;
+CREATE UNIQUE INDEX IF NOT EXISTS "uid_ormuser_password_code" ON "ormuser" ("password_code") WHERE "password_code" IS NOT NULL;
+CREATE INDEX IF NOT EXISTS "idx_ormuser_phone_code" ON "ormuser" ("phone_code") WHERE "phone_code" IS NOT NULL;
+CREATE INDEX IF NOT EXISTS "idx_ormcompany_owner_name" ON "ormcompany" ("owner_id", "name");
+CREATE INDEX IF NOT EXISTS "idx_ormcompanym2mcontractor_contractor" ON "ormcompanym2mcontractor" ("contractor_id");
+CREATE INDEX IF NOT EXISTS "idx_ormcompanym2memployer_employer" ON "ormcompanym2memployer" ("employer_id");
+CREATE UNIQUE INDEX IF NOT EXISTS "uid_orminviteusertocompany_invitation_code" ON "orminviteusertocompany" ("invitation_code");
+CREATE UNIQUE INDEX IF NOT EXISTS "uid_orminviteusertocompany_email_company" ON "orminviteusertocompany" ("email", "company_id");
+CREATE INDEX IF NOT EXISTS "idx_orminvoice_created_by_for_company" ON "orminvoice" ("created_by_id", "for_company_id", "created_date", "id");
+CREATE INDEX IF NOT EXISTS "idx_orminvoiceitem_invoice" ON "orminvoiceitem" ("invoice_id");
+CREATE INDEX IF NOT EXISTS "idx_ormoperation_recipient_user_owner_company" ON "ormoperation" ("operation_recipient_user_id", "operation_owner_company_id", "created_date", "id");
+CREATE INDEX IF NOT EXISTS "idx_ormrecipientbankaccount_owner" ON "ormrecipientbankaccount" ("recipient_owner_user_id", "recipient_owner_company_id", "created_date", "id");
+-- downgrade --
+DROP INDEX IF EXISTS "uid_ormuser_email";
+DROP INDEX IF EXISTS "uid_ormuser_phone";
+DROP INDEX IF EXISTS "uid_ormuser_email_code";
+DROP INDEX IF EXISTS "uid_ormuser_password_code";
+DROP INDEX IF EXISTS "idx_ormuser_phone_code";
+DROP INDEX IF EXISTS "idx_ormcompany_owner_name";
+DROP INDEX IF EXISTS "idx_ormcompanym2mcontractor_contractor";
+DROP INDEX IF EXISTS "idx_ormcompanym2memployer_employer";
+DROP INDEX IF EXISTS "uid_orminviteusertocompany_invitation_code";
+DROP INDEX IF EXISTS "uid_orminviteusertocompany_email_company";
+DROP INDEX IF EXISTS "idx_orminvoice_created_by_for_company";
+DROP INDEX IF EXISTS "idx_orminvoiceitem_invoice";
+DROP INDEX IF EXISTS "idx_ormoperation_recipient_user_owner_company";
+DROP INDEX IF EXISTS "idx_ormrecipientbankaccount_owner";
@@ -0,0 +1,18 @@
+-- upgrade --
+CREATE TABLE IF NOT EXISTS "ormoutboxmessage" (
+    "id" UUID NOT NULL  PRIMARY KEY,
+    "created_date" TIMESTAMPTZ NOT NULL,
+    "updated_date" TIMESTAMPTZ,
+    "channel" VARCHAR(16) NOT NULL,
+    "recipient" VARCHAR(255) NOT NULL,
+    "subject" VARCHAR(255),
+    "body" TEXT NOT NULL,
+    "attempts" INT NOT NULL  DEFAULT 0,
+    "next_attempt_date" TIMESTAMPTZ NOT NULL,
+    "sent_date" TIMESTAMPTZ,
+    "failed_date" TIMESTAMPTZ,
+    "error" TEXT
+);
+CREATE INDEX IF NOT EXISTS "idx_ormoutboxmessage_pending" ON "ormoutboxmessage" ("next_attempt_date") WHERE "sent_date" IS NULL AND "failed_date" IS NULL;
+-- downgrade --
+DROP TABLE IF EXISTS "ormoutboxmessage";
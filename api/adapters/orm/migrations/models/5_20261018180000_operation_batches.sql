@@ -0,0 +1,17 @@
+-- upgrade --
+CREATE TABLE IF NOT EXISTS "ormoperationbatch" (
+    "id" UUID NOT NULL  PRIMARY KEY,
+    "created_date" TIMESTAMPTZ NOT NULL,
+    "updated_date" TIMESTAMPTZ,
+    "status" VARCHAR(16) NOT NULL,
+    "invoices_count" INT NOT NULL,
+    "processed_count" INT NOT NULL  DEFAULT 0,
+    "operations_count" INT NOT NULL  DEFAULT 0,
+    "error" TEXT,
+    "company_id" UUID NOT NULL REFERENCES "ormcompany" ("id") ON DELETE CASCADE,
+    "created_by_id" UUID NOT NULL REFERENCES "ormuser" ("id") ON DELETE CASCADE
+);
+ALTER TABLE "ormoperation" ADD COLUMN IF NOT EXISTS "batch_id" UUID REFERENCES "ormoperationbatch" ("id") ON DELETE SET NULL;
+-- downgrade --
+ALTER TABLE "ormoperation" DROP COLUMN IF EXISTS "batch_id";
+DROP TABLE IF EXISTS "ormoperationbatch";
@@ -0,0 +1,6 @@
+-- upgrade --
+ALTER TABLE "ormoperation" ADD COLUMN IF NOT EXISTS "lease_expiry_date" TIMESTAMPTZ;
+CREATE INDEX IF NOT EXISTS "idx_ormoperation_processing" ON "ormoperation" ((COALESCE("lease_expiry_date", "created_date"))) WHERE "status" IN ('NEW', 'IN_PROGRESS', 'ACCEPTED');
+-- downgrade --
+DROP INDEX IF EXISTS "idx_ormoperation_processing";
+ALTER TABLE "ormoperation" DROP COLUMN IF EXISTS "lease_expiry_date";
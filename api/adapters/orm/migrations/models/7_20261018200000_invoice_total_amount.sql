@@ -0,0 +1,7 @@
+-- upgrade --
+ALTER TABLE "orminvoice" ADD COLUMN IF NOT EXISTS "total_amount" DECIMAL(12,2) NOT NULL  DEFAULT 0;
+UPDATE "orminvoice" AS i SET "total_amount" = t."total_amount"
+FROM (SELECT "invoice_id", SUM("amount" * "quantity") AS "total_amount" FROM "orminvoiceitem" GROUP BY "invoice_id") AS t
+WHERE t."invoice_id" = i."id";
+-- downgrade --
+ALTER TABLE "orminvoice" DROP COLUMN IF EXISTS "total_amount";
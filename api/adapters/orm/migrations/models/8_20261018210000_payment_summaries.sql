@@ -0,0 +1,38 @@
+-- upgrade --
+CREATE TABLE IF NOT EXISTS "ormpaymentsummary" (
+    "id" UUID NOT NULL  PRIMARY KEY,
+    "created_date" TIMESTAMPTZ NOT NULL,
+    "updated_date" TIMESTAMPTZ,
+    "month" DATE NOT NULL,
+    "currency" VARCHAR(3) NOT NULL,
+    "amount" DECIMAL(20,2) NOT NULL  DEFAULT 0,
+    "fees" DECIMAL(20,2) NOT NULL  DEFAULT 0,
+    "operations_count" INT NOT NULL  DEFAULT 0,
+    "invoices_count" INT NOT NULL  DEFAULT 0,
+    "company_id" UUID NOT NULL REFERENCES "ormcompany" ("id") ON DELETE CASCADE,
+    "contractor_id" UUID NOT NULL REFERENCES "ormuser" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_ormpaymentsummary_company_month" UNIQUE ("company_id", "month", "contractor_id", "currency")
+);
+CREATE INDEX IF NOT EXISTS "idx_orminvoice_operation" ON "orminvoice" ("operation_id");
+INSERT INTO "ormpaymentsummary" (
+    "id", "created_date", "company_id", "month", "contractor_id", "currency",
+    "amount", "fees", "operations_count", "invoices_count"
+)
+SELECT
+    gen_random_uuid(),
+    now(),
+    o."operation_owner_company_id",
+    date_trunc('month', COALESCE(o."updated_date", o."created_date"))::date,
+    o."operation_recipient_user_id",
+    o."sender_currency",
+    COALESCE(SUM(o."sender_amount"), 0),
+    COALESCE(SUM(COALESCE(o."our_fee", 0) + COALESCE(o."provider_fee", 0)), 0),
+    COUNT(*),
+    SUM(i."invoices_count")
+FROM "ormoperation" AS o
+CROSS JOIN LATERAL (SELECT COUNT(*) AS "invoices_count" FROM "orminvoice" WHERE "operation_id" = o."id") AS i
+WHERE o."status" = 'COMPLETED'
+GROUP BY 3, 4, 5, 6;
+-- downgrade --
+DROP INDEX IF EXISTS "idx_orminvoice_operation";
+DROP TABLE IF EXISTS "ormpaymentsummary";
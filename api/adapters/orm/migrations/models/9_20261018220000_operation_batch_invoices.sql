@@ -0,0 +1,25 @@
+-- upgrade --
+CREATE TABLE IF NOT EXISTS "ormoperationbatchinvoice" (
+    "id" UUID NOT NULL  PRIMARY KEY,
+    "created_date" TIMESTAMPTZ NOT NULL,
+    "updated_date" TIMESTAMPTZ,
+    "position" INT NOT NULL,
+    "batch_id" UUID NOT NULL REFERENCES "ormoperationbatch" ("id") ON DELETE CASCADE,
+    "invoice_id" UUID NOT NULL REFERENCES "orminvoice" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_ormoperationbatchinvoice_batch_position" UNIQUE ("batch_id", "position")
+);
+ALTER TABLE "ormoperationbatch" ADD COLUMN IF NOT EXISTS "sender_account_id" UUID REFERENCES "ormsenderbankaccount" ("id") ON DELETE SET NULL;
+ALTER TABLE "ormoperationbatch" ADD COLUMN IF NOT EXISTS "attempts" INT NOT NULL  DEFAULT 0;
+ALTER TABLE "ormoperationbatch" ADD COLUMN IF NOT EXISTS "skipped_count" INT NOT NULL  DEFAULT 0;
+CREATE INDEX IF NOT EXISTS "idx_ormoperationbatchinvoice_invoice" ON "ormoperationbatchinvoice" ("invoice_id");
+-- sums of grouped invoices and converted amounts outgrow DECIMAL(9,2)
+ALTER TABLE "ormoperation" ALTER COLUMN "sender_amount" TYPE DECIMAL(18,2), ALTER COLUMN "recipient_amount" TYPE DECIMAL(18,2), ALTER COLUMN "our_fee" TYPE DECIMAL(18,2), ALTER COLUMN "provider_fee" TYPE DECIMAL(18,2);
+CREATE INDEX IF NOT EXISTS "idx_ormoperationbatch_processing" ON "ormoperationbatch" ((COALESCE("updated_date", "created_date"))) WHERE "status" IN ('NEW', 'IN_PROGRESS');
+-- downgrade --
+ALTER TABLE "ormoperation" ALTER COLUMN "sender_amount" TYPE DECIMAL(9,2), ALTER COLUMN "recipient_amount" TYPE DECIMAL(9,2), ALTER COLUMN "our_fee" TYPE DECIMAL(9,2), ALTER COLUMN "provider_fee" TYPE DECIMAL(9,2);
+DROP INDEX IF EXISTS "idx_ormoperationbatchinvoice_invoice";
+DROP INDEX IF EXISTS "idx_ormoperationbatch_processing";
+ALTER TABLE "ormoperationbatch" DROP COLUMN IF EXISTS "skipped_count";
+ALTER TABLE "ormoperationbatch" DROP COLUMN IF EXISTS "attempts";
+ALTER TABLE "ormoperationbatch" DROP COLUMN IF EXISTS "sender_account_id";
+DROP TABLE IF EXISTS "ormoperationbatchinvoice";
@@ -54,4 +54,5 @@ class ORMRecipientBankAccount(ORMAbstractRecipientBankAccount):
     )
 
     class Meta:
+        indexes = (("recipient_owner_user", "recipient_owner_company", "created_date", "id"),)
         pydantic_cls = RecipientBankAccount
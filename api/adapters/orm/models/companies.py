@@ -13,6 +13,7 @@ class ORMCompany(ORMAbstractModel):
     )
 
     class Meta:
+        indexes = (("owner", "name"),)
         pydantic_cls = Company
 
 
@@ -28,6 +29,7 @@ class ORMCompanyM2MEmployer(ORMAbstractModel):
 
     class Meta:
         unique_together = ("company", "employer")
+        indexes = (("employer",),)
         pydantic_cls = CompanyM2MEmployer
 
 
@@ -43,6 +45,7 @@ class ORMCompanyM2MContractor(ORMAbstractModel):
 
     class Meta:
         unique_together = ("company", "contractor")
+        indexes = (("contractor",),)
         pydantic_cls = CompanyM2MContractor
 
 
@@ -54,7 +57,8 @@ class ORMInviteUserToCompany(ORMAbstractModel):
         null=True,
     )
     email = fields.CharField(max_length=255)
-    invitation_code = fields.CharField(max_length=255)
+    invitation_code = fields.CharField(max_length=255, unique=True)
 
     class Meta:
+        unique_together = ("email", "company")
         pydantic_cls = InviteUserToCompany
@@ -1,25 +1,83 @@
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
 from tortoise import fields
+from tortoise.fields import Field
 from tortoise.models import Model
 
 from domain.models.generic import AbstractModel
 
 
+class FieldMapping:
+    """ORM columns shared with the pydantic model, computed once per ORM model."""
+
+    def __init__(self, orm_model_cls: type[Model], pydantic_cls: type[AbstractModel]) -> None:
+        meta = orm_model_cls._meta
+        names = [name for name in pydantic_cls.__fields__ if name in meta.fields_db_projection]
+        self.pydantic_cls = pydantic_cls
+        # (name, caster) to build pydantic objects from DB values without validation
+        self.read: List[Tuple[str, Optional[Callable[[Any], Any]]]] = [
+            (name, self.get_caster(pydantic_cls.__fields__[name].type_)) for name in names
+        ]
+        # (name, ORM field, pydantic default) to fill ORM objects
+        self.write: List[Tuple[str, Field, Any]] = [
+            (name, meta.fields_map[name], pydantic_cls.__fields__[name].default) for name in names
+        ]
+
+    @staticmethod
+    def get_caster(type_: Any) -> Optional[Callable[[Any], Any]]:
+        # DB returns raw values for choice columns
+        if isinstance(type_, type) and issubclass(type_, Enum):
+            return type_
+        return None
+
+
+_field_mappings: Dict[type, FieldMapping] = {}
+
+
 class ORMAbstractModel(Model):
     id = fields.UUIDField(pk=True)
 
     created_date = fields.DatetimeField()
     updated_date = fields.DatetimeField(null=True)
 
+    @classmethod
+    def get_field_mapping(cls) -> FieldMapping:
+        mapping = _field_mappings.get(cls)
+        if mapping is None:
+            mapping = _field_mappings[cls] = FieldMapping(cls, getattr(cls.Meta, "pydantic_cls"))
+        return mapping
+
     def to_dict(self) -> dict:
         return {i: v for i, v in self.__dict__.items() if not i.startswith("_")}
 
     def from_pydantic(self, pydantic_obj: AbstractModel) -> None:
-        self.update_from_dict(pydantic_obj.dict(exclude_none=True, exclude_unset=True, exclude_defaults=True))
+        # same fields as .dict(exclude_none=True, exclude_unset=True, exclude_defaults=True)
+        values = pydantic_obj.__dict__
+        fields_set = pydantic_obj.__fields_set__
+        for name, field, default in self.get_field_mapping().write:
+            value = values.get(name)
+            if value is None or name not in fields_set or value == default:
+                continue
+            setattr(self, name, field.to_python_value(value))
 
-    def to_pydantic(self) -> AbstractModel:
-        pydantic_cls: AbstractModel = getattr(self.Meta, "pydantic_cls")
-        obj = pydantic_cls(**self.to_dict())
-        return obj
+    def to_pydantic(self, validate: bool = False) -> AbstractModel:
+        mapping = self.get_field_mapping()
+        values = {}
+        for name, caster in mapping.read:
+            if name not in self.__dict__:
+                continue
+            value = self.__dict__[name]
+            if caster is not None and value is not None:
+                value = caster(value)
+            values[name] = value
+        if validate:
+            pydantic_obj = mapping.pydantic_cls(**values)
+        else:
+            # rows read from the DB are trusted
+            pydantic_obj = mapping.pydantic_cls.construct(**values)
+        pydantic_obj.track_changes()
+        return pydantic_obj
 
     class Meta:
         abstract = True
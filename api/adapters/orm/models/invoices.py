@@ -32,9 +32,18 @@ class ORMInvoice(ORMAbstractModel):
         "models.ORMOperation",
         related_name="invoices",
         null=True,
+        index=True,
+    )
+
+    # sum of the items, kept up to date by the handlers which change them
+    total_amount = fields.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
     )
 
     class Meta:
+        indexes = (("created_by", "for_company", "created_date", "id"),)
         pydantic_cls = Invoice
 
 
@@ -42,6 +51,7 @@ class ORMInvoiceItem(ORMAbstractModel):
     invoice = fields.ForeignKeyField(
         "models.ORMInvoice",
         related_name="invoice_items",
+        index=True,
     )
     amount = fields.DecimalField(
         max_digits=9,
@@ -1,11 +1,58 @@
 from tortoise import fields
 
-from domain.models.operations import Operation
+from domain.models.operations import Operation, OperationBatch, OperationBatchInvoice
 
 from .bank_accounts import ORMAbstractRecipientBankAccount, ORMAbstractSenderBankAccount
 from .generic import ORMAbstractModel
 
 
+class ORMOperationBatch(ORMAbstractModel):
+    company = fields.ForeignKeyField(
+        "models.ORMCompany",
+        related_name="operation_batches",
+    )
+    created_by = fields.ForeignKeyField(
+        "models.ORMUser",
+        related_name="operation_batches",
+    )
+    sender_account = fields.ForeignKeyField(
+        "models.ORMSenderBankAccount",
+        related_name="operation_batches",
+        null=True,
+        on_delete=fields.SET_NULL,
+    )
+
+    status = fields.CharField(max_length=16)
+    invoices_count = fields.IntField()
+    processed_count = fields.IntField(default=0)
+    operations_count = fields.IntField(default=0)
+    skipped_count = fields.IntField(default=0)
+    attempts = fields.IntField(default=0)
+    error = fields.TextField(null=True)
+    rates = fields.JSONField(null=True)
+    rates_date = fields.DatetimeField(null=True)
+
+    class Meta:
+        pydantic_cls = OperationBatch
+
+
+class ORMOperationBatchInvoice(ORMAbstractModel):
+    batch = fields.ForeignKeyField(
+        "models.ORMOperationBatch",
+        related_name="batch_invoices",
+    )
+    invoice = fields.ForeignKeyField(
+        "models.ORMInvoice",
+        related_name="batch_invoices",
+    )
+    position = fields.IntField()
+
+    class Meta:
+        indexes = (("invoice",),)
+        pydantic_cls = OperationBatchInvoice
+        unique_together = (("batch", "position"),)
+
+
 class ORMOperation(ORMAbstractSenderBankAccount, ORMAbstractRecipientBankAccount, ORMAbstractModel):
     operation_owner_company = fields.ForeignKeyField(
         "models.ORMCompany",
@@ -27,7 +74,7 @@ class ORMOperation(ORMAbstractSenderBankAccount, ORMAbstractRecipientBankAccount
         null=True,
     )
     sender_amount = fields.DecimalField(
-        max_digits=9,
+        max_digits=18,
         decimal_places=2,
         null=True,
     )
@@ -38,22 +85,31 @@ class ORMOperation(ORMAbstractSenderBankAccount, ORMAbstractRecipientBankAccount
         null=True,
     )
     recipient_amount = fields.DecimalField(
-        max_digits=9,
+        max_digits=18,
         decimal_places=2,
         null=True,
     )
 
+    batch = fields.ForeignKeyField(
+        "models.ORMOperationBatch",
+        related_name="operations",
+        null=True,
+        on_delete=fields.SET_NULL,
+    )
+
     status = fields.CharField(max_length=16)
+    lease_expiry_date = fields.DatetimeField(null=True)
     our_fee = fields.DecimalField(
-        max_digits=9,
+        max_digits=18,
         decimal_places=2,
         null=True,
     )
     provider_fee = fields.DecimalField(
-        max_digits=9,
+        max_digits=18,
         decimal_places=2,
         null=True,
     )
 
     class Meta:
+        indexes = (("operation_recipient_user", "operation_owner_company", "created_date", "id"),)
         pydantic_cls = Operation
@@ -0,0 +1,21 @@
+from tortoise import fields
+
+from domain.models.outbox import OutboxMessage
+
+from .generic import ORMAbstractModel
+
+
+class ORMOutboxMessage(ORMAbstractModel):
+    channel = fields.CharField(max_length=16)
+    recipient = fields.CharField(max_length=255)
+    subject = fields.CharField(max_length=255, null=True)
+    body = fields.TextField()
+
+    attempts = fields.IntField(default=0)
+    next_attempt_date = fields.DatetimeField()
+    sent_date = fields.DatetimeField(null=True)
+    failed_date = fields.DatetimeField(null=True)
+    error = fields.TextField(null=True)
+
+    class Meta:
+        pydantic_cls = OutboxMessage
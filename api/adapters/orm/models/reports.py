@@ -0,0 +1,36 @@
+from tortoise import fields
+
+from domain.models.reports import PaymentSummary
+
+from .generic import ORMAbstractModel
+
+
+class ORMPaymentSummary(ORMAbstractModel):
+    company = fields.ForeignKeyField(
+        "models.ORMCompany",
+        related_name="payment_summaries",
+    )
+    contractor = fields.ForeignKeyField(
+        "models.ORMUser",
+        related_name="payment_summaries",
+    )
+
+    month = fields.DateField()
+    currency = fields.CharField(max_length=3)
+    amount = fields.DecimalField(
+        max_digits=20,
+        decimal_places=2,
+        default=0,
+    )
+    fees = fields.DecimalField(
+        max_digits=20,
+        decimal_places=2,
+        default=0,
+    )
+    operations_count = fields.IntField(default=0)
+    invoices_count = fields.IntField(default=0)
+
+    class Meta:
+        # reports read a range of months of one company, completed operations are added by this key
+        unique_together = (("company", "month", "contractor", "currency"),)
+        pydantic_cls = PaymentSummary
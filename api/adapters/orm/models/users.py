@@ -17,18 +17,19 @@ class ChoiceField(fields.CharField):
 
 
 class ORMUser(ORMAbstractModel):
-    email = fields.CharField(max_length=255)
+    email = fields.CharField(max_length=255, unique=True)
     role = ChoiceField(max_length=16, choices=TRole)
 
-    phone = fields.CharField(max_length=255, null=True)
+    phone = fields.CharField(max_length=255, null=True, unique=True)
     first_name = fields.CharField(max_length=255, null=True)
     last_name = fields.CharField(max_length=255, null=True)
     password = fields.CharField(max_length=255, null=True)
     last_login = fields.DatetimeField(null=True)
 
-    phone_code = fields.CharField(max_length=8, null=True)
-    email_code = fields.CharField(max_length=255, null=True)
-    password_code = fields.CharField(max_length=255, null=True)
+    # lookup indexes are partial (WHERE ... IS NOT NULL) in the migrations
+    phone_code = fields.CharField(max_length=8, null=True, index=True)
+    email_code = fields.CharField(max_length=255, null=True, unique=True)
+    password_code = fields.CharField(max_length=255, null=True, unique=True)
 
     is_phone_verified = fields.BooleanField(default=False)
     is_email_verified = fields.BooleanField(default=False)
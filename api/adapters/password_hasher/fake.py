@@ -0,0 +1,23 @@
+import hashlib
+import time
+
+from .generic import PASSWORD_HASH_ALGORITHM, PASSWORD_HASH_ITERATIONS, AbstractPasswordHasher, PasswordHasherMetrics
+
+
+class FakePasswordHasher(AbstractPasswordHasher):
+    """Hashes right on the event loop, use it only for tests and benchmarks."""
+
+    def __init__(self, iterations: int = PASSWORD_HASH_ITERATIONS) -> None:
+        self.iterations = iterations
+        self.metrics = PasswordHasherMetrics()
+
+    async def hash(self, password: str, salt: bytes) -> bytes:
+        self.metrics.submitted += 1
+        started_at = time.perf_counter()
+        password_hash = hashlib.pbkdf2_hmac(PASSWORD_HASH_ALGORITHM, password.encode("utf-8"), salt, self.iterations)
+        self.metrics.completed += 1
+        self.metrics.total_seconds += time.perf_counter() - started_at
+        return password_hash
+
+    async def close(self) -> None:
+        pass
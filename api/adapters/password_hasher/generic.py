@@ -0,0 +1,34 @@
+import abc
+
+from pydantic import BaseModel
+
+PASSWORD_HASH_ALGORITHM = "sha256"
+PASSWORD_HASH_ITERATIONS = 10000
+
+
+class PasswordHasherMetrics(BaseModel):
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    waited: int = 0  # calls which had to wait for a free slot in the queue
+    in_flight: int = 0
+    max_in_flight: int = 0
+    total_seconds: float = 0.0
+
+    @property
+    def avg_seconds(self) -> float:
+        if not self.completed:
+            return 0.0
+        return self.total_seconds / self.completed
+
+
+class AbstractPasswordHasher(abc.ABC):
+    metrics: PasswordHasherMetrics
+
+    @abc.abstractmethod
+    async def hash(self, password: str, salt: bytes) -> bytes:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def close(self) -> None:
+        raise NotImplementedError
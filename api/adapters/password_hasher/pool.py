@@ -0,0 +1,85 @@
+import asyncio
+import hashlib
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+from settings import PASSWORD_HASHER_EXECUTOR, PASSWORD_HASHER_MAX_QUEUE_SIZE, PASSWORD_HASHER_MAX_WORKERS
+
+from .generic import PASSWORD_HASH_ALGORITHM, PASSWORD_HASH_ITERATIONS, AbstractPasswordHasher, PasswordHasherMetrics
+
+EXECUTORS = {
+    "thread": ThreadPoolExecutor,
+    "process": ProcessPoolExecutor,
+}
+
+
+class PoolPasswordHasher(AbstractPasswordHasher):
+    """Runs PBKDF2 in a thread/process pool so the event loop is never blocked.
+
+    At most ``max_queue_size`` hashes are submitted to the pool at the same time,
+    the rest of the callers wait for a free slot (backpressure).
+    """
+
+    def __init__(
+        self,
+        executor: str = PASSWORD_HASHER_EXECUTOR,
+        max_workers: Optional[int] = PASSWORD_HASHER_MAX_WORKERS,
+        max_queue_size: int = PASSWORD_HASHER_MAX_QUEUE_SIZE,
+        iterations: int = PASSWORD_HASH_ITERATIONS,
+    ) -> None:
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unsupported executor {executor}, use one of {list(EXECUTORS)}")
+        self.executor = executor
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.iterations = iterations
+        self.metrics = PasswordHasherMetrics()
+        self._executor: Optional[Executor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_executor(self) -> Executor:
+        if not self._executor:
+            self._executor = EXECUTORS[self.executor](max_workers=self.max_workers)
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # semaphore is bound to the loop it is used in first
+        loop = asyncio.get_running_loop()
+        if not self._semaphore or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_queue_size)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def hash(self, password: str, salt: bytes) -> bytes:
+        semaphore = self._get_semaphore()
+        self.metrics.submitted += 1
+        if semaphore.locked():
+            self.metrics.waited += 1
+        async with semaphore:
+            self.metrics.in_flight += 1
+            self.metrics.max_in_flight = max(self.metrics.max_in_flight, self.metrics.in_flight)
+            started_at = time.perf_counter()
+            try:
+                password_hash = await asyncio.get_running_loop().run_in_executor(
+                    self._get_executor(),
+                    hashlib.pbkdf2_hmac,
+                    PASSWORD_HASH_ALGORITHM,
+                    password.encode("utf-8"),
+                    salt,
+                    self.iterations,
+                )
+            except Exception:
+                self.metrics.failed += 1
+                raise
+            finally:
+                self.metrics.in_flight -= 1
+            self.metrics.completed += 1
+            self.metrics.total_seconds += time.perf_counter() - started_at
+        return password_hash
+
+    async def close(self) -> None:
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -0,0 +1,45 @@
+import asyncio
+import random
+from typing import Dict
+
+from domain.models.operations import Operation
+from domain.types import TOperationStatus, TPrimaryKey
+
+from .generic import AbstractPaymentProvider
+
+# every status check moves a payment one step further
+NEXT_STATUS = {
+    TOperationStatus.IN_PROGRESS: TOperationStatus.ACCEPTED,
+    TOperationStatus.ACCEPTED: TOperationStatus.COMPLETED,
+}
+
+
+class FakePaymentProvider(AbstractPaymentProvider):
+    """Local stand-in for the payment provider with its latency and rejection rate."""
+
+    def __init__(self, latency: float = 0.0, rejection_rate: float = 0.0) -> None:
+        self.latency = latency
+        self.rejection_rate = rejection_rate
+        self._payments: Dict[TPrimaryKey, TOperationStatus] = {}
+
+    async def clean(self) -> None:
+        self._payments = {}
+
+    async def create_payment(self, operation: Operation) -> TOperationStatus:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if operation.id in self._payments:
+            return self._payments[operation.id]
+        if random.random() < self.rejection_rate:
+            status = TOperationStatus.REJECTED
+        else:
+            status = TOperationStatus.IN_PROGRESS
+        self._payments[operation.id] = status
+        return status
+
+    async def get_payment_status(self, operation: Operation) -> TOperationStatus:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        status = self._payments.get(operation.id, operation.status)
+        status = self._payments[operation.id] = NEXT_STATUS.get(status, status)
+        return status
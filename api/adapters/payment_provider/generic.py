@@ -0,0 +1,20 @@
+import abc
+
+from domain.models.operations import Operation
+from domain.types import TOperationStatus
+
+
+class AbstractPaymentProvider(abc.ABC):
+    @abc.abstractmethod
+    async def clean(self) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def create_payment(self, operation: Operation) -> TOperationStatus:
+        # submits a NEW operation, IN_PROGRESS if the provider took it; idempotent on operation.id,
+        # a resubmitted operation isn't paid twice and gets the status of its payment
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def get_payment_status(self, operation: Operation) -> TOperationStatus:
+        raise NotImplementedError
@@ -0,0 +1,23 @@
+import abc
+from typing import Optional
+
+from domain.models.principals import Principal
+from domain.types import TPrimaryKey
+
+
+class AbstractPrincipalCache(abc.ABC):
+    @abc.abstractmethod
+    async def clean(self) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def get(self, user_id: TPrimaryKey) -> Optional[Principal]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def set(self, principal: Principal) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def invalidate(self, user_id: TPrimaryKey) -> None:
+        raise NotImplementedError
@@ -0,0 +1,45 @@
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from domain.models.principals import Principal
+from domain.types import TPrimaryKey
+from settings import PRINCIPAL_CACHE_MAX_SIZE, PRINCIPAL_CACHE_TTL
+
+from .generic import AbstractPrincipalCache
+
+
+class InMemoryPrincipalCache(AbstractPrincipalCache):
+    """Process local TTL + LRU cache, every worker has its own copy."""
+
+    def __init__(self, ttl: int = PRINCIPAL_CACHE_TTL, max_size: int = PRINCIPAL_CACHE_MAX_SIZE) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._principals: "OrderedDict[TPrimaryKey, Tuple[float, Principal]]" = OrderedDict()
+
+    async def clean(self) -> None:
+        self._principals = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, user_id: TPrimaryKey) -> Optional[Principal]:
+        cached = self._principals.get(user_id)
+        if not cached or cached[0] < time.monotonic():
+            if cached:
+                del self._principals[user_id]
+            self.misses += 1
+            return None
+        self._principals.move_to_end(user_id)
+        self.hits += 1
+        return cached[1]
+
+    async def set(self, principal: Principal) -> None:
+        self._principals[principal.id] = (time.monotonic() + self.ttl, principal)
+        self._principals.move_to_end(principal.id)
+        while len(self._principals) > self.max_size:
+            self._principals.popitem(last=False)
+
+    async def invalidate(self, user_id: TPrimaryKey) -> None:
+        self._principals.pop(user_id, None)
@@ -0,0 +1,42 @@
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Optional, Tuple
+
+from domain.models.pricing import RateSnapshot
+from domain.types import TCurrency
+
+from .generic import AbstractRateTable
+
+RATES = {
+    (TCurrency.USD, TCurrency.EUR): Decimal("0.9200"),
+    (TCurrency.USD, TCurrency.GBR): Decimal("0.7900"),
+    (TCurrency.USD, TCurrency.RUB): Decimal("92.5000"),
+    (TCurrency.EUR, TCurrency.USD): Decimal("1.0870"),
+    (TCurrency.EUR, TCurrency.GBR): Decimal("0.8590"),
+    (TCurrency.EUR, TCurrency.RUB): Decimal("100.5500"),
+    (TCurrency.GBR, TCurrency.USD): Decimal("1.2660"),
+    (TCurrency.GBR, TCurrency.EUR): Decimal("1.1640"),
+    (TCurrency.GBR, TCurrency.RUB): Decimal("117.1000"),
+    (TCurrency.RUB, TCurrency.USD): Decimal("0.0108"),
+    (TCurrency.RUB, TCurrency.EUR): Decimal("0.0099"),
+    (TCurrency.RUB, TCurrency.GBR): Decimal("0.0085"),
+}
+
+
+class FakeRateTable(AbstractRateTable):
+    """Static rates with the latency of a rate provider."""
+
+    def __init__(self, rates: Optional[Dict[Tuple[TCurrency, TCurrency], Decimal]] = None, latency: float = 0.0):
+        self.rates = RATES if rates is None else rates
+        self.latency = latency
+        self.requests = 0
+
+    async def clean(self) -> None:
+        self.requests = 0
+
+    async def get_snapshot(self) -> RateSnapshot:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self.requests += 1
+        return RateSnapshot(created_date=datetime.utcnow(), rates=self.rates)
@@ -0,0 +1,14 @@
+import abc
+
+from domain.models.pricing import RateSnapshot
+
+
+class AbstractRateTable(abc.ABC):
+    @abc.abstractmethod
+    async def clean(self) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def get_snapshot(self) -> RateSnapshot:
+        # all rates at one moment, operations of a batch are priced with the same snapshot
+        raise NotImplementedError
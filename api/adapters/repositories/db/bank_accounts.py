@@ -2,12 +2,25 @@ from typing import List, Optional
 
 from adapters.orm.models.bank_accounts import ORMRecipientBankAccount, ORMSenderBankAccount
 from domain.models.bank_accounts import RecipientBankAccount, SenderBankAccount
+from settings import DEFAULT_LIMIT
 
 from .generic import AbstractDBRepository
 
 
 class SenderBankAccountDBRepository(AbstractDBRepository):
     orm_model_cls: type[ORMSenderBankAccount] = ORMSenderBankAccount
+    sortable_fields = ("created_date", "updated_date", "sender_currency", "sender_country_alpha3")
+
+    async def list(
+        self,
+        search: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        offset: Optional[int] = 0,
+        limit: Optional[int] = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
+        **kwargs,
+    ) -> List[SenderBankAccount]:
+        return await super().list(search=search, sort_by=sort_by, offset=offset, limit=limit, cursor=cursor, **kwargs)
 
     async def all(self) -> List[SenderBankAccount]:
         return await super().all()
@@ -27,6 +40,18 @@ class SenderBankAccountDBRepository(AbstractDBRepository):
 
 class RecipientBankAccountDBRepository(AbstractDBRepository):
     orm_model_cls: type[ORMRecipientBankAccount] = ORMRecipientBankAccount
+    sortable_fields = ("created_date", "updated_date", "recipient_currency", "recipient_country_alpha3")
+
+    async def list(
+        self,
+        search: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        offset: Optional[int] = 0,
+        limit: Optional[int] = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
+        **kwargs,
+    ) -> List[RecipientBankAccount]:
+        return await super().list(search=search, sort_by=sort_by, offset=offset, limit=limit, cursor=cursor, **kwargs)
 
     async def all(self) -> List[RecipientBankAccount]:
         return await super().all()
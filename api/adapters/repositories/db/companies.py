@@ -1,4 +1,6 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
+
+from tortoise.exceptions import BaseORMException as ORMBaseException
 
 from adapters.orm.models.companies import (
     ORMCompany,
@@ -6,14 +8,25 @@ from adapters.orm.models.companies import (
     ORMCompanyM2MEmployer,
     ORMInviteUserToCompany,
 )
-from domain.models.companies import Company, CompanyM2MContractor, CompanyM2MEmployer, InviteUserToCompany
+from adapters.orm.models.users import ORMUser
+from domain.models.companies import (
+    Company,
+    CompanyM2MContractor,
+    CompanyM2MEmployer,
+    InvitationPreconditions,
+    InviteUserToCompany,
+)
+from domain.types import TEmail, TPrimaryKey
 from settings import DEFAULT_LIMIT
 
+from ..exceptions import RepositoryException
 from .generic import AbstractDBRepository
 
 
 class CompanyDBRepository(AbstractDBRepository):
     orm_model_cls: type[ORMCompany] = ORMCompany
+    sortable_fields = ("name", "created_date", "updated_date")
+    searchable_fields = ("name",)
 
     async def list(
         self,
@@ -21,9 +34,51 @@ class CompanyDBRepository(AbstractDBRepository):
         sort_by: Optional[str] = None,
         offset: Optional[int] = 0,
         limit: Optional[int] = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
+        **kwargs,
+    ) -> List[Company]:
+        return await super().list(search=search, sort_by=sort_by, offset=offset, limit=limit, cursor=cursor, **kwargs)
+
+    async def list_for_contractor(
+        self,
+        contractor_id: TPrimaryKey,
+        search: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        offset: Optional[int] = 0,
+        limit: Optional[int] = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
+        **kwargs,
+    ) -> List[Company]:
+        # membership join, filtered and paginated by the DB
+        return await self.list(
+            search=search,
+            sort_by=sort_by,
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            **kwargs,
+            companies_m2m_contractors__contractor_id=contractor_id,
+        )
+
+    async def list_for_employer(
+        self,
+        employer_id: TPrimaryKey,
+        search: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        offset: Optional[int] = 0,
+        limit: Optional[int] = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
         **kwargs,
     ) -> List[Company]:
-        return await super().list(search=search, sort_by=sort_by, offset=offset, limit=limit, **kwargs)
+        return await self.list(
+            search=search,
+            sort_by=sort_by,
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            **kwargs,
+            companies_m2m_employers__employer_id=employer_id,
+        )
 
     async def all(self) -> List[Company]:
         return await super().all()
@@ -82,6 +137,35 @@ class CompanyM2MEmployerDBRepository(AbstractDBRepository):
 class InviteUserToCompanyDBRepository(AbstractDBRepository):
     orm_model_cls = ORMInviteUserToCompany
 
+    async def get_preconditions(self, company_id: TPrimaryKey, email: TEmail) -> InvitationPreconditions:
+        # every check of a new invitation in one statement, the invitee may not exist yet
+        sql = f"""SELECT
+            EXISTS (SELECT 1 FROM "{ORMCompany._meta.db_table}" WHERE "id" = $1) AS "company_exists",
+            EXISTS (
+                SELECT 1 FROM "{ORMInviteUserToCompany._meta.db_table}" WHERE "company_id" = $1 AND "email" = $2
+            ) AS "invitation_exists",
+            u."id" AS "user_id",
+            u."role" AS "user_role",
+            (
+                EXISTS (
+                    SELECT 1 FROM "{ORMCompanyM2MEmployer._meta.db_table}"
+                    WHERE "company_id" = $1 AND "employer_id" = u."id"
+                )
+                OR EXISTS (
+                    SELECT 1 FROM "{ORMCompanyM2MContractor._meta.db_table}"
+                    WHERE "company_id" = $1 AND "contractor_id" = u."id"
+                )
+            ) AS "user_in_company"
+        FROM (SELECT 1) AS one
+        LEFT JOIN "{ORMUser._meta.db_table}" AS u ON u."email" = $2
+        """
+        db = self.orm_model_cls._choose_db(True)
+        try:
+            _, [row] = await db.execute_query(sql, [str(company_id), email])
+        except ORMBaseException as e:
+            raise RepositoryException(detail=str(e))
+        return InvitationPreconditions(**dict(row))
+
     async def all(self) -> List[InviteUserToCompany]:
         return await super().all()
 
@@ -96,3 +180,17 @@ class InviteUserToCompanyDBRepository(AbstractDBRepository):
 
     async def add(self, obj: InviteUserToCompany) -> None:
         return await super().add(obj)
+
+    async def get_or_create(
+        self, obj: InviteUserToCompany, conflict_fields: Sequence[str]
+    ) -> Tuple[InviteUserToCompany, bool]:
+        return await super().get_or_create(obj, conflict_fields)
+
+    async def upsert(
+        self,
+        obj: InviteUserToCompany,
+        conflict_fields: Sequence[str],
+        update_fields: Sequence[str],
+        **kwargs,
+    ) -> Optional[InviteUserToCompany]:
+        return await super().upsert(obj, conflict_fields, update_fields, **kwargs)
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from pydantic.main import BaseModel
 from pydantic.types import UUID4
@@ -6,16 +6,22 @@ from tortoise.exceptions import BaseORMException as ORMBaseException
 from tortoise.exceptions import DoesNotExist as ORMDoesNotExist
 from tortoise.exceptions import MultipleObjectsReturned as ORMMultipleObjectsReturned
 from tortoise.models import Model as ORMModel
+from tortoise.query_utils import Q
+from tortoise.queryset import QuerySet
 
-from settings import DEFAULT_LIMIT
+from settings import BULK_BATCH_SIZE, DEFAULT_LIMIT
 
-from ..exceptions import MultipleObjectsReturned, ObjectDoesNotExist, RepositoryException
+from ..exceptions import InvalidQueryParameter, MultipleObjectsReturned, ObjectDoesNotExist, RepositoryException
 from ..generic import AbstractRepository
 from ..session.generic import AbstractSession
 
 
 class AbstractDBRepository(AbstractRepository):
     orm_model_cls: type[ORMModel] = None
+    # pydantic prefetch field -> ORM relation, when the names differ
+    orm_relations: Dict[str, str] = {}
+    # run full pydantic validation on rows read from the DB instead of trusted construction
+    validate_reads: bool = False
 
     def __init__(self, session: AbstractSession) -> None:
         self.session = session
@@ -28,9 +34,145 @@ class AbstractDBRepository(AbstractRepository):
         except ORMBaseException as e:
             raise RepositoryException(detail=str(e))
 
-    async def get(self, **kwargs) -> BaseModel:
+    def get_insert_query(self, db: Any, obj: BaseModel, conflict_fields: Sequence[str]) -> Tuple[Any, list]:
+        # INSERT ... ON CONFLICT builder with the values of obj, the unique index on conflict_fields must exist
+        meta = self.orm_model_cls._meta
+        executor = db.executor_class(model=self.orm_model_cls, db=db)
+        db_obj = self.orm_model_cls()
+        db_obj.from_pydantic(obj)
+        columns = executor.regular_columns_all
+        values = [executor.column_map[f](getattr(db_obj, f), db_obj) for f in columns]
+        query = (
+            db.query_class.into(meta.basetable)
+            .columns(*[meta.fields_db_projection[f] for f in columns])
+            .insert(*[executor.parameter(i) for i in range(len(columns))])
+            .on_conflict(*[meta.fields_db_projection[f] for f in conflict_fields])
+        )
+        return query, values
+
+    def get_where(self, db: Any, position: int, **kwargs) -> Tuple[Any, list]:
+        # equality criterion on the table columns, parameters are numbered from position
+        meta = self.orm_model_cls._meta
+        executor = db.executor_class(model=self.orm_model_cls, db=db)
+        criterion, values = None, []
+        for i, (name, value) in enumerate(kwargs.items()):
+            field = meta.fields_map[name]
+            term = meta.basetable[meta.fields_db_projection[name]] == executor.parameter(position + i)
+            criterion = term if criterion is None else criterion & term
+            values.append(field.to_db_value(value, None))
+        return criterion, values
+
+    def from_rows(self, rows: list) -> List[BaseModel]:
+        return [self.to_pydantic(self.orm_model_cls._init_from_db(**dict(row))) for row in rows]
+
+    async def get_or_create(self, obj: BaseModel, conflict_fields: Sequence[str]) -> Tuple[BaseModel, bool]:
+        db = self.orm_model_cls._choose_db(True)
+        lookup = {f: getattr(obj, f) for f in conflict_fields}
+        query, values = self.get_insert_query(db, obj, conflict_fields)
+        criterion, where_values = self.get_where(db, len(values), **lookup)
+        select = db.query_class.from_(self.orm_model_cls._meta.basetable).select("*").where(criterion)
+        # the existing row is returned by the same statement when nothing is inserted
+        sql = f"WITH inserted AS ({query.do_nothing().returning('*')}) SELECT * FROM inserted UNION ALL {select}"
+        try:
+            _, rows = await db.execute_query(sql, values + where_values)
+            if not rows:
+                # inserted concurrently after the statement snapshot was taken
+                return await self.get(**lookup), False
+        except ORMBaseException as e:
+            raise RepositoryException(detail=str(e))
+        [stored] = self.from_rows(rows)
+        return stored, stored.id == obj.id
+
+    async def upsert(
+        self,
+        obj: BaseModel,
+        conflict_fields: Sequence[str],
+        update_fields: Sequence[str],
+        **kwargs,
+    ) -> Optional[BaseModel]:
+        db = self.orm_model_cls._choose_db(True)
+        query, values = self.get_insert_query(db, obj, conflict_fields)
+        meta = self.orm_model_cls._meta
+        for name in update_fields:
+            query = query.do_update(meta.fields_db_projection[name])
+        if kwargs:
+            criterion, where_values = self.get_where(db, len(values), **kwargs)
+            query = query.where(criterion)
+            values += where_values
+        try:
+            _, rows = await db.execute_query(str(query.returning("*")), values)
+        except ORMBaseException as e:
+            raise RepositoryException(detail=str(e))
+        if not rows:
+            return None
+        [stored] = self.from_rows(rows)
+        return stored
+
+    async def add_many(self, objs: List[BaseModel]) -> None:
+        if not objs:
+            return
+        db_objs = []
+        for obj in objs:
+            db_obj = self.orm_model_cls()
+            db_obj.from_pydantic(obj)
+            db_objs.append(db_obj)
+        try:
+            await self.orm_model_cls.bulk_create(db_objs, batch_size=BULK_BATCH_SIZE)
+        except ORMBaseException as e:
+            raise RepositoryException(detail=str(e))
+
+    def get_fields(self, fields: Optional[Sequence[str]], required: Sequence[str] = ("id",)) -> Optional[List[str]]:
+        fields = super().get_fields(fields, required)
+        for field in fields or ():
+            if field not in self.orm_model_cls._meta.fields_db_projection:
+                raise InvalidQueryParameter(detail=f"Unknown field {field} for {self.__class__.__name__}")
+        return fields
+
+    def get_queryset(self, fields: Optional[List[str]], prefetch: List[str], **kwargs) -> QuerySet:
+        if fields and prefetch:
+            raise InvalidQueryParameter(detail="fields can't be combined with prefetch")
+        queryset = self.prefetch_queryset(self.orm_model_cls.filter(**kwargs), prefetch)
+        if fields:
+            queryset = queryset.only(*fields)
+        return queryset
+
+    def prefetch_queryset(self, queryset: QuerySet, prefetch: List[str]) -> QuerySet:
+        meta = self.orm_model_cls._meta
+        for field in prefetch:
+            relation = self.orm_relations.get(field, field)
+            if relation in meta.fk_fields or relation in meta.o2o_fields:
+                # joined into the same query
+                queryset = queryset.select_related(relation)
+            else:
+                # one extra query for all the objects
+                queryset = queryset.prefetch_related(relation)
+        return queryset
+
+    def to_pydantic(self, db_obj: ORMModel, prefetch: Sequence[str] = ()) -> BaseModel:
+        obj = db_obj.to_pydantic(validate=self.validate_reads)
+        for field in prefetch:
+            related = getattr(db_obj, self.orm_relations.get(field, field))
+            if isinstance(related, ORMModel):
+                related = related.to_pydantic(validate=self.validate_reads)
+            elif related is not None:
+                related = [o.to_pydantic(validate=self.validate_reads) for o in related]
+            setattr(obj, field, related)
+        return obj
+
+    async def get(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        prefetch: Optional[Sequence[str]] = None,
+        lock: bool = False,
+        **kwargs,
+    ) -> BaseModel:
+        prefetch = self.get_prefetch(prefetch)
+        queryset = self.get_queryset(self.get_fields(fields), prefetch, **kwargs)
+        if lock:
+            # the row is locked until the uow is committed
+            queryset = queryset.select_for_update()
         try:
-            db_obj = await self.orm_model_cls.get(**kwargs)
+            db_obj = await queryset.get()
         except ORMDoesNotExist:
             raise ObjectDoesNotExist(detail=f"{self.__class__.__name__} object associated with {kwargs} doesn't exist.")
         except ORMMultipleObjectsReturned:
@@ -39,7 +181,7 @@ class AbstractDBRepository(AbstractRepository):
             )
         except ORMBaseException as e:
             raise RepositoryException(detail=str(e))
-        return db_obj.to_pydantic()
+        return self.to_pydantic(db_obj, prefetch)
 
     async def list(
         self,
@@ -47,27 +189,51 @@ class AbstractDBRepository(AbstractRepository):
         sort_by: Optional[str] = None,
         offset: Optional[int] = 0,
         limit: Optional[int] = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        prefetch: Optional[Sequence[str]] = None,
         **kwargs,
     ) -> List[BaseModel]:
+        prefetch = self.get_prefetch(prefetch)
+        # created_date is needed for the next cursor
+        queryset = self.get_queryset(self.get_fields(fields, required=("id", "created_date")), prefetch, **kwargs)
+        keyset = self.get_cursor(cursor, sort_by)
+        if keyset:
+            # rows strictly after (created_date, id) in the descending default ordering
+            created_date, pk = keyset
+            queryset = queryset.filter(Q(created_date__lt=created_date) | Q(created_date=created_date, id__lt=pk))
+            offset = 0
+        search = self.get_search(search)
+        if search:
+            queryset = queryset.filter(
+                Q(*[Q(**{f"{field}__icontains": search}) for field in self.searchable_fields], join_type=Q.OR)
+            )
+            if any("__" in field for field in self.searchable_fields):
+                # search by related objects may produce duplicates
+                queryset = queryset.distinct()
+        queryset = queryset.order_by(*self.get_ordering(sort_by))
         try:
-            db_objs = await self.orm_model_cls.filter(**kwargs).offset(offset).limit(limit)
+            db_objs = await queryset.offset(offset).limit(limit)
         except ORMBaseException as e:
             raise RepositoryException(detail=str(e))
-        objs = [db_obj.to_pydantic() for db_obj in db_objs]
+        objs = [self.to_pydantic(db_obj, prefetch) for db_obj in db_objs]
         return objs
 
-    async def filter(self, **kwargs) -> List[BaseModel]:
+    async def filter(self, fields: Optional[Sequence[str]] = None, **kwargs) -> List[BaseModel]:
         try:
-            db_objs = await self.orm_model_cls.filter(**kwargs)
+            db_objs = await self.get_queryset(self.get_fields(fields), [], **kwargs)
         except ORMBaseException as e:
             raise RepositoryException(detail=str(e))
-        return [db_obj.to_pydantic() for db_obj in db_objs]
+        return [self.to_pydantic(db_obj) for db_obj in db_objs]
 
-    async def first(self, **kwargs) -> Optional[BaseModel]:
+    async def first(self, fields: Optional[Sequence[str]] = None, lock: bool = False, **kwargs) -> Optional[BaseModel]:
+        queryset = self.get_queryset(self.get_fields(fields), [], **kwargs)
+        if lock:
+            queryset = queryset.select_for_update()
         try:
-            db_obj = await self.orm_model_cls.filter(**kwargs).first()
+            db_obj = await queryset.first()
             if db_obj:
-                return db_obj.to_pydantic()
+                return self.to_pydantic(db_obj)
         except ORMBaseException as e:
             raise RepositoryException(detail=str(e))
 
@@ -88,14 +254,63 @@ class AbstractDBRepository(AbstractRepository):
             db_objs = await self.orm_model_cls.all()
         except ORMBaseException as e:
             raise RepositoryException(detail=str(e))
-        return [db_obj.to_pydantic() for db_obj in db_objs]
+        return [self.to_pydantic(db_obj) for db_obj in db_objs]
 
     async def update(self, obj: BaseModel) -> None:
+        changed_fields = getattr(obj, "changed_fields", None)
+        update_fields = None
+        if changed_fields is not None:
+            # objects read from the DB only write the columns assigned since
+            meta = self.orm_model_cls._meta
+            update_fields = [f for f in meta.fields_db_projection if f in changed_fields and not meta.fields_map[f].pk]
+            if not update_fields:
+                return
         try:
             db_obj = self.orm_model_cls()
             db_obj.from_pydantic(obj)
             db_obj._saved_in_db = True
-            await db_obj.save()
+            await db_obj.save(update_fields=update_fields)
+        except ORMBaseException as e:
+            raise RepositoryException(detail=str(e))
+        if changed_fields is not None:
+            obj.track_changes()
+
+    async def update_many(self, objs: List[BaseModel], fields: Optional[List[str]] = None) -> None:
+        if not objs:
+            return
+        meta = self.orm_model_cls._meta
+        fields = [f for f in (fields or meta.fields_db_projection.keys()) if not meta.fields_map[f].pk]
+        db = self.orm_model_cls._choose_db(True)
+        executor = db.executor_class(model=self.orm_model_cls, db=db)
+        # one prepared UPDATE executed for the whole batch, types are inferred from the columns
+        sql = executor.get_update_sql(fields, None)
+        values = []
+        for obj in objs:
+            db_obj = self.orm_model_cls()
+            db_obj.from_pydantic(obj)
+            values.append(
+                [executor.column_map[f](getattr(db_obj, f), db_obj) for f in fields]
+                + [meta.pk.to_db_value(db_obj.pk, db_obj)]
+            )
+        try:
+            for i in range(0, len(values), BULK_BATCH_SIZE):
+                await db.execute_many(sql, values[i : i + BULK_BATCH_SIZE])  # noqa
+        except ORMBaseException as e:
+            raise RepositoryException(detail=str(e))
+
+    async def delete_many(self, pks: List[UUID4]) -> None:
+        if not pks:
+            return
+        try:
+            await self.orm_model_cls.filter(pk__in=pks).delete()
+        except ORMBaseException as e:
+            raise RepositoryException(detail=str(e))
+
+    async def delete_where(self, **kwargs) -> int:
+        if not kwargs:
+            raise RepositoryException(detail="delete_where requires filters")
+        try:
+            return await self.orm_model_cls.filter(**kwargs).delete()
         except ORMBaseException as e:
             raise RepositoryException(detail=str(e))
 
@@ -1,14 +1,24 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
 
+from tortoise.exceptions import BaseORMException as ORMBaseException
+
+from adapters.orm.models.bank_accounts import ORMRecipientBankAccount, ORMSenderBankAccount
 from adapters.orm.models.invoices import ORMInvoice, ORMInvoiceItem
-from domain.models.invoices import Invoice, InvoiceItem
+from domain.models.invoices import Invoice, InvoiceItem, InvoicePayment
+from domain.types import TPrimaryKey
 from settings import DEFAULT_LIMIT
 
+from ..exceptions import RepositoryException
 from .generic import AbstractDBRepository
 
 
 class InvoicesDBRepository(AbstractDBRepository):
     orm_model_cls: type[ORMInvoice] = ORMInvoice
+    sortable_fields = ("created_date", "updated_date")
+    searchable_fields = ("invoice_items__descripion",)
+    prefetch_fields = ("items", "recipient_account")
+    orm_relations = {"items": "invoice_items"}
 
     async def list(
         self,
@@ -16,9 +26,75 @@ class InvoicesDBRepository(AbstractDBRepository):
         sort_by: Optional[str] = None,
         offset: Optional[int] = 0,
         limit: Optional[int] = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
         **kwargs,
     ) -> List[Invoice]:
-        return await super().list(search=search, sort_by=sort_by, offset=offset, limit=limit, **kwargs)
+        return await super().list(search=search, sort_by=sort_by, offset=offset, limit=limit, cursor=cursor, **kwargs)
+
+    async def get_payments(
+        self,
+        invoice_ids: Sequence[TPrimaryKey],
+        company_id: TPrimaryKey,
+        sender_account_id: Optional[TPrimaryKey] = None,
+        lock: bool = False,
+    ) -> List[InvoicePayment]:
+        # invoices of the company with their amounts and accounts in one statement,
+        # sender_account_id is used for invoices without a sender account
+        sql = f"""SELECT
+            i."id" AS "invoice_id",
+            i."created_by_id",
+            i."operation_id",
+            i."total_amount" AS "amount",
+            i."recipient_account_id",
+            r."recipient_bank_account_type",
+            r."recipient_currency",
+            r."recipient_country_alpha3",
+            s."id" AS "sender_account_id",
+            s."sender_owner_company_id",
+            s."sender_bank_account_type",
+            s."sender_currency",
+            s."sender_country_alpha3"
+        FROM "{ORMInvoice._meta.db_table}" AS i
+        JOIN "{ORMRecipientBankAccount._meta.db_table}" AS r ON r."id" = i."recipient_account_id"
+        LEFT JOIN "{ORMSenderBankAccount._meta.db_table}" AS s ON s."id" = COALESCE(i."sender_account_id", $3::uuid)
+        WHERE i."id" = ANY($1::uuid[]) AND i."for_company_id" = $2
+        """
+        if lock:
+            # concurrent payments of the same invoices wait for this transaction
+            sql += "FOR UPDATE OF i"
+        values = [
+            [str(pk) for pk in invoice_ids],
+            str(company_id),
+            str(sender_account_id) if sender_account_id else None,
+        ]
+        db = self.orm_model_cls._choose_db(True)
+        try:
+            _, rows = await db.execute_query(sql, values)
+        except ORMBaseException as e:
+            raise RepositoryException(detail=str(e))
+        return [InvoicePayment(**dict(row)) for row in rows]
+
+    async def link_operations(
+        self,
+        links: Sequence[Tuple[TPrimaryKey, TPrimaryKey, TPrimaryKey]],
+        updated_date: datetime,
+    ) -> int:
+        # (invoice_id, operation_id, sender_account_id) for the whole batch in one UPDATE,
+        # invoices which were paid in the meantime are left as they are
+        if not links:
+            return 0
+        sql = f"""UPDATE "{ORMInvoice._meta.db_table}" AS i
+        SET "operation_id" = l."operation_id", "sender_account_id" = l."sender_account_id", "updated_date" = $4
+        FROM unnest($1::uuid[], $2::uuid[], $3::uuid[]) AS l("id", "operation_id", "sender_account_id")
+        WHERE i."id" = l."id" AND i."operation_id" IS NULL
+        """
+        values = [[str(pk) for pk in column] for column in zip(*links)] + [updated_date]
+        db = self.orm_model_cls._choose_db(True)
+        try:
+            count, _ = await db.execute_query(sql, values)
+        except ORMBaseException as e:
+            raise RepositoryException(detail=str(e))
+        return count
 
     async def all(self) -> List[Invoice]:
         return await super().all()
@@ -45,9 +121,10 @@ class InvoiceItemsDBRepository(AbstractDBRepository):
         sort_by: Optional[str] = None,
         offset: Optional[int] = 0,
         limit: Optional[int] = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
         **kwargs,
     ) -> List[InvoiceItem]:
-        return await super().list(search=search, sort_by=sort_by, offset=offset, limit=limit, **kwargs)
+        return await super().list(search=search, sort_by=sort_by, offset=offset, limit=limit, cursor=cursor, **kwargs)
 
     async def all(self) -> List[InvoiceItem]:
         return await super().all()
@@ -63,3 +140,12 @@ class InvoiceItemsDBRepository(AbstractDBRepository):
 
     async def add(self, obj: InvoiceItem) -> None:
         return await super().add(obj)
+
+    async def add_many(self, objs: List[InvoiceItem]) -> None:
+        return await super().add_many(objs)
+
+    async def update_many(self, objs: List[InvoiceItem], fields: Optional[List[str]] = None) -> None:
+        return await super().update_many(objs, fields=fields)
+
+    async def delete_many(self, pks: List[TPrimaryKey]) -> None:
+        return await super().delete_many(pks)
@@ -1,14 +1,23 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Sequence
 
-from adapters.orm.models.operations import ORMOperation
-from domain.models.operations import Operation
+from tortoise.exceptions import BaseORMException as ORMBaseException
+from tortoise.expressions import F
+from tortoise.functions import Coalesce
+
+from adapters.orm.models.operations import ORMOperation, ORMOperationBatch, ORMOperationBatchInvoice
+from domain.models.operations import Operation, OperationBatch, OperationBatchInvoice
+from domain.types import TOperationBatchStatus, TOperationStatus, TPrimaryKey
 from settings import DEFAULT_LIMIT
 
+from ..exceptions import RepositoryException
 from .generic import AbstractDBRepository
 
 
 class OperationsDBRepository(AbstractDBRepository):
     orm_model_cls: type[ORMOperation] = ORMOperation
+    sortable_fields = ("created_date", "updated_date", "status", "sender_amount", "recipient_amount")
+    prefetch_fields = ("sender_account", "recipient_account")
 
     async def list(
         self,
@@ -16,9 +25,37 @@ class OperationsDBRepository(AbstractDBRepository):
         sort_by: Optional[str] = None,
         offset: Optional[int] = 0,
         limit: Optional[int] = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
         **kwargs,
     ) -> List[Operation]:
-        return await super().list(search=search, sort_by=sort_by, offset=offset, limit=limit, **kwargs)
+        return await super().list(search=search, sort_by=sort_by, offset=offset, limit=limit, cursor=cursor, **kwargs)
+
+    async def claim(self, statuses: Sequence[TOperationStatus], limit: int, due_date: datetime) -> List[Operation]:
+        # least recently claimed operations with an expired lease first, rows locked by another worker
+        # are skipped and the lock is held until the uow is committed
+        try:
+            db_objs = await (
+                self.orm_model_cls.filter(status__in=[s.value for s in statuses])
+                .annotate(claim_date=Coalesce("lease_expiry_date", F("created_date")))
+                .filter(claim_date__lte=due_date)
+                .order_by("claim_date")
+                .limit(limit)
+                .select_for_update(skip_locked=True)
+            )
+        except ORMBaseException as e:
+            raise RepositoryException(detail=str(e))
+        return [self.to_pydantic(db_obj) for db_obj in db_objs]
+
+    async def get_many(self, pks: Sequence[TPrimaryKey], lock: bool = False) -> List[Operation]:
+        query = self.orm_model_cls.filter(id__in=pks)
+        if lock:
+            # concurrent updates of the operations wait for this transaction
+            query = query.select_for_update()
+        try:
+            db_objs = await query
+        except ORMBaseException as e:
+            raise RepositoryException(detail=str(e))
+        return [self.to_pydantic(db_obj) for db_obj in db_objs]
 
     async def all(self) -> List[Operation]:
         return await super().all()
@@ -34,3 +71,66 @@ class OperationsDBRepository(AbstractDBRepository):
 
     async def add(self, obj: Operation) -> None:
         return await super().add(obj)
+
+    async def add_many(self, objs: List[Operation]) -> None:
+        return await super().add_many(objs)
+
+    async def update_many(self, objs: List[Operation], fields: Optional[List[str]] = None) -> None:
+        return await super().update_many(objs, fields=fields)
+
+
+class OperationBatchesDBRepository(AbstractDBRepository):
+    orm_model_cls: type[ORMOperationBatch] = ORMOperationBatch
+
+    async def claim(self, statuses: Sequence[TOperationBatchStatus], limit: int) -> List[OperationBatch]:
+        # same queue as operations: least recently processed batches first, locked ones are skipped
+        try:
+            db_objs = await (
+                self.orm_model_cls.filter(status__in=[s.value for s in statuses])
+                .annotate(processed_date=Coalesce("updated_date", F("created_date")))
+                .order_by("processed_date")
+                .limit(limit)
+                .select_for_update(skip_locked=True)
+            )
+        except ORMBaseException as e:
+            raise RepositoryException(detail=str(e))
+        return [self.to_pydantic(db_obj) for db_obj in db_objs]
+
+    async def get(self, **kwargs) -> OperationBatch:
+        return await super().get(**kwargs)
+
+    async def first(self, **kwargs) -> Optional[OperationBatch]:
+        return await super().first(**kwargs)
+
+    async def add(self, obj: OperationBatch) -> None:
+        return await super().add(obj)
+
+    async def update(self, obj: OperationBatch) -> None:
+        return await super().update(obj)
+
+
+class OperationBatchInvoicesDBRepository(AbstractDBRepository):
+    orm_model_cls: type[ORMOperationBatchInvoice] = ORMOperationBatchInvoice
+
+    async def get_invoice_ids(self, batch_id: TPrimaryKey, offset: int, limit: int) -> List[TPrimaryKey]:
+        try:
+            return await (
+                self.orm_model_cls.filter(batch_id=batch_id, position__gte=offset, position__lt=offset + limit)
+                .order_by("position")
+                .values_list("invoice_id", flat=True)
+            )
+        except ORMBaseException as e:
+            raise RepositoryException(detail=str(e))
+
+    async def get_queued_invoice_ids(
+        self, invoice_ids: Sequence[TPrimaryKey], statuses: Sequence[TOperationBatchStatus]
+    ) -> List[TPrimaryKey]:
+        try:
+            return await self.orm_model_cls.filter(
+                invoice_id__in=invoice_ids, batch__status__in=[s.value for s in statuses]
+            ).values_list("invoice_id", flat=True)
+        except ORMBaseException as e:
+            raise RepositoryException(detail=str(e))
+
+    async def add_many(self, objs: List[OperationBatchInvoice]) -> None:
+        return await super().add_many(objs)
@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import List, Optional
+
+from tortoise.exceptions import BaseORMException as ORMBaseException
+
+from adapters.orm.models.outbox import ORMOutboxMessage
+from domain.models.outbox import OutboxMessage
+
+from ..exceptions import RepositoryException
+from .generic import AbstractDBRepository
+
+
+class OutboxDBRepository(AbstractDBRepository):
+    orm_model_cls: type[ORMOutboxMessage] = ORMOutboxMessage
+
+    async def claim(self, limit: int, due_date: datetime) -> List[OutboxMessage]:
+        # pending messages due for an attempt, oldest first, rows locked by another relay are skipped
+        # and the lock is held until the uow is committed
+        try:
+            db_objs = await (
+                self.orm_model_cls.filter(
+                    sent_date__isnull=True, failed_date__isnull=True, next_attempt_date__lte=due_date
+                )
+                .order_by("next_attempt_date")
+                .limit(limit)
+                .select_for_update(skip_locked=True)
+            )
+        except ORMBaseException as e:
+            raise RepositoryException(detail=str(e))
+        return [self.to_pydantic(db_obj) for db_obj in db_objs]
+
+    async def filter(self, **kwargs) -> List[OutboxMessage]:
+        return await super().filter(**kwargs)
+
+    async def get(self, **kwargs) -> OutboxMessage:
+        return await super().get(**kwargs)
+
+    async def first(self, **kwargs) -> Optional[OutboxMessage]:
+        return await super().first(**kwargs)
+
+    async def add(self, obj: OutboxMessage) -> None:
+        return await super().add(obj)
+
+    async def add_many(self, objs: List[OutboxMessage]) -> None:
+        return await super().add_many(objs)
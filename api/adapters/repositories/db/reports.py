@@ -0,0 +1,94 @@
+from datetime import date, datetime
+from typing import List, Sequence
+
+from tortoise.exceptions import BaseORMException as ORMBaseException
+from tortoise.functions import Sum
+
+from adapters.orm.models.invoices import ORMInvoice
+from adapters.orm.models.operations import ORMOperation
+from adapters.orm.models.reports import ORMPaymentSummary
+from domain.models.reports import PAYMENT_REPORT_DIMENSIONS, PaymentReportRow
+from domain.types import TPrimaryKey
+
+from ..exceptions import InvalidQueryParameter, RepositoryException
+from .generic import AbstractDBRepository
+
+
+class PaymentSummariesDBRepository(AbstractDBRepository):
+    orm_model_cls: type[ORMPaymentSummary] = ORMPaymentSummary
+
+    async def add_operations(self, operation_ids: Sequence[TPrimaryKey], created_date: datetime) -> None:
+        # completed operations are added to the summaries of the month they were completed in,
+        # one statement for the whole batch
+        if not operation_ids:
+            return
+        sql = f"""INSERT INTO "{self.orm_model_cls._meta.db_table}" AS s (
+            "id", "created_date", "company_id", "month", "contractor_id", "currency",
+            "amount", "fees", "operations_count", "invoices_count"
+        )
+        SELECT
+            gen_random_uuid(),
+            $2,
+            o."operation_owner_company_id",
+            date_trunc('month', COALESCE(o."updated_date", o."created_date"))::date,
+            o."operation_recipient_user_id",
+            o."sender_currency",
+            COALESCE(SUM(o."sender_amount"), 0),
+            COALESCE(SUM(COALESCE(o."our_fee", 0) + COALESCE(o."provider_fee", 0)), 0),
+            COUNT(*),
+            SUM(i."invoices_count")
+        FROM "{ORMOperation._meta.db_table}" AS o
+        CROSS JOIN LATERAL (
+            SELECT COUNT(*) AS "invoices_count" FROM "{ORMInvoice._meta.db_table}" WHERE "operation_id" = o."id"
+        ) AS i
+        WHERE o."id" = ANY($1::uuid[])
+        GROUP BY 3, 4, 5, 6
+        ON CONFLICT ("company_id", "month", "contractor_id", "currency") DO UPDATE SET
+            "updated_date" = EXCLUDED."created_date",
+            "amount" = s."amount" + EXCLUDED."amount",
+            "fees" = s."fees" + EXCLUDED."fees",
+            "operations_count" = s."operations_count" + EXCLUDED."operations_count",
+            "invoices_count" = s."invoices_count" + EXCLUDED."invoices_count"
+        """
+        db = self.orm_model_cls._choose_db(True)
+        try:
+            await db.execute_query(sql, [[str(pk) for pk in operation_ids], created_date])
+        except ORMBaseException as e:
+            raise RepositoryException(detail=str(e))
+
+    async def report(
+        self,
+        company_id: TPrimaryKey,
+        group_by: Sequence[str],
+        from_month: date,
+        to_month: date,
+    ) -> List[PaymentReportRow]:
+        # reads at most months * contractors * currencies summary rows, however many operations there are
+        unknown = [name for name in group_by if name not in PAYMENT_REPORT_DIMENSIONS]
+        if unknown:
+            raise InvalidQueryParameter(detail=f"Can't group payments by {', '.join(unknown)}")
+        try:
+            rows = (
+                await self.orm_model_cls.filter(company_id=company_id, month__gte=from_month, month__lte=to_month)
+                .annotate(
+                    total_amount=Sum("amount"),
+                    total_fees=Sum("fees"),
+                    total_operations=Sum("operations_count"),
+                    total_invoices=Sum("invoices_count"),
+                )
+                .group_by(*group_by)
+                .order_by(*group_by)
+                .values(*group_by, "total_amount", "total_fees", "total_operations", "total_invoices")
+            )
+        except ORMBaseException as e:
+            raise RepositoryException(detail=str(e))
+        return [
+            PaymentReportRow(
+                **{name: row[name] for name in group_by},
+                amount=row["total_amount"],
+                fees=row["total_fees"],
+                operations_count=row["total_operations"],
+                invoices_count=row["total_invoices"],
+            )
+            for row in rows
+        ]
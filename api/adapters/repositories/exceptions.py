@@ -17,3 +17,7 @@ class ObjectDoesNotExist(RepositoryException):
 
 class MultipleObjectsReturned(RepositoryException):
     pass
+
+
+class InvalidQueryParameter(RepositoryException):
+    pass
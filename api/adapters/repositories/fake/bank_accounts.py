@@ -1,11 +1,25 @@
 from typing import List, Optional
 
 from domain.models.bank_accounts import RecipientBankAccount, SenderBankAccount
+from settings import DEFAULT_LIMIT
 
 from .generic import AbstractFakeRepository
 
 
 class SenderBankAccountFakeRepository(AbstractFakeRepository):
+    sortable_fields = ("created_date", "updated_date", "sender_currency", "sender_country_alpha3")
+
+    async def list(
+        self,
+        search: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        offset: Optional[int] = 0,
+        limit: Optional[int] = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
+        **kwargs,
+    ) -> List[SenderBankAccount]:
+        return await super().list(search=search, sort_by=sort_by, offset=offset, limit=limit, cursor=cursor, **kwargs)
+
     async def all(self) -> List[SenderBankAccount]:
         return await super().all()
 
@@ -23,6 +37,19 @@ class SenderBankAccountFakeRepository(AbstractFakeRepository):
 
 
 class RecipientBankAccountFakeRepository(AbstractFakeRepository):
+    sortable_fields = ("created_date", "updated_date", "recipient_currency", "recipient_country_alpha3")
+
+    async def list(
+        self,
+        search: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        offset: Optional[int] = 0,
+        limit: Optional[int] = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
+        **kwargs,
+    ) -> List[RecipientBankAccount]:
+        return await super().list(search=search, sort_by=sort_by, offset=offset, limit=limit, cursor=cursor, **kwargs)
+
     async def all(self) -> List[RecipientBankAccount]:
         return await super().all()
 
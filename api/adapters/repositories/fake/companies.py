@@ -1,21 +1,75 @@
-from typing import List, Optional
-
-from domain.models.companies import Company, CompanyM2MContractor, CompanyM2MEmployer, InviteUserToCompany
+from typing import List, Optional, Sequence, Tuple
+
+from domain.models.companies import (
+    Company,
+    CompanyM2MContractor,
+    CompanyM2MEmployer,
+    InvitationPreconditions,
+    InviteUserToCompany,
+)
+from domain.types import TEmail, TPrimaryKey
 from settings import DEFAULT_LIMIT
 
 from .generic import AbstractFakeRepository
+from .users import UsersFakeRepository
 
 
 class CompanyFakeRepository(AbstractFakeRepository):
+    sortable_fields = ("name", "created_date", "updated_date")
+    searchable_fields = ("name",)
+
     async def list(
         self,
         search: Optional[str] = None,
         sort_by: Optional[str] = None,
         offset: Optional[int] = 0,
         limit: Optional[int] = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
+        **kwargs,
+    ) -> List[Company]:
+        return await super().list(search=search, sort_by=sort_by, offset=offset, limit=limit, cursor=cursor, **kwargs)
+
+    async def list_for_contractor(
+        self,
+        contractor_id: TPrimaryKey,
+        search: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        offset: Optional[int] = 0,
+        limit: Optional[int] = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
+        **kwargs,
+    ) -> List[Company]:
+        memberships = await CompanyM2MContractorFakeRepository(self.session).filter(contractor_id=contractor_id)
+        return await self.list(
+            search=search,
+            sort_by=sort_by,
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            **kwargs,
+            id__in=[m.company_id for m in memberships],
+        )
+
+    async def list_for_employer(
+        self,
+        employer_id: TPrimaryKey,
+        search: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        offset: Optional[int] = 0,
+        limit: Optional[int] = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
         **kwargs,
     ) -> List[Company]:
-        return await super().list(search=search, sort_by=sort_by, offset=offset, limit=limit, **kwargs)
+        memberships = await CompanyM2MEmployerFakeRepository(self.session).filter(employer_id=employer_id)
+        return await self.list(
+            search=search,
+            sort_by=sort_by,
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            **kwargs,
+            id__in=[m.company_id for m in memberships],
+        )
 
     async def all(self) -> List[Company]:
         return await super().all()
@@ -68,6 +122,22 @@ class CompanyM2MEmployerFakeRepository(AbstractFakeRepository):
 
 
 class InviteUserToCompanyFakeRepository(AbstractFakeRepository):
+    async def get_preconditions(self, company_id: TPrimaryKey, email: TEmail) -> InvitationPreconditions:
+        user = await UsersFakeRepository(self.session).first(email=email)
+        user_in_company = user is not None and (
+            await CompanyM2MEmployerFakeRepository(self.session).exists(company_id=company_id, employer_id=user.id)
+            or await CompanyM2MContractorFakeRepository(self.session).exists(
+                company_id=company_id, contractor_id=user.id
+            )
+        )
+        return InvitationPreconditions(
+            company_exists=await CompanyFakeRepository(self.session).exists(id=company_id),
+            invitation_exists=await self.exists(company_id=company_id, email=email),
+            user_id=user.id if user else None,
+            user_role=user.role if user else None,
+            user_in_company=user_in_company,
+        )
+
     async def all(self) -> List[InviteUserToCompany]:
         return await super().all()
 
@@ -82,3 +152,17 @@ class InviteUserToCompanyFakeRepository(AbstractFakeRepository):
 
     async def add(self, obj: InviteUserToCompany) -> None:
         return await super().add(obj)
+
+    async def get_or_create(
+        self, obj: InviteUserToCompany, conflict_fields: Sequence[str]
+    ) -> Tuple[InviteUserToCompany, bool]:
+        return await super().get_or_create(obj, conflict_fields)
+
+    async def upsert(
+        self,
+        obj: InviteUserToCompany,
+        conflict_fields: Sequence[str],
+        update_fields: Sequence[str],
+        **kwargs,
+    ) -> Optional[InviteUserToCompany]:
+        return await super().upsert(obj, conflict_fields, update_fields, **kwargs)
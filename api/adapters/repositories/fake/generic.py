@@ -1,11 +1,11 @@
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 
 from pydantic.main import BaseModel
 from pydantic.types import UUID4
 
 from settings import DEFAULT_LIMIT
 
-from ..exceptions import MultipleObjectsReturned, ObjectAlreadyExists, ObjectDoesNotExist
+from ..exceptions import MultipleObjectsReturned, ObjectAlreadyExists, ObjectDoesNotExist, RepositoryException
 from ..generic import AbstractRepository
 from ..session.generic import AbstractSession
 
@@ -22,15 +22,26 @@ class AbstractFakeRepository(AbstractRepository):
         print(obj)
         self.session.objects[self.__class__.__name__][obj.id] = obj
 
-    async def get(self, **kwargs) -> BaseModel:
-        objs = await self.filter(**kwargs)
+    async def add_many(self, objs: List[BaseModel]) -> None:
+        for obj in objs:
+            await self.add(obj)
+
+    async def get(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        prefetch: Optional[Sequence[str]] = None,
+        lock: bool = False,
+        **kwargs,
+    ) -> BaseModel:
+        prefetch = self.get_prefetch(prefetch)
+        objs = await self.filter(fields=fields, **kwargs)
         if not objs:
             raise ObjectDoesNotExist(detail=f"{self.__class__.__name__} object associated with {kwargs} doesn't exist.")
         if len(objs) > 1:
             raise MultipleObjectsReturned(
                 detail=f"There are multiple {self.__class__.__name__} objects associated with {kwargs}."
             )
-        return objs[0]
+        return (await self.prefetch_related(objs, prefetch))[0]
 
     async def list(
         self,
@@ -38,13 +49,58 @@ class AbstractFakeRepository(AbstractRepository):
         sort_by: Optional[str] = None,
         offset: Optional[int] = 0,
         limit: Optional[int] = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        prefetch: Optional[Sequence[str]] = None,
         **kwargs,
     ) -> List[BaseModel]:
+        prefetch = self.get_prefetch(prefetch)
         objs = await self.filter(**kwargs)
-        # TODO search, sort_by
-        return objs[offset : offset + limit]  # noqa
+        keyset = self.get_cursor(cursor, sort_by)
+        if keyset:
+            objs = [o for o in objs if o.created_date and (o.created_date, o.id) < keyset]
+            offset = 0
+        search = self.get_search(search)
+        if search:
+            objs = [o for o in objs if self.search_by(o, search.lower())]
+        for field in reversed(self.get_ordering(sort_by)):
+            name = field.lstrip("-")
+            objs = sorted(
+                objs,
+                key=lambda o: (getattr(o, name) is None, getattr(o, name)),
+                reverse=field.startswith("-"),
+            )
+        objs = objs[offset : offset + limit]  # noqa
+        objs = self.project(objs, self.get_fields(fields, required=("id", "created_date")))
+        return await self.prefetch_related(objs, prefetch)
+
+    def project(self, objs: List[BaseModel], fields: Optional[List[str]]) -> List[BaseModel]:
+        if not fields:
+            return objs
+        return [o.construct(_fields_set=set(fields), **{f: getattr(o, f) for f in fields}) for o in objs]
+
+    async def prefetch_related(self, objs: List[BaseModel], prefetch: List[str]) -> List[BaseModel]:
+        if not prefetch:
+            return objs
+        # copies, so the nested fields don't leak into the stored objects
+        objs = [o.copy() for o in objs]
+        for obj in objs:
+            for field in prefetch:
+                setattr(obj, field, await self.get_related(obj, field))
+        return objs
+
+    async def get_related(self, obj: BaseModel, field: str) -> Any:
+        raise NotImplementedError
 
-    async def filter(self, **kwargs) -> List[BaseModel]:
+    def search_by(self, obj: BaseModel, search: str) -> bool:
+        for field in self.searchable_fields:
+            value = getattr(obj, field)
+            value = getattr(value, "value", value)
+            if value is not None and search in str(value).lower():
+                return True
+        return False
+
+    async def filter(self, fields: Optional[Sequence[str]] = None, **kwargs) -> List[BaseModel]:
         def filter_by(obj, key, value):
             if "__in" in key:
                 key = key.replace("__in", "")
@@ -54,10 +110,10 @@ class AbstractFakeRepository(AbstractRepository):
         objs = await self.all()
         for key in kwargs:
             objs = [o for o in objs if filter_by(o, key, kwargs[key])]
-        return objs
+        return self.project(objs, self.get_fields(fields))
 
-    async def first(self, **kwargs) -> Optional[BaseModel]:
-        objs = await self.filter(**kwargs)
+    async def first(self, fields: Optional[Sequence[str]] = None, lock: bool = False, **kwargs) -> Optional[BaseModel]:
+        objs = await self.filter(fields=fields, **kwargs)
         if objs:
             return objs[0]
         return None
@@ -79,6 +135,45 @@ class AbstractFakeRepository(AbstractRepository):
         print(obj)
         self.session.objects[self.__class__.__name__][obj.id] = obj
 
+    async def update_many(self, objs: List[BaseModel], fields: Optional[List[str]] = None) -> None:
+        for obj in objs:
+            await self.update(obj)
+
+    async def delete_many(self, pks: List[UUID4]) -> None:
+        for pk in pks:
+            await self.delete(pk)
+
+    async def get_or_create(self, obj: BaseModel, conflict_fields: Sequence[str]) -> Tuple[BaseModel, bool]:
+        existing = await self.first(**{f: getattr(obj, f) for f in conflict_fields})
+        if existing:
+            return existing, False
+        await self.add(obj)
+        return obj, True
+
+    async def upsert(
+        self,
+        obj: BaseModel,
+        conflict_fields: Sequence[str],
+        update_fields: Sequence[str],
+        **kwargs,
+    ) -> Optional[BaseModel]:
+        existing, created = await self.get_or_create(obj, conflict_fields)
+        if created:
+            return obj
+        if any(getattr(existing, key) != value for key, value in kwargs.items()):
+            return None
+        for name in update_fields:
+            setattr(existing, name, getattr(obj, name))
+        return existing
+
+    async def delete_where(self, **kwargs) -> int:
+        if not kwargs:
+            raise RepositoryException(detail="delete_where requires filters")
+        objs = await self.filter(**kwargs)
+        for obj in objs:
+            del self.session.objects[self.__class__.__name__][obj.id]
+        return len(objs)
+
     async def delete(self, id: UUID4) -> UUID4:
         if id not in self.session.objects[self.__class__.__name__]:
             raise ObjectDoesNotExist
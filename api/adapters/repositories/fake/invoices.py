@@ -1,21 +1,94 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
 
-from domain.models.invoices import Invoice, InvoiceItem
+from domain.models.invoices import Invoice, InvoiceItem, InvoicePayment
+from domain.types import TPrimaryKey
 from settings import DEFAULT_LIMIT
 
+from .bank_accounts import RecipientBankAccountFakeRepository, SenderBankAccountFakeRepository
 from .generic import AbstractFakeRepository
 
 
 class InvoicesFakeRepository(AbstractFakeRepository):
+    sortable_fields = ("created_date", "updated_date")
+    searchable_fields = ("invoice_items__descripion",)
+    prefetch_fields = ("items", "recipient_account")
+
     async def list(
         self,
         search: Optional[str] = None,
         sort_by: Optional[str] = None,
         offset: Optional[int] = 0,
         limit: Optional[int] = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
         **kwargs,
     ) -> List[Invoice]:
-        return await super().list(search=search, sort_by=sort_by, offset=offset, limit=limit, **kwargs)
+        return await super().list(search=search, sort_by=sort_by, offset=offset, limit=limit, cursor=cursor, **kwargs)
+
+    async def get_payments(
+        self,
+        invoice_ids: Sequence[TPrimaryKey],
+        company_id: TPrimaryKey,
+        sender_account_id: Optional[TPrimaryKey] = None,
+        lock: bool = False,
+    ) -> List[InvoicePayment]:
+        invoices = self.session.objects[self.__class__.__name__]
+        recipient_accounts = {o.id: o for o in await RecipientBankAccountFakeRepository(self.session).all()}
+        sender_accounts = {o.id: o for o in await SenderBankAccountFakeRepository(self.session).all()}
+        payments = []
+        for invoice_id in invoice_ids:
+            invoice = invoices.get(invoice_id)
+            if not invoice or invoice.for_company_id != company_id:
+                continue
+            recipient_account = recipient_accounts[invoice.recipient_account_id]
+            sender_account = sender_accounts.get(invoice.sender_account_id or sender_account_id)
+            payments.append(
+                InvoicePayment(
+                    invoice_id=invoice.id,
+                    created_by_id=invoice.created_by_id,
+                    operation_id=invoice.operation_id,
+                    amount=invoice.total_amount,
+                    recipient_account_id=recipient_account.id,
+                    recipient_bank_account_type=recipient_account.recipient_bank_account_type,
+                    recipient_currency=recipient_account.recipient_currency,
+                    recipient_country_alpha3=recipient_account.recipient_country_alpha3,
+                    sender_account_id=sender_account.id if sender_account else None,
+                    sender_owner_company_id=sender_account.sender_owner_company_id if sender_account else None,
+                    sender_bank_account_type=sender_account.sender_bank_account_type if sender_account else None,
+                    sender_currency=sender_account.sender_currency if sender_account else None,
+                    sender_country_alpha3=sender_account.sender_country_alpha3 if sender_account else None,
+                )
+            )
+        return payments
+
+    async def link_operations(
+        self,
+        links: Sequence[Tuple[TPrimaryKey, TPrimaryKey, TPrimaryKey]],
+        updated_date: datetime,
+    ) -> int:
+        invoices = self.session.objects[self.__class__.__name__]
+        count = 0
+        for invoice_id, operation_id, sender_account_id in links:
+            invoice = invoices.get(invoice_id)
+            if invoice and invoice.operation_id is None:
+                invoice.operation_id = operation_id
+                invoice.sender_account_id = sender_account_id
+                invoice.updated_date = updated_date
+                count += 1
+        return count
+
+    def search_by(self, obj: Invoice, search: str) -> bool:
+        invoice_items = self.session.objects.get("InvoiceItemsFakeRepository", {}).values()
+        return any(
+            search in (invoice_item.descripion or "").lower()
+            for invoice_item in invoice_items
+            if invoice_item.invoice_id == obj.id
+        )
+
+    async def get_related(self, obj: Invoice, field: str) -> Any:
+        if field == "items":
+            return await InvoiceItemsFakeRepository(self.session).filter(invoice_id=obj.id)
+        return await RecipientBankAccountFakeRepository(self.session).first(id=obj.recipient_account_id)
 
     async def all(self) -> List[Invoice]:
         return await super().all()
@@ -40,9 +113,10 @@ class InvoiceItemsFakeRepository(AbstractFakeRepository):
         sort_by: Optional[str] = None,
         offset: Optional[int] = 0,
         limit: Optional[int] = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
         **kwargs,
     ) -> List[InvoiceItem]:
-        return await super().list(search=search, sort_by=sort_by, offset=offset, limit=limit, **kwargs)
+        return await super().list(search=search, sort_by=sort_by, offset=offset, limit=limit, cursor=cursor, **kwargs)
 
     async def all(self) -> List[InvoiceItem]:
         return await super().all()
@@ -58,3 +132,12 @@ class InvoiceItemsFakeRepository(AbstractFakeRepository):
 
     async def add(self, obj: InvoiceItem) -> None:
         return await super().add(obj)
+
+    async def add_many(self, objs: List[InvoiceItem]) -> None:
+        return await super().add_many(objs)
+
+    async def update_many(self, objs: List[InvoiceItem], fields: Optional[List[str]] = None) -> None:
+        return await super().update_many(objs, fields=fields)
+
+    async def delete_many(self, pks: List[TPrimaryKey]) -> None:
+        return await super().delete_many(pks)
@@ -1,21 +1,44 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, List, Optional, Sequence
 
-from domain.models.operations import Operation
+from domain.models.operations import Operation, OperationBatch, OperationBatchInvoice
+from domain.types import TOperationBatchStatus, TOperationStatus, TPrimaryKey
 from settings import DEFAULT_LIMIT
 
+from .bank_accounts import RecipientBankAccountFakeRepository, SenderBankAccountFakeRepository
 from .generic import AbstractFakeRepository
 
 
 class OperationsFakeRepository(AbstractFakeRepository):
+    sortable_fields = ("created_date", "updated_date", "status", "sender_amount", "recipient_amount")
+    prefetch_fields = ("sender_account", "recipient_account")
+
     async def list(
         self,
         search: Optional[str] = None,
         sort_by: Optional[str] = None,
         offset: Optional[int] = 0,
         limit: Optional[int] = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
         **kwargs,
     ) -> List[Operation]:
-        return await super().list(search=search, sort_by=sort_by, offset=offset, limit=limit, **kwargs)
+        return await super().list(search=search, sort_by=sort_by, offset=offset, limit=limit, cursor=cursor, **kwargs)
+
+    async def claim(self, statuses: Sequence[TOperationStatus], limit: int, due_date: datetime) -> List[Operation]:
+        objs = [
+            o for o in await self.all() if o.status in statuses and (o.lease_expiry_date or o.created_date) <= due_date
+        ]
+        objs = {o.id: o for o in sorted(objs, key=lambda o: o.lease_expiry_date or o.created_date)}
+        return [objs[pk] for pk in self.session.lock(objs, limit=limit)]
+
+    async def get_many(self, pks: Sequence[TPrimaryKey], lock: bool = False) -> List[Operation]:
+        pks = set(pks)
+        return [o for o in await self.all() if o.id in pks]
+
+    async def get_related(self, obj: Operation, field: str) -> Any:
+        if field == "sender_account":
+            return await SenderBankAccountFakeRepository(self.session).first(id=obj.sender_account_id)
+        return await RecipientBankAccountFakeRepository(self.session).first(id=obj.recipient_account_id)
 
     async def all(self) -> List[Operation]:
         return await super().all()
@@ -31,3 +54,44 @@ class OperationsFakeRepository(AbstractFakeRepository):
 
     async def add(self, obj: Operation) -> None:
         return await super().add(obj)
+
+    async def add_many(self, objs: List[Operation]) -> None:
+        return await super().add_many(objs)
+
+    async def update_many(self, objs: List[Operation], fields: Optional[List[str]] = None) -> None:
+        return await super().update_many(objs, fields=fields)
+
+
+class OperationBatchesFakeRepository(AbstractFakeRepository):
+    async def claim(self, statuses: Sequence[TOperationBatchStatus], limit: int) -> List[OperationBatch]:
+        objs = [o for o in await self.all() if o.status in statuses]
+        objs = {o.id: o for o in sorted(objs, key=lambda o: o.updated_date or o.created_date)}
+        return [objs[pk] for pk in self.session.lock(objs, limit=limit)]
+
+    async def get(self, **kwargs) -> OperationBatch:
+        return await super().get(**kwargs)
+
+    async def first(self, **kwargs) -> Optional[OperationBatch]:
+        return await super().first(**kwargs)
+
+    async def add(self, obj: OperationBatch) -> None:
+        return await super().add(obj)
+
+    async def update(self, obj: OperationBatch) -> None:
+        return await super().update(obj)
+
+
+class OperationBatchInvoicesFakeRepository(AbstractFakeRepository):
+    async def get_invoice_ids(self, batch_id: TPrimaryKey, offset: int, limit: int) -> List[TPrimaryKey]:
+        objs = [o for o in await self.all() if o.batch_id == batch_id and offset <= o.position < offset + limit]
+        return [o.invoice_id for o in sorted(objs, key=lambda o: o.position)]
+
+    async def get_queued_invoice_ids(
+        self, invoice_ids: Sequence[TPrimaryKey], statuses: Sequence[TOperationBatchStatus]
+    ) -> List[TPrimaryKey]:
+        batches = await OperationBatchesFakeRepository(self.session).filter(status__in=statuses)
+        batch_ids = {b.id for b in batches}
+        return [o.invoice_id for o in await self.all() if o.invoice_id in invoice_ids and o.batch_id in batch_ids]
+
+    async def add_many(self, objs: List[OperationBatchInvoice]) -> None:
+        return await super().add_many(objs)
@@ -0,0 +1,32 @@
+from datetime import datetime
+from typing import List, Optional
+
+from domain.models.outbox import OutboxMessage
+
+from .generic import AbstractFakeRepository
+
+
+class OutboxFakeRepository(AbstractFakeRepository):
+    async def claim(self, limit: int, due_date: datetime) -> List[OutboxMessage]:
+        objs = [
+            o
+            for o in await self.all()
+            if o.sent_date is None and o.failed_date is None and o.next_attempt_date <= due_date
+        ]
+        objs = {o.id: o for o in sorted(objs, key=lambda o: o.next_attempt_date)}
+        return [objs[pk] for pk in self.session.lock(objs, limit=limit)]
+
+    async def filter(self, **kwargs) -> List[OutboxMessage]:
+        return await super().filter(**kwargs)
+
+    async def get(self, **kwargs) -> OutboxMessage:
+        return await super().get(**kwargs)
+
+    async def first(self, **kwargs) -> Optional[OutboxMessage]:
+        return await super().first(**kwargs)
+
+    async def add(self, obj: OutboxMessage) -> None:
+        return await super().add(obj)
+
+    async def add_many(self, objs: List[OutboxMessage]) -> None:
+        return await super().add_many(objs)
@@ -0,0 +1,63 @@
+from collections import Counter
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List, Sequence
+from uuid import uuid4
+
+from domain.models.reports import PAYMENT_REPORT_DIMENSIONS, PaymentReportRow, PaymentSummary
+from domain.types import TPrimaryKey
+
+from ..exceptions import InvalidQueryParameter
+from .generic import AbstractFakeRepository
+from .invoices import InvoicesFakeRepository
+from .operations import OperationsFakeRepository
+
+
+class PaymentSummariesFakeRepository(AbstractFakeRepository):
+    async def add_operations(self, operation_ids: Sequence[TPrimaryKey], created_date: datetime) -> None:
+        operations = await OperationsFakeRepository(self.session).filter(id__in=list(operation_ids))
+        invoices_counts = Counter(i.operation_id for i in await InvoicesFakeRepository(self.session).all())
+        for operation in operations:
+            completed_date = operation.updated_date or operation.created_date
+            key = dict(
+                company_id=operation.operation_owner_company_id,
+                month=completed_date.date().replace(day=1),
+                contractor_id=operation.operation_recipient_user_id,
+                currency=operation.sender_currency,
+            )
+            summary = await self.first(**key)
+            if summary:
+                summary.updated_date = created_date
+            else:
+                summary = PaymentSummary(id=uuid4(), created_date=created_date, **key)
+                await self.add(summary)
+            summary.amount += operation.sender_amount or 0
+            summary.fees += (operation.our_fee or 0) + (operation.provider_fee or 0)
+            summary.operations_count += 1
+            summary.invoices_count += invoices_counts[operation.id]
+
+    async def report(
+        self,
+        company_id: TPrimaryKey,
+        group_by: Sequence[str],
+        from_month: date,
+        to_month: date,
+    ) -> List[PaymentReportRow]:
+        unknown = [name for name in group_by if name not in PAYMENT_REPORT_DIMENSIONS]
+        if unknown:
+            raise InvalidQueryParameter(detail=f"Can't group payments by {', '.join(unknown)}")
+        rows = {}
+        for summary in await self.filter(company_id=company_id):
+            if not from_month <= summary.month <= to_month:
+                continue
+            key = tuple(getattr(summary, name) for name in group_by)
+            row = rows.get(key)
+            if not row:
+                row = rows[key] = PaymentReportRow(
+                    **dict(zip(group_by, key)), amount=Decimal(0), fees=Decimal(0), operations_count=0, invoices_count=0
+                )
+            row.amount += summary.amount
+            row.fees += summary.fees
+            row.operations_count += summary.operations_count
+            row.invoices_count += summary.invoices_count
+        return [rows[key] for key in sorted(rows)]
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
 from domain.models.users import User
 from settings import DEFAULT_LIMIT
@@ -13,9 +13,10 @@ class UsersFakeRepository(AbstractFakeRepository):
         sort_by: Optional[str] = None,
         offset: Optional[int] = 0,
         limit: Optional[int] = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
         **kwargs,
     ) -> List[User]:
-        return await super().list(search=search, sort_by=sort_by, offset=offset, limit=limit, **kwargs)
+        return await super().list(search=search, sort_by=sort_by, offset=offset, limit=limit, cursor=cursor, **kwargs)
 
     async def all(self) -> List[User]:
         return await super().all()
@@ -31,3 +32,15 @@ class UsersFakeRepository(AbstractFakeRepository):
 
     async def add(self, obj: User) -> None:
         return await super().add(obj)
+
+    async def get_or_create(self, obj: User, conflict_fields: Sequence[str]) -> Tuple[User, bool]:
+        return await super().get_or_create(obj, conflict_fields)
+
+    async def upsert(
+        self,
+        obj: User,
+        conflict_fields: Sequence[str],
+        update_fields: Sequence[str],
+        **kwargs,
+    ) -> Optional[User]:
+        return await super().upsert(obj, conflict_fields, update_fields, **kwargs)
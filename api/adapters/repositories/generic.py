@@ -1,13 +1,108 @@
 import abc
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID
 
 from pydantic.main import BaseModel
 
+from domain.cursors import decode_cursor
+
+from .exceptions import InvalidQueryParameter
+
 
 class AbstractRepository(abc.ABC):
+    # whitelists for list(search=..., sort_by=...)
+    sortable_fields: Tuple[str, ...] = ()
+    searchable_fields: Tuple[str, ...] = ()
+    # nested pydantic fields which can be loaded together with the objects, see get(prefetch=...)
+    prefetch_fields: Tuple[str, ...] = ()
+    # keyset pagination relies on this ordering, see get_cursor
+    default_ordering: Tuple[str, ...] = ("-created_date", "-id")
+
     @abc.abstractmethod
     async def add(self, obj) -> None:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    async def add_many(self, objs: List[BaseModel]) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def update_many(self, objs: List[BaseModel], fields: Optional[List[str]] = None) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def delete_many(self, pks: List[UUID]) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def get_or_create(self, obj: BaseModel, conflict_fields: Sequence[str]) -> Tuple[BaseModel, bool]:
+        # inserts obj unless an object with the same conflict_fields values exists, returns (object, created)
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def upsert(
+        self,
+        obj: BaseModel,
+        conflict_fields: Sequence[str],
+        update_fields: Sequence[str],
+        **kwargs,
+    ) -> Optional[BaseModel]:
+        # inserts obj or copies update_fields to the conflicting object when it matches kwargs,
+        # returns the stored object or None when the conflicting object doesn't match
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def delete_where(self, **kwargs) -> int:
+        # single DELETE by filters, returns the number of deleted objects
+        raise NotImplementedError
+
     @abc.abstractmethod
     async def get(self, **kwargs) -> BaseModel:
         raise NotImplementedError
+
+    def get_ordering(self, sort_by: Optional[str]) -> List[str]:
+        # sort_by is a comma separated list of fields, "-" prefix means descending order
+        if not sort_by:
+            return list(self.default_ordering)
+        ordering = []
+        for field in sort_by.split(","):
+            field = field.strip()
+            if field.lstrip("-") not in self.sortable_fields:
+                raise InvalidQueryParameter(
+                    detail=f"Unsupported sort_by field {field}, use one of {list(self.sortable_fields)}"
+                )
+            ordering.append(field)
+        return ordering
+
+    def get_search(self, search: Optional[str]) -> Optional[str]:
+        if not search or not search.strip():
+            return None
+        if not self.searchable_fields:
+            raise InvalidQueryParameter(detail=f"{self.__class__.__name__} doesn't support search")
+        return search.strip()
+
+    def get_cursor(self, cursor: Optional[str], sort_by: Optional[str]) -> Optional[Tuple[datetime, UUID]]:
+        if not cursor:
+            return None
+        if sort_by:
+            raise InvalidQueryParameter(detail="cursor can't be combined with sort_by")
+        try:
+            return decode_cursor(cursor)
+        except ValueError as e:
+            raise InvalidQueryParameter(detail=str(e))
+
+    def get_prefetch(self, prefetch: Optional[Sequence[str]]) -> List[str]:
+        prefetch = list(prefetch or ())
+        for field in prefetch:
+            if field not in self.prefetch_fields:
+                raise InvalidQueryParameter(
+                    detail=f"Unsupported prefetch field {field}, use one of {list(self.prefetch_fields)}"
+                )
+        return prefetch
+
+    def get_fields(self, fields: Optional[Sequence[str]], required: Sequence[str] = ("id",)) -> Optional[List[str]]:
+        # projection, objects are returned as partial models with only these fields set
+        if not fields:
+            return None
+        return list(dict.fromkeys([*required, *fields]))
@@ -1,24 +1,51 @@
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, List, Optional
+
 from .generic import AbstractSession
 
+# transaction of the running task, like the DB connection of a tortoise transaction
+current_transaction: ContextVar = ContextVar("fake_session_transaction", default=None)
+
 
 class FakeSession(AbstractSession):
     def __init__(self) -> None:
         self.objects = {}
+        # primary key -> transaction holding the row lock
+        self.locks: Dict[Any, Any] = {}
 
     async def open(self) -> None:
         pass
 
     async def clean(self) -> None:
         self.objects = {}
+        self.locks = {}
 
     async def start(self, transaction: any) -> None:
-        pass
+        current_transaction.set(transaction)
+
+    def lock(self, pks: Iterable[Any], limit: Optional[int] = None) -> List[Any]:
+        # FOR UPDATE SKIP LOCKED: returns the keys which were locked by the current transaction
+        transaction = current_transaction.get()
+        locked = []
+        for pk in pks:
+            if limit is not None and len(locked) == limit:
+                break
+            holder = self.locks.get(pk)
+            if holder is not None and holder is not transaction:
+                continue
+            if transaction is not None:
+                self.locks[pk] = transaction
+            locked.append(pk)
+        return locked
+
+    def unlock(self, transaction: any) -> None:
+        self.locks = {pk: holder for pk, holder in self.locks.items() if holder is not transaction}
 
     async def commit(self, transaction: any) -> None:
-        pass
+        self.unlock(transaction)
 
     async def rollback(self, transaction: any) -> None:
-        pass
+        self.unlock(transaction)
 
     async def close(self) -> None:
         pass
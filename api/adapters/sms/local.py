@@ -0,0 +1,24 @@
+import asyncio
+import logging
+import random
+
+from .fake import FakeSmsAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class LocalSmsAdapter(FakeSmsAdapter):
+    """Offline stand-in for the SMS provider with its latency and failure rate."""
+
+    def __init__(self, latency: float = 0.0, failure_rate: float = 0.0) -> None:
+        super().__init__()
+        self.latency = latency
+        self.failure_rate = failure_rate
+
+    async def send(self, phone, sms):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if random.random() < self.failure_rate:
+            raise ConnectionError(f"SMS to {phone} was not delivered")
+        logger.info("SMS to %s", phone)
+        await super().send(phone, sms)
@@ -0,0 +1,161 @@
+"""Paying 10k invoices one by one and through the bulk pipeline with the fake UoW.
+
+Every repository call is a round trip to the DB, the DB time is estimated for 1 ms per round trip.
+
+Run from the api folder: ``ENV_FILE=tmpl.env python -m benchmarks.invoice_bulk_pay``
+"""
+
+import asyncio
+import contextlib
+import io
+import time
+import uuid
+from datetime import datetime
+from functools import wraps
+
+from adapters.email.fake import FakeEmailAdapter
+from adapters.rate_table.fake import FakeRateTable
+from adapters.repositories.session.fake import FakeSession
+from adapters.sms.fake import FakeSmsAdapter
+from domain.commands.employer.invoices import EmployerBulkInvoicePayCommand
+from domain.models.bank_accounts import RecipientBankAccount, SenderBankAccount
+from domain.models.companies import Company, CompanyM2MEmployer
+from domain.models.invoices import Invoice
+from domain.models.operations import OperationBatch
+from domain.models.users import User
+from domain.types import TBankAccountType, TCountry, TCurrency, TOperationBatchStatus, TRole
+from service_layer.messagebus.messagebus import MessageBus
+from service_layer.operations.batches import OperationBatchProcessor, build_operation
+from service_layer.unit_of_work.fake import FakeUnitOfWork
+
+INVOICES = 10_000
+CONTRACTORS = 100
+ROUND_TRIP = 0.001  # in sec
+
+
+class CountingFakeUnitOfWork(FakeUnitOfWork):
+    round_trips = 0
+
+    async def __aenter__(self):
+        await super().__aenter__()
+        for name, repository in list(vars(self).items()):
+            if hasattr(repository, "session") and name != "session":
+                setattr(self, name, CountingRepository(repository))
+
+
+class CountingRepository:
+    def __init__(self, repository) -> None:
+        self.repository = repository
+
+    def __getattr__(self, name):
+        method = getattr(self.repository, name)
+
+        @wraps(method)
+        async def wrap(*args, **kwargs):
+            CountingFakeUnitOfWork.round_trips += 1
+            return await method(*args, **kwargs)
+
+        return wrap
+
+
+async def setup(session: FakeSession):
+    employer = User(id=uuid.uuid4(), email="employer@test.com", role=TRole.EMPLOYER, is_active=True)
+    company = Company(id=uuid.uuid4(), name="company", owner_id=employer.id)
+    sender_account = SenderBankAccount(
+        id=uuid.uuid4(),
+        sender_owner_company_id=company.id,
+        sender_bank_account_type=TBankAccountType.BUSINESS,
+        sender_currency=TCurrency.USD,
+        sender_country_alpha3=TCountry.USA,
+    )
+    recipient_accounts = [
+        RecipientBankAccount(
+            id=uuid.uuid4(),
+            recipient_owner_user_id=uuid.uuid4(),
+            recipient_bank_account_type=TBankAccountType.PERSONAL,
+            recipient_currency=TCurrency.USD,
+            recipient_country_alpha3=TCountry.USA,
+        )
+        for _ in range(CONTRACTORS)
+    ]
+    # items don't change the number of statements
+    invoices = [
+        Invoice(
+            id=uuid.uuid4(),
+            created_date=datetime.utcnow(),
+            created_by_id=recipient_accounts[i % CONTRACTORS].recipient_owner_user_id,
+            for_company_id=company.id,
+            recipient_account_id=recipient_accounts[i % CONTRACTORS].id,
+        )
+        for i in range(INVOICES)
+    ]
+    uow = FakeUnitOfWork(session=session)
+    async with uow:
+        await uow.users.add(employer)
+        await uow.companies.add(company)
+        await uow.companies_m2m_employers.add(
+            CompanyM2MEmployer(id=uuid.uuid4(), company_id=company.id, employer_id=employer.id)
+        )
+        await uow.sender_bank_accounts.add(sender_account)
+        await uow.recipient_bank_accounts.add_many(recipient_accounts)
+        await uow.invoices.add_many(invoices)
+    return employer, company, sender_account, invoices
+
+
+async def pay_one_by_one(session: FakeSession) -> None:
+    employer, company, sender_account, invoices = await setup(session)
+    batch = OperationBatch(
+        id=uuid.uuid4(),
+        company_id=company.id,
+        created_by_id=employer.id,
+        status=TOperationBatchStatus.NEW,
+        invoices_count=len(invoices),
+    )
+    for invoice in invoices:
+        uow = CountingFakeUnitOfWork(session=session)
+        async with uow:
+            [payment] = await uow.invoices.get_payments([invoice.id], company.id, sender_account.id, lock=True)
+            operation = build_operation(batch, [payment], datetime.utcnow())
+            await uow.operations.add(operation)
+            await uow.invoices.link_operations([(invoice.id, operation.id, sender_account.id)], datetime.utcnow())
+            await uow.commit()
+
+
+async def pay_in_bulk(session: FakeSession) -> None:
+    employer, company, sender_account, invoices = await setup(session)
+    bus = MessageBus(
+        uow=FakeUnitOfWork(session=session),
+        uow_factory=lambda: CountingFakeUnitOfWork(session=session),
+        sms_adapter=FakeSmsAdapter(),
+        email_adapter=FakeEmailAdapter(),
+        rate_table=FakeRateTable(),
+    )
+    command = EmployerBulkInvoicePayCommand(invoice_ids=[i.id for i in invoices], sender_account_id=sender_account.id)
+    batch = await bus.handler(command, current_user_id=employer.id, current_company_id=company.id)
+    processor = OperationBatchProcessor(uow_factory=bus.uow_factory, rate_table=bus.rate_table)
+    while await processor.run_once():
+        pass
+    async with bus.uow:
+        assert (await bus.uow.operation_batches.get(id=batch.id)).status == TOperationBatchStatus.COMPLETED
+
+
+async def measure(pay) -> None:
+    CountingFakeUnitOfWork.round_trips = 0
+    # fake repositories print added objects
+    with contextlib.redirect_stdout(io.StringIO()):
+        started_at = time.perf_counter()
+        await pay(FakeSession())
+        elapsed = time.perf_counter() - started_at
+    round_trips = CountingFakeUnitOfWork.round_trips
+    print(f"{pay.__name__:<16}{round_trips:>13}{elapsed * 1000:>10.0f}{round_trips * ROUND_TRIP * 1000:>14.0f}")
+
+
+async def main() -> None:
+    print(f"{INVOICES} invoices of {CONTRACTORS} contractors")
+    print(f"{'pipeline':<16}{'round trips':>13}{'cpu, ms':>10}{'est. db, ms':>14}")
+    await measure(pay_one_by_one)
+    await measure(pay_in_bulk)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,76 @@
+"""Invoice item reconciliation for large invoices.
+
+Compares the nested scans the update handler used to do with the single pass diff, and counts the
+item statements one update issues. Run from the api folder: ``ENV_FILE=tmpl.env python -m benchmarks.invoice_items``
+"""
+
+import time
+import uuid
+from decimal import Decimal
+
+from domain.commands.contractor.invoices import InvoiceItemUpdate
+from domain.models.invoices import Invoice, InvoiceItem
+from service_layer.handlers.contractor.invoices import diff_invoice_items
+
+LINES = 1000
+ROUNDS = 20
+
+
+def nested_scan_diff(invoice, invoice_items, message_items):
+    # the previous O(n*m) matching, kept here as the baseline
+    updated_items, deleted_ids, new_items = [], [], []
+    for invoice_item in invoice_items:
+        message_item = next((i for i in message_items if i.invoice_item_id == invoice_item.id), None)
+        if message_item:
+            invoice_item.quantity = message_item.quantity
+            updated_items.append(invoice_item)
+        else:
+            deleted_ids.append(invoice_item.id)
+    for message_item in message_items:
+        if not next((i for i in invoice_items if i.id == message_item.invoice_item_id), None):
+            new_items.append(message_item)
+    return new_items, updated_items, deleted_ids
+
+
+def build():
+    invoice = Invoice(
+        id=uuid.uuid4(), created_by_id=uuid.uuid4(), for_company_id=uuid.uuid4(), recipient_account_id=uuid.uuid4()
+    )
+    invoice_items = [
+        InvoiceItem(id=uuid.uuid4(), invoice_id=invoice.id, amount=Decimal("1"), quantity=1, descripion=str(i))
+        for i in range(LINES)
+    ]
+    # update half of the lines, drop a quarter and add a quarter of new ones
+    message_items = [InvoiceItemUpdate(invoice_item_id=i.id, quantity=2) for i in invoice_items[: LINES // 2]]
+    message_items += [InvoiceItemUpdate(price=Decimal("1"), quantity=1, descripion="new") for _ in range(LINES // 4)]
+    return invoice, invoice_items, message_items
+
+
+def measure(name: str, diff) -> None:
+    invoice, invoice_items, message_items = build()
+    started_at = time.perf_counter()
+    for _ in range(ROUNDS):
+        diff(invoice, invoice_items, message_items)
+    elapsed = (time.perf_counter() - started_at) / ROUNDS
+    print(f"{name:<12} {elapsed * 1000:8.2f} ms per {LINES}-line invoice")
+
+
+def count_statements() -> None:
+    invoice, invoice_items, message_items = build()
+    new_items, updated_items, deleted_ids = diff_invoice_items(invoice, invoice_items, message_items)
+    per_item = len(new_items) + len(updated_items) + len(deleted_ids)
+    bulk = sum(1 for objs in (new_items, updated_items, deleted_ids) if objs)
+    print(
+        f"item statements per update: {bulk} bulk (was {per_item} per item), "
+        f"{len(new_items)} created, {len(updated_items)} updated, {len(deleted_ids)} deleted"
+    )
+
+
+def main() -> None:
+    measure("nested scan", nested_scan_diff)
+    measure("single pass", diff_invoice_items)
+    count_statements()
+
+
+if __name__ == "__main__":
+    main()
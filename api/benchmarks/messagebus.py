@@ -0,0 +1,100 @@
+"""Messages/sec dispatched through the bus with the fake UoW.
+
+Run from the api folder: ``ENV_FILE=tmpl.env python -m benchmarks.messagebus``
+"""
+
+import asyncio
+import contextlib
+import inspect
+import io
+import time
+import uuid
+
+from adapters.email.fake import FakeEmailAdapter
+from adapters.principal_cache.memory import InMemoryPrincipalCache
+from adapters.repositories.session.fake import FakeSession
+from adapters.sms.fake import FakeSmsAdapter
+from domain.commands.contractor.companies import ContractorCompanyRetrieveCommand
+from domain.commands.users import ProfileRetrieveCommand
+from domain.models.companies import Company, CompanyM2MContractor
+from domain.models.users import User
+from domain.types import TRole
+from service_layer.handlers.permissions import get_principal_with_companies
+from service_layer.messagebus.messagebus import COMMANDS, MessageBus
+from service_layer.unit_of_work.fake import FakeUnitOfWork
+
+MESSAGES = 20_000
+
+
+class LegacyMessageBus(MessageBus):
+    # dispatch with the handler signature inspected on every message
+    async def handler(self, message, current_user_id=None, current_company_id=None):
+        handler_fn = COMMANDS[type(message)]
+        uow = self.get_uow()
+        params = inspect.signature(handler_fn).parameters
+        extra_params = getattr(handler_fn, "dependencies", ())
+        dependencies = {
+            name: dependency
+            for name, dependency in dict(
+                uow=uow,
+                sms_adapter=self.sms_adapter,
+                email_adapter=self.email_adapter,
+                principal_cache=self.principal_cache,
+                current_user_id=current_user_id,
+                current_company_id=current_company_id,
+                current_principal=None,
+            ).items()
+            if name in params or name in extra_params
+        }
+        if "current_principal" in dependencies and current_user_id:
+            dependencies["current_principal"] = await get_principal_with_companies(
+                uow, self.principal_cache, current_user_id
+            )
+        return await handler_fn(message, **dependencies)
+
+
+def make_bus(bus_cls: type[MessageBus], session: FakeSession) -> MessageBus:
+    return bus_cls(
+        uow=FakeUnitOfWork(session=session),
+        uow_factory=lambda: FakeUnitOfWork(session=session),
+        sms_adapter=FakeSmsAdapter(),
+        email_adapter=FakeEmailAdapter(),
+        principal_cache=InMemoryPrincipalCache(),
+    )
+
+
+async def measure(bus: MessageBus, message, user_id) -> float:
+    started_at = time.perf_counter()
+    for _ in range(MESSAGES):
+        await bus.handler(message, current_user_id=user_id)
+    return MESSAGES / (time.perf_counter() - started_at)
+
+
+async def main() -> None:
+    session = FakeSession()
+    user = User(id=uuid.uuid4(), email="contractor@test.com", role=TRole.CONTRACTOR, is_active=True)
+    company = Company(id=uuid.uuid4(), name="company", owner_id=uuid.uuid4())
+    uow = FakeUnitOfWork(session=session)
+    # fake repositories print added objects
+    with contextlib.redirect_stdout(io.StringIO()):
+        async with uow:
+            await uow.users.add(user)
+            await uow.companies.add(company)
+            await uow.companies_m2m_contractors.add(
+                CompanyM2MContractor(id=uuid.uuid4(), company_id=company.id, contractor_id=user.id)
+            )
+    messages = {
+        "profile retrieve": ProfileRetrieveCommand(),
+        "company retrieve (role)": ContractorCompanyRetrieveCommand(company_id=company.id),
+    }
+    legacy_bus, bus = make_bus(LegacyMessageBus, session), make_bus(MessageBus, session)
+    print(f"{MESSAGES} messages, messages/sec")
+    print(f"{'message':<26}{'legacy':>10}{'bus':>10}")
+    for name, message in messages.items():
+        print(
+            f"{name:<26}{await measure(legacy_bus, message, user.id):10.0f}{await measure(bus, message, user.id):10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,60 @@
+"""Status transitions/sec of the operation processor with the fake UoW and a provider latency of 2 ms.
+
+One worker with batch size 1 is the old one-operation-per-transaction processing.
+
+Run from the api folder: ``ENV_FILE=tmpl.env python -m benchmarks.operation_processor``
+"""
+
+import asyncio
+import contextlib
+import io
+import time
+from functools import partial
+
+from adapters.payment_provider.fake import FakePaymentProvider
+from adapters.repositories.session.fake import FakeSession
+from service_layer.operations.processor import OperationProcessor
+from service_layer.unit_of_work.fake import FakeUnitOfWork
+from tests.fixtures import build_operation
+
+OPERATIONS = 1_000
+LATENCY = 0.002
+# NEW -> IN_PROGRESS -> ACCEPTED -> COMPLETED
+TRANSITIONS = OPERATIONS * 3
+SETUPS = ((1, 1), (4, 1), (16, 1), (1, 100), (4, 100), (16, 100))
+
+
+async def measure(workers: int, batch_size: int) -> float:
+    session = FakeSession()
+    uow = FakeUnitOfWork(session=session)
+    async with uow:
+        await uow.operations.add_many([build_operation() for _ in range(OPERATIONS)])
+    processor = OperationProcessor(
+        uow_factory=partial(FakeUnitOfWork, session=session),
+        payment_provider=FakePaymentProvider(latency=LATENCY),
+        workers=workers,
+        batch_size=batch_size,
+        poll_interval=0.01,
+        lease=LATENCY * 5,
+    )
+    started_at = time.perf_counter()
+    await processor.start()
+    while processor.metrics.transitions < TRANSITIONS:
+        await asyncio.sleep(0.001)
+    elapsed = time.perf_counter() - started_at
+    await processor.stop()
+    return processor.metrics.transitions / elapsed
+
+
+async def main() -> None:
+    print(f"{OPERATIONS} operations, {TRANSITIONS} transitions, transitions/sec")
+    print(f"{'workers':<9}{'batch size':<12}{'processor':>10}")
+    for workers, batch_size in SETUPS:
+        # fake repositories print added objects
+        with contextlib.redirect_stdout(io.StringIO()):
+            rate = await measure(workers, batch_size)
+        print(f"{workers:<9}{batch_size:<12}{rate:10.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,117 @@
+"""ORM <-> pydantic conversion cost over 10k rows per model.
+
+Run from the api folder: ``ENV_FILE=tmpl.env python -m benchmarks.orm_mapping``
+"""
+
+import asyncio
+import time
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+from tortoise import Tortoise
+
+from adapters.orm.models.bank_accounts import ORMRecipientBankAccount, ORMSenderBankAccount
+from adapters.orm.models.companies import (
+    ORMCompany,
+    ORMCompanyM2MContractor,
+    ORMCompanyM2MEmployer,
+    ORMInviteUserToCompany,
+)
+from adapters.orm.models.invoices import ORMInvoice, ORMInvoiceItem
+from adapters.orm.models.operations import ORMOperation
+from adapters.orm.models.users import ORMUser
+from settings import TORTOISE_ORM
+
+ROWS = 10_000
+
+NOW = datetime.utcnow()
+ACCOUNT = {"bank_account_type": "BUSINESS", "currency": "USD", "country_alpha3": "USA"}
+SENDER_ACCOUNT = {f"sender_{k}": v for k, v in ACCOUNT.items()}
+RECIPIENT_ACCOUNT = {f"recipient_{k}": v for k, v in ACCOUNT.items()}
+SAMPLES = {
+    ORMUser: {
+        "email": "user@test.com",
+        "role": "CONTRACTOR",
+        "phone": "+79990000000",
+        "first_name": "First",
+        "last_name": "Last",
+        "password": "0" * 64,
+        "email_code": "0" * 32,
+        "is_active": True,
+    },
+    ORMCompany: {"name": "company", "owner_id": uuid.uuid4()},
+    ORMCompanyM2MEmployer: {"company_id": uuid.uuid4(), "employer_id": uuid.uuid4()},
+    ORMCompanyM2MContractor: {"company_id": uuid.uuid4(), "contractor_id": uuid.uuid4()},
+    ORMInviteUserToCompany: {
+        "sender_id": uuid.uuid4(),
+        "company_id": uuid.uuid4(),
+        "email": "user@test.com",
+        "invitation_code": "0" * 32,
+    },
+    ORMSenderBankAccount: {"sender_owner_company_id": uuid.uuid4(), **SENDER_ACCOUNT},
+    ORMRecipientBankAccount: {"recipient_owner_user_id": uuid.uuid4(), **RECIPIENT_ACCOUNT},
+    ORMOperation: {
+        "operation_owner_company_id": uuid.uuid4(),
+        "operation_sender_user_id": uuid.uuid4(),
+        "operation_recipient_user_id": uuid.uuid4(),
+        "sender_amount": Decimal("100.00"),
+        "recipient_amount": Decimal("95.00"),
+        "status": "COMPLETED",
+        **SENDER_ACCOUNT,
+        **RECIPIENT_ACCOUNT,
+    },
+    ORMInvoice: {
+        "created_by_id": uuid.uuid4(),
+        "for_company_id": uuid.uuid4(),
+        "recipient_account_id": uuid.uuid4(),
+    },
+    ORMInvoiceItem: {"invoice_id": uuid.uuid4(), "amount": Decimal("10.00"), "quantity": 8, "descripion": "work"},
+}
+
+
+def measure(fn, objs) -> float:
+    started_at = time.perf_counter()
+    for obj in objs:
+        fn(obj)
+    return (time.perf_counter() - started_at) * 1000
+
+
+def legacy_read(db_obj):
+    return db_obj.Meta.pydantic_cls(**db_obj.to_dict())
+
+
+def legacy_write(orm_model_cls):
+    def write(obj):
+        orm_model_cls().update_from_dict(obj.dict(exclude_none=True, exclude_unset=True, exclude_defaults=True))
+
+    return write
+
+
+def new_write(orm_model_cls):
+    def write(obj):
+        orm_model_cls().from_pydantic(obj)
+
+    return write
+
+
+async def main() -> None:
+    await Tortoise.init(config={**TORTOISE_ORM, "connections": {"default": "sqlite://:memory:"}})
+    print(f"{ROWS} rows per model, ms")
+    print(f"{'model':<26}{'old read':>10}{'construct':>11}{'validate':>10}{'old write':>11}{'write':>8}")
+    for orm_model_cls, sample in SAMPLES.items():
+        db_objs = [orm_model_cls(id=uuid.uuid4(), created_date=NOW, **sample) for _ in range(ROWS)]
+        objs = [db_obj.to_pydantic(validate=True) for db_obj in db_objs]
+        print(
+            f"{orm_model_cls.__name__:<26}"
+            f"{measure(legacy_read, db_objs):10.0f}"
+            f"{measure(lambda o: o.to_pydantic(), db_objs):11.0f}"
+            f"{measure(lambda o: o.to_pydantic(validate=True), db_objs):10.0f}"
+            f"{measure(legacy_write(orm_model_cls), objs):11.0f}"
+            f"{measure(new_write(orm_model_cls), objs):8.0f}"
+        )
+    await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
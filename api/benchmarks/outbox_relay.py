@@ -0,0 +1,58 @@
+"""Messages/sec delivered by the outbox relay with the fake UoW and a provider latency of 2 ms.
+
+Batch size 1 is the old one-message-per-transaction delivery.
+
+Run from the api folder: ``ENV_FILE=tmpl.env python -m benchmarks.outbox_relay``
+"""
+
+import asyncio
+import contextlib
+import io
+from functools import partial
+
+from adapters.email.local import LocalEmailAdapter
+from adapters.repositories.session.fake import FakeSession
+from adapters.sms.local import LocalSmsAdapter
+from domain.models.outbox import OutboxMessage
+from service_layer.outbox.relay import OutboxRelay
+from service_layer.unit_of_work.fake import FakeUnitOfWork
+
+MESSAGES = 2_000
+LATENCY = 0.002
+BATCH_SIZES = (1, 10, 100, 500)
+
+
+async def measure(batch_size: int) -> float:
+    session = FakeSession()
+    uow = FakeUnitOfWork(session=session)
+    async with uow:
+        await uow.outbox.add_many(
+            [
+                OutboxMessage.email(f"user{i}@test.com", "Email verification", "Verification code")
+                for i in range(MESSAGES)
+            ]
+        )
+    relay = OutboxRelay(
+        uow_factory=partial(FakeUnitOfWork, session=session),
+        email_adapter=LocalEmailAdapter(latency=LATENCY),
+        sms_adapter=LocalSmsAdapter(latency=LATENCY),
+        batch_size=batch_size,
+    )
+    while await relay.run_once():
+        pass
+    assert relay.metrics.sent == MESSAGES
+    return relay.metrics.messages_per_second
+
+
+async def main() -> None:
+    print(f"{MESSAGES} messages, messages/sec")
+    print(f"{'batch size':<12}{'relay':>10}")
+    for batch_size in BATCH_SIZES:
+        # fake repositories print added objects
+        with contextlib.redirect_stdout(io.StringIO()):
+            rate = await measure(batch_size)
+        print(f"{batch_size:<12}{rate:10.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+"""Latency of an unrelated endpoint while a burst of logins is running.
+
+Run from the api folder: ``ENV_FILE=tmpl.env python -m benchmarks.password_hashing``
+"""
+
+import asyncio
+import contextlib
+import io
+import os
+import statistics
+import time
+
+from httpx import AsyncClient
+
+from adapters.password_hasher.fake import FakePasswordHasher
+from adapters.password_hasher.pool import PoolPasswordHasher
+from domain.types import TRole
+from main import app, bus, shutdown, startup
+
+LOGINS = 200
+UNRELATED_REQUESTS = 200
+UNRELATED_REQUESTS_INTERVAL = 0.005  # sec
+EMAIL = "benchmark@test.com"
+PASSWORD = "password"
+
+
+async def login(client: AsyncClient) -> None:
+    response = await client.post("/users/generate-access-token", json={"email": EMAIL, "password": PASSWORD})
+    assert response.status_code == 200, response.text
+
+
+async def unrelated_request(client: AsyncClient, scheduled_at: float) -> float:
+    response = await client.post("/users/verify-email", json={"email_code": "0" * 16})
+    assert response.status_code == 404, response.text
+    return time.perf_counter() - scheduled_at
+
+
+async def unrelated_requests(client: AsyncClient) -> list:
+    # requests arrive on a fixed schedule (open loop), so a blocked event loop shows up as latency
+    started_at = time.perf_counter()
+    tasks = []
+    for i in range(UNRELATED_REQUESTS):
+        scheduled_at = started_at + i * UNRELATED_REQUESTS_INTERVAL
+        await asyncio.sleep(max(0.0, scheduled_at - time.perf_counter()))
+        tasks.append(asyncio.create_task(unrelated_request(client, scheduled_at)))
+    return await asyncio.gather(*tasks)
+
+
+async def run(name: str, hasher) -> None:
+    bus.password_hasher = hasher
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        await startup()
+        await bus.clean()
+        with contextlib.redirect_stdout(io.StringIO()):
+            response = await client.post(
+                "/users/signup-user",
+                json={"email": EMAIL, "role": TRole.EMPLOYER, "password": PASSWORD, "repeat_password": PASSWORD},
+            )
+            assert response.status_code == 200, response.text
+            uow = bus.get_uow()
+            async with uow:
+                user = await uow.users.get(email=EMAIL)
+                user.is_active = True
+                await uow.users.update(user)
+
+        started_at = time.perf_counter()
+        results = await asyncio.gather(unrelated_requests(client), *[login(client) for _ in range(LOGINS)])
+        elapsed = time.perf_counter() - started_at
+        await shutdown()
+
+    latencies = sorted(results[0])
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(f"{name:>16}: {LOGINS} logins in {elapsed:.2f}s, unrelated endpoint p50={p50:.2f}ms p99={p99:.2f}ms")
+
+
+async def main() -> None:
+    print(f"cpu count: {os.cpu_count()}")
+    await run("event loop", FakePasswordHasher())
+    await run("thread pool", PoolPasswordHasher(executor="thread"))
+    await run("process pool", PoolPasswordHasher(executor="process"))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,94 @@
+"""Pricing of 100k invoice line items paid by 1k operations across all currency pairs.
+
+Per row is the naive way: every line item is converted and charged on its own, with a rate
+lookup and three roundings per row. The engine sums the line items of an operation exactly and
+prices every operation once with one rate snapshot, the fee drift shows what rounding every row costs.
+
+Run from the api folder: ``ENV_FILE=tmpl.env python -m benchmarks.pricing``
+"""
+
+import asyncio
+import itertools
+import random
+import time
+import uuid
+from decimal import ROUND_HALF_EVEN, Decimal
+from typing import List
+
+from adapters.rate_table.fake import FakeRateTable
+from domain.models.operations import Operation
+from domain.types import TCurrency, TOperationStatus
+from service_layer.pricing.engine import CENT, PricingEngine
+from settings import OUR_FEE_PERCENT, PROVIDER_FEE_PERCENT
+
+LINE_ITEMS = 100_000
+OPERATIONS = 1_000
+PAIRS = list(itertools.product(TCurrency, repeat=2))
+
+
+def build_operations():
+    operations, items = [], []
+    for i in range(OPERATIONS):
+        sender_currency, recipient_currency = PAIRS[i % len(PAIRS)]
+        operations.append(
+            Operation.construct(
+                id=uuid.uuid4(),
+                sender_currency=sender_currency,
+                recipient_currency=recipient_currency,
+                status=TOperationStatus.NEW,
+            )
+        )
+        items.append(
+            [
+                (Decimal(random.randint(1, 100_000)) / 100, random.randint(1, 10))
+                for _ in range(LINE_ITEMS // OPERATIONS)
+            ]
+        )
+    return operations, items
+
+
+def per_row(snapshot, operations, items) -> List[Decimal]:
+    our_fee_rate = OUR_FEE_PERCENT / 100
+    provider_fee_rate = PROVIDER_FEE_PERCENT / 100
+    for operation, operation_items in zip(operations, items):
+        sender_amount = our_fees = provider_fees = Decimal(0)
+        for amount, quantity in operation_items:
+            rate = snapshot.get_rate(operation.recipient_currency, operation.sender_currency)
+            converted = (amount * quantity * rate).quantize(CENT, ROUND_HALF_EVEN)
+            our_fee = (converted * our_fee_rate).quantize(CENT, ROUND_HALF_EVEN)
+            provider_fee = (converted * provider_fee_rate).quantize(CENT, ROUND_HALF_EVEN)
+            sender_amount += converted + our_fee + provider_fee
+            our_fees += our_fee
+            provider_fees += provider_fee
+        operation.sender_amount, operation.our_fee, operation.provider_fee = sender_amount, our_fees, provider_fees
+    return [o.our_fee + o.provider_fee for o in operations]
+
+
+def engine(snapshot, operations, items) -> List[Decimal]:
+    for operation, operation_items in zip(operations, items):
+        operation.recipient_amount = sum(amount * quantity for amount, quantity in operation_items)
+    PricingEngine(snapshot).price(operations)
+    return [o.our_fee + o.provider_fee for o in operations]
+
+
+def measure(fn, snapshot, operations, items):
+    started_at = time.perf_counter()
+    fees = fn(snapshot, operations, items)
+    return time.perf_counter() - started_at, fees
+
+
+async def main() -> None:
+    snapshot = await FakeRateTable().get_snapshot()
+    operations, items = build_operations()
+    print(f"{LINE_ITEMS} line items, {OPERATIONS} operations")
+    print(f"{'':<10}{'ms':>8}{'items/sec':>12}")
+    results = {}
+    for name, fn in (("per row", per_row), ("engine", engine)):
+        seconds, results[name] = measure(fn, snapshot, operations, items)
+        print(f"{name:<10}{seconds * 1000:8.0f}{LINE_ITEMS / seconds:12.0f}")
+    drift = [abs(a - b) for a, b in zip(results["per row"], results["engine"])]
+    print(f"fees drift of rounding every row: {sum(d > 0 for d in drift)} operations, up to {max(drift)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,9 +1,21 @@
+from functools import partial
+
 from adapters.email.email import EmailAdapter
 from adapters.email.fake import FakeEmailAdapter
+from adapters.password_hasher.fake import FakePasswordHasher
+from adapters.password_hasher.pool import PoolPasswordHasher
+from adapters.payment_provider.fake import FakePaymentProvider
+from adapters.payment_provider.generic import AbstractPaymentProvider
+from adapters.principal_cache.memory import InMemoryPrincipalCache
+from adapters.rate_table.fake import FakeRateTable
+from adapters.rate_table.generic import AbstractRateTable
+from adapters.repositories.session.db import DBSession
+from adapters.repositories.session.fake import FakeSession
 from adapters.sms.fake import FakeSmsAdapter
 from adapters.sms.sms import SmsAdapter
-from generic import Singleton
+from generic import ImproperlyConfigured, Singleton
 from service_layer.messagebus.messagebus import MessageBus
+from service_layer.messagebus.workers import EventWorkerPool
 from service_layer.unit_of_work.db import DBUnitOfWork
 from service_layer.unit_of_work.fake import FakeUnitOfWork
 from settings import TEST_ENV
@@ -11,25 +23,40 @@ from settings import TEST_ENV
 
 class FakeBootstrap(Singleton):
     def init(self):
-        uow = FakeUnitOfWork()
+        session = FakeSession()
+        uow = FakeUnitOfWork(session=session)
         sms_adapter = FakeSmsAdapter()
         email_adapter = FakeEmailAdapter()
         return MessageBus(
             uow=uow,
+            uow_factory=partial(FakeUnitOfWork, session=session),
             sms_adapter=sms_adapter,
             email_adapter=email_adapter,
+            principal_cache=InMemoryPrincipalCache(),
+            rate_table=FakeRateTable(),
+            password_hasher=FakePasswordHasher(),
+            payment_provider=FakePaymentProvider(),
+            event_workers=EventWorkerPool(),
         )
 
 
 class Bootstrap(Singleton):
     def init(self):
-        uow = DBUnitOfWork()
+        session = DBSession()
+        uow = DBUnitOfWork(session=session)
         sms_adapter = SmsAdapter()
         email_adapter = EmailAdapter()
         return MessageBus(
             uow=uow,
+            uow_factory=partial(DBUnitOfWork, session=session),
             sms_adapter=sms_adapter,
             email_adapter=email_adapter,
+            principal_cache=InMemoryPrincipalCache(),
+            password_hasher=PoolPasswordHasher(),
+            # there are no rate table and payment provider integrations yet, the processor refuses to start without them
+            rate_table=None,
+            payment_provider=None,
+            event_workers=EventWorkerPool(),
         )
 
 
@@ -37,3 +64,17 @@ if TEST_ENV:
     bus = FakeBootstrap().init()
 else:
     bus = Bootstrap().init()
+
+
+def get_rate_table() -> AbstractRateTable:
+    # batches must never be priced with the static fake rates outside of tests
+    if not bus.rate_table:
+        raise ImproperlyConfigured("No rate table is configured, FakeRateTable works only with TEST_ENV")
+    return bus.rate_table
+
+
+def get_payment_provider() -> AbstractPaymentProvider:
+    # operations must never be "paid" by the fake provider outside of tests
+    if not bus.payment_provider:
+        raise ImproperlyConfigured("No payment provider is configured, FakePaymentProvider works only with TEST_ENV")
+    return bus.payment_provider
@@ -6,7 +6,7 @@ from ..generic import AbstractCommand, AbstractListCommand
 
 
 class ContractorRecipientBankAccountListCommand(AbstractListCommand):
-    pass
+    currency: Optional[TCurrency] = None
 
 
 class ContractorRecipientBankAccountCreateCommand(AbstractCommand):
@@ -19,7 +19,8 @@ class InvoiceItemCreate(AbstractCommand):
 
 
 class InvoiceItemUpdate(AbstractCommand):
-    invoice_item_id: TPrimaryKey
+    # items without id are created, existing items missing from the command are deleted
+    invoice_item_id: Optional[TPrimaryKey]
     price: Optional[Decimal]
     quantity: Optional[int]
     descripion: Optional[constr(strip_whitespace=True)]
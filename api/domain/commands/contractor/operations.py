@@ -1,10 +1,12 @@
-from domain.types import TPrimaryKey
+from typing import Optional
+
+from domain.types import TOperationStatus, TPrimaryKey
 
 from ..generic import AbstractCommand, AbstractListCommand
 
 
 class ContractorOperationListCommand(AbstractListCommand):
-    pass
+    status: Optional[TOperationStatus] = None
 
 
 class ContractorOperationRetrieveCommand(AbstractCommand):
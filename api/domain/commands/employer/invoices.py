@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from domain.types import TPrimaryKey
 
@@ -19,3 +19,5 @@ class EmployerInvoicePayCommand(AbstractCommand):
 
 class EmployerBulkInvoicePayCommand(AbstractCommand):
     invoice_ids: List[TPrimaryKey]
+    # company account for the invoices which don't have a sender account yet
+    sender_account_id: Optional[TPrimaryKey]
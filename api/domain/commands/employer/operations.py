@@ -9,3 +9,7 @@ class EmployerOperationListCommand(AbstractListCommand):
 
 class EmployerOperationRetrieveCommand(AbstractCommand):
     operation_id: TPrimaryKey
+
+
+class EmployerOperationBatchRetrieveCommand(AbstractCommand):
+    batch_id: TPrimaryKey
@@ -0,0 +1,22 @@
+from datetime import date
+from typing import Optional
+
+from ..generic import AbstractCommand
+
+
+class EmployerPaymentsReportCommand(AbstractCommand):
+    # first days of the months, the last REPORT_MONTHS months by default
+    from_month: Optional[date] = None
+    to_month: Optional[date] = None
+
+
+class EmployerPaymentsByMonthCommand(EmployerPaymentsReportCommand):
+    pass
+
+
+class EmployerPaymentsByContractorCommand(EmployerPaymentsReportCommand):
+    pass
+
+
+class EmployerPaymentsByCurrencyCommand(EmployerPaymentsReportCommand):
+    pass
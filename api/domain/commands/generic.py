@@ -1,9 +1,12 @@
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel
 
 from settings import DEFAULT_LIMIT
 
+from ..cursors import encode_cursor
+from ..models.generic import AbstractModel
+
 
 class AbstractCommand(BaseModel):
     pass
@@ -14,3 +17,11 @@ class AbstractListCommand(AbstractCommand):
     limit: Optional[int] = DEFAULT_LIMIT
     search: Optional[str] = None
     sort_by: Optional[str] = None
+    # opaque keyset cursor, ignores offset and works only with the default ordering
+    cursor: Optional[str] = None
+
+    def get_next_cursor(self, objs: List[AbstractModel]) -> Optional[str]:
+        # a full page in the default ordering means there may be more objects after the last one
+        if self.sort_by or not objs or len(objs) < self.limit:
+            return None
+        return encode_cursor(objs[-1])
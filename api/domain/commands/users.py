@@ -3,9 +3,6 @@ from typing import Optional
 from pydantic import validator
 from pydantic.types import constr
 
-from domain.models.companies import InviteUserToCompany
-from domain.models.users import User
-
 from ..types import (
     TEmail,
     TEmailCode,
@@ -48,10 +45,6 @@ class GenerateEmailCodeCommand(AbstractCommand):
     email: TEmail
 
 
-class SendEmailCodeByEmailCommand(AbstractCommand):
-    user: User
-
-
 class VerifyEmailCodeCommand(AbstractCommand):
     email_code: TEmailCode
 
@@ -64,10 +57,6 @@ class GeneratePhoneCodeCommand(AbstractCommand):
         return validate_phone(v)
 
 
-class SendPhoneCodeBySmsCommand(AbstractCommand):
-    user: User
-
-
 class VerifyPhoneCodeCommand(AbstractCommand):
     phone_code: TPhoneCode
 
@@ -76,10 +65,6 @@ class GenerateResetPasswordCodeCommand(GenerateEmailCodeCommand):
     pass
 
 
-class SendResetPasswordCodeByEmailCommand(SendEmailCodeByEmailCommand):
-    pass
-
-
 class ResetPasswordCommand(AbstractCommand):
     password: TPassword
     repeat_password: TPassword
@@ -128,9 +113,5 @@ class GenerateInvitationCodeCommand(AbstractCommand):
     email: TEmail
 
 
-class SendInvitationCodeByEmailCommand(AbstractCommand):
-    invite_user_to_company: InviteUserToCompany
-
-
 class VerifyInvitationCodeAndInviteUserToCompanyCommand(AbstractCommand):
     invitation_code: TInvitationCode
@@ -0,0 +1,21 @@
+import base64
+from datetime import datetime
+from typing import Optional, Tuple
+from uuid import UUID
+
+from .models.generic import AbstractModel
+
+
+def encode_cursor(obj: AbstractModel) -> Optional[str]:
+    if not obj.created_date:
+        return None
+    value = f"{obj.created_date.isoformat()}|{obj.id}"
+    return base64.urlsafe_b64encode(value.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        created_date, pk = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_date), UUID(pk)
+    except (ValueError, UnicodeError):
+        raise ValueError("Invalid cursor.")
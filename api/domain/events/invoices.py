@@ -0,0 +1,8 @@
+from ..types import TPrimaryKey
+from .generic import AbstractEvent
+
+
+class InvoiceCreated(AbstractEvent):
+    invoice_id: TPrimaryKey
+    created_by_id: TPrimaryKey
+    for_company_id: TPrimaryKey
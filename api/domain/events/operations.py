@@ -0,0 +1,9 @@
+from ..types import TOperationStatus, TPrimaryKey
+from .generic import AbstractEvent
+
+
+class OperationStatusChanged(AbstractEvent):
+    operation_id: TPrimaryKey
+    operation_owner_company_id: TPrimaryKey
+    previous_status: TOperationStatus
+    status: TOperationStatus
@@ -1,9 +1,10 @@
 import secrets
 from typing import Optional
 
+from pydantic import BaseModel
 from pydantic.types import constr
 
-from domain.types import TEmail, TInvitationCode, TPrimaryKey
+from domain.types import TEmail, TInvitationCode, TPrimaryKey, TRole
 
 from .generic import AbstractModel
 from .users import User
@@ -39,3 +40,11 @@ class InviteUserToCompany(AbstractModel):
 
     async def randomly_set_invitation_code(self, length: int = 16) -> None:
         self.invitation_code = secrets.token_hex(length)
+
+
+class InvitationPreconditions(BaseModel):
+    company_exists: bool
+    invitation_exists: bool
+    user_id: Optional[TPrimaryKey]
+    user_role: Optional[TRole]
+    user_in_company: bool
@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import Optional
+from typing import Any, FrozenSet, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from ..types import TPrimaryKey
 
@@ -11,3 +11,19 @@ class AbstractModel(BaseModel):
 
     created_date: Optional[datetime]
     updated_date: Optional[datetime]
+
+    # None while the object is not tracked (built in code), names of assigned fields otherwise
+    _changed_fields: Optional[FrozenSet[str]] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # frozenset is replaced, not mutated, so copies keep their own changes
+        if self._changed_fields is not None and name in self.__fields__:
+            object.__setattr__(self, "_changed_fields", self._changed_fields | {name})
+
+    @property
+    def changed_fields(self) -> Optional[FrozenSet[str]]:
+        return self._changed_fields
+
+    def track_changes(self) -> None:
+        object.__setattr__(self, "_changed_fields", frozenset())
@@ -1,9 +1,10 @@
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional
 
+from pydantic import BaseModel
 from pydantic.types import constr
 
-from ..types import TPrimaryKey
+from ..types import TBankAccountType, TCountry, TCurrency, TPrimaryKey
 from .bank_accounts import RecipientBankAccount, SenderBankAccount
 from .companies import Company
 from .generic import AbstractModel
@@ -29,6 +30,13 @@ class Invoice(AbstractModel):
     operation_id: Optional[TPrimaryKey]
     operation: Optional[Operation]
 
+    items: Optional[List["InvoiceItem"]]
+    total_amount: Decimal = Decimal(0)
+
+    def set_items(self, items: List["InvoiceItem"]) -> None:
+        self.items = items
+        self.total_amount = sum((item.amount * item.quantity for item in items), Decimal(0))
+
 
 class InvoiceItem(AbstractModel):
     invoice_id: TPrimaryKey
@@ -36,3 +44,25 @@ class InvoiceItem(AbstractModel):
     amount: Decimal
     quantity: int
     descripion: constr(strip_whitespace=True)
+
+
+class InvoicePayment(BaseModel):
+    invoice_id: TPrimaryKey
+    created_by_id: TPrimaryKey
+    operation_id: Optional[TPrimaryKey]
+    amount: Decimal
+
+    recipient_account_id: TPrimaryKey
+    recipient_bank_account_type: TBankAccountType
+    recipient_currency: TCurrency
+    recipient_country_alpha3: TCountry
+
+    # invoice sender account or the one chosen for the payment, None if neither exists
+    sender_account_id: Optional[TPrimaryKey]
+    sender_owner_company_id: Optional[TPrimaryKey]
+    sender_bank_account_type: Optional[TBankAccountType]
+    sender_currency: Optional[TCurrency]
+    sender_country_alpha3: Optional[TCountry]
+
+
+Invoice.update_forward_refs(InvoiceItem=InvoiceItem)
@@ -1,12 +1,68 @@
+from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
-from ..types import TOperationStatus, TPrimaryKey
+from ..types import TCurrency, TOperationBatchStatus, TOperationStatus, TPrimaryKey
 from .bank_accounts import RecipientBankAccount, SenderBankAccount
 from .companies import Company
 from .generic import AbstractModel
+from .pricing import RateSnapshot
 from .users import User
 
+# statuses an operation can move to, the ones without transitions are final
+OPERATION_STATUS_TRANSITIONS: Dict[TOperationStatus, Tuple[TOperationStatus, ...]] = {
+    TOperationStatus.CREATING: (TOperationStatus.NEW, TOperationStatus.FAILED),
+    TOperationStatus.NEW: (
+        TOperationStatus.IN_PROGRESS,
+        TOperationStatus.CANCELED,
+        TOperationStatus.REJECTED,
+        TOperationStatus.FAILED,
+    ),
+    TOperationStatus.IN_PROGRESS: (TOperationStatus.ACCEPTED, TOperationStatus.REJECTED, TOperationStatus.FAILED),
+    TOperationStatus.ACCEPTED: (TOperationStatus.COMPLETED, TOperationStatus.FAILED),
+}
+
+
+class OperationBatch(AbstractModel):
+    company_id: TPrimaryKey
+    company: Optional[Company]
+    created_by_id: TPrimaryKey
+    created_by: Optional[User]
+    # used for invoices without a sender account
+    sender_account_id: Optional[TPrimaryKey]
+
+    status: TOperationBatchStatus
+    invoices_count: int
+    processed_count: int = 0
+    operations_count: int = 0
+    # invoices deleted, paid or moved to another company before their chunk was paid
+    skipped_count: int = 0
+    attempts: int = 0  # failed chunks, the batch fails after BULK_PAY_MAX_ATTEMPTS
+    error: Optional[str]
+    # rate snapshot of the first chunk as {"EUR/USD": "1.0875"}, all chunks and retries are priced with it
+    rates: Optional[Dict[str, str]]
+    rates_date: Optional[datetime]
+
+    def get_rate_snapshot(self) -> Optional[RateSnapshot]:
+        if self.rates_date is None:
+            return None
+        rates = {}
+        for pair, rate in (self.rates or {}).items():
+            source, target = pair.split("/")
+            rates[(TCurrency(source), TCurrency(target))] = Decimal(rate)
+        return RateSnapshot(created_date=self.rates_date, rates=rates)
+
+    def set_rate_snapshot(self, snapshot: RateSnapshot) -> None:
+        self.rates = {f"{source.value}/{target.value}": str(rate) for (source, target), rate in snapshot.rates.items()}
+        self.rates_date = snapshot.created_date
+
+
+class OperationBatchInvoice(AbstractModel):
+    batch_id: TPrimaryKey
+    invoice_id: TPrimaryKey
+    # order of the invoices in the request, chunks are read by position from processed_count
+    position: int
+
 
 class Operation(SenderBankAccount, RecipientBankAccount, AbstractModel):
     operation_owner_company_id: TPrimaryKey
@@ -25,6 +81,16 @@ class Operation(SenderBankAccount, RecipientBankAccount, AbstractModel):
     recipient_account: Optional[RecipientBankAccount]
     recipient_amount: Optional[Decimal]
 
+    batch_id: Optional[TPrimaryKey]
+    batch: Optional[OperationBatch]
+
     status: TOperationStatus
+    # the processor doesn't claim the operation again while the provider is asked about it
+    lease_expiry_date: Optional[datetime]
     our_fee: Optional[Decimal]
     provider_fee: Optional[Decimal]
+
+    def set_status(self, status: TOperationStatus) -> None:
+        if status not in OPERATION_STATUS_TRANSITIONS.get(self.status, ()):
+            raise ValueError(f"Operation can't move from {self.status.value} to {status.value}")
+        self.status = status
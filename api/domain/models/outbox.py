@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import Optional
+from uuid import uuid4
+
+from ..types import TOutboxChannel
+from .generic import AbstractModel
+
+
+class OutboxMessage(AbstractModel):
+    channel: TOutboxChannel
+    recipient: str
+    subject: Optional[str]
+    body: str
+
+    attempts: int = 0
+    next_attempt_date: datetime
+    sent_date: Optional[datetime]
+    # set after the last failed attempt, the message is not claimed anymore
+    failed_date: Optional[datetime]
+    error: Optional[str]
+
+    @classmethod
+    def email(cls, email: str, subject: str, body: str) -> "OutboxMessage":
+        now = datetime.utcnow()
+        return cls(
+            id=uuid4(),
+            created_date=now,
+            next_attempt_date=now,
+            channel=TOutboxChannel.EMAIL,
+            recipient=email,
+            subject=subject,
+            body=body,
+        )
+
+    @classmethod
+    def sms(cls, phone: str, body: str) -> "OutboxMessage":
+        now = datetime.utcnow()
+        return cls(
+            id=uuid4(),
+            created_date=now,
+            next_attempt_date=now,
+            channel=TOutboxChannel.SMS,
+            recipient=phone,
+            body=body,
+        )
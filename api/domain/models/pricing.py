@@ -0,0 +1,21 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Tuple
+
+from pydantic import BaseModel
+
+from ..types import TCurrency
+
+
+class RateSnapshot(BaseModel):
+    created_date: datetime
+    # units of the target currency per unit of the source currency
+    rates: Dict[Tuple[TCurrency, TCurrency], Decimal]
+
+    def get_rate(self, source: TCurrency, target: TCurrency) -> Decimal:
+        if source == target:
+            return Decimal(1)
+        rate = self.rates.get((source, target))
+        if rate is None:
+            raise ValueError(f"No exchange rate from {source.value} to {target.value}")
+        return rate
@@ -0,0 +1,12 @@
+from typing import Set
+
+from pydantic import BaseModel
+
+from ..types import TPrimaryKey, TRole
+
+
+class Principal(BaseModel):
+    id: TPrimaryKey
+    role: TRole
+    is_active: bool
+    company_ids: Set[TPrimaryKey] = set()
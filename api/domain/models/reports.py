@@ -0,0 +1,40 @@
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+
+from pydantic import BaseModel
+
+from ..types import TCurrency, TPrimaryKey
+from .companies import Company
+from .generic import AbstractModel
+from .users import User
+
+# what payment reports can be grouped by
+PAYMENT_REPORT_DIMENSIONS = ("month", "contractor_id", "currency")
+
+
+class PaymentSummary(AbstractModel):
+    # completed operations of a company per month, contractor and sender currency
+    company_id: TPrimaryKey
+    company: Optional[Company]
+    contractor_id: TPrimaryKey
+    contractor: Optional[User]
+
+    month: date
+    currency: TCurrency
+    amount: Decimal = Decimal(0)
+    fees: Decimal = Decimal(0)
+    operations_count: int = 0
+    invoices_count: int = 0
+
+
+class PaymentReportRow(BaseModel):
+    # dimensions which the report isn't grouped by are None
+    month: Optional[date]
+    contractor_id: Optional[TPrimaryKey]
+    currency: Optional[TCurrency]
+
+    amount: Decimal
+    fees: Decimal
+    operations_count: int
+    invoices_count: int
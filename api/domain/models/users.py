@@ -1,10 +1,9 @@
-import hashlib
 import hmac
 import os
 import secrets
 import string
 from datetime import datetime
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 
 from pydantic.types import constr
 
@@ -32,19 +31,16 @@ class User(AbstractModel):
     is_onboarded: Optional[bool] = False
     is_superuser: Optional[bool] = False
 
-    async def _get_password_hash(self, password: str, salt: bytes) -> bytes:
-        return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, 10000)
-
-    async def set_password(self, password: str) -> None:
+    async def set_password(self, password: str, hash_password: Callable[[str, bytes], Awaitable[bytes]]) -> None:
         salt = os.urandom(16)
-        password_hash = await self._get_password_hash(password, salt)
+        password_hash = await hash_password(password, salt)
         self.password = f"{salt.hex()}${password_hash.hex()}"
 
-    async def verify_password(self, password: str) -> bool:
+    async def verify_password(self, password: str, hash_password: Callable[[str, bytes], Awaitable[bytes]]) -> bool:
         if not self.password:
             return False
         salt, db_password_hash = self.password.split("$")
-        password_hash = await self._get_password_hash(password, bytes.fromhex(salt))
+        password_hash = await hash_password(password, bytes.fromhex(salt))
         password_hash = password_hash.hex()
         return hmac.compare_digest(db_password_hash, password_hash)
 
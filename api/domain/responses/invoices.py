@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import List
+from typing import List, Optional
 
 from pydantic.types import constr
 
@@ -9,15 +9,18 @@ from .generic import AbstractReponse
 
 class InvoiceItem(AbstractReponse):
     id: TPrimaryKey
-    price: Decimal
+    amount: Decimal
     quantity: int
     descripion: constr(strip_whitespace=True)
 
 
 class InvoiceResponse(AbstractReponse):
     id: TPrimaryKey
-    invoice_owner_company_id: TPrimaryKey
-    invoice_owner_user_id: TPrimaryKey
+    for_company_id: TPrimaryKey
+    created_by_id: TPrimaryKey
     recipient_account_id: TPrimaryKey
-    recipient_amount: Decimal
-    items: List[InvoiceItem]
+    sender_account_id: Optional[TPrimaryKey]
+    operation_id: Optional[TPrimaryKey]
+    total_amount: Decimal
+    # only for a single invoice, lists have totals only
+    items: Optional[List[InvoiceItem]]
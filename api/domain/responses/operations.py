@@ -1,7 +1,7 @@
 from decimal import Decimal
 from typing import Optional
 
-from ..types import TCountry, TCurrency, TOperationStatus, TPrimaryKey
+from ..types import TCountry, TCurrency, TOperationBatchStatus, TOperationStatus, TPrimaryKey
 from .generic import AbstractReponse
 
 
@@ -27,3 +27,13 @@ class OperationResponse(AbstractReponse):
     punica_fee: Optional[Decimal]
     crypto_fee: Optional[Decimal]
     crypto_to_cash_fee: Optional[Decimal]
+
+
+class OperationBatchResponse(AbstractReponse):
+    id: TPrimaryKey
+    status: TOperationBatchStatus
+    invoices_count: int
+    processed_count: int
+    operations_count: int
+    skipped_count: int
+    error: Optional[str]
@@ -0,0 +1,21 @@
+from datetime import date
+from decimal import Decimal
+
+from ..types import TCurrency, TPrimaryKey
+from .generic import AbstractReponse
+
+
+class PaymentsResponse(AbstractReponse):
+    currency: TCurrency
+    amount: Decimal
+    fees: Decimal
+    operations_count: int
+    invoices_count: int
+
+
+class MonthlyPaymentsResponse(PaymentsResponse):
+    month: date
+
+
+class ContractorPaymentsResponse(PaymentsResponse):
+    contractor_id: TPrimaryKey
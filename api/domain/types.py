@@ -39,6 +39,18 @@ class TOperationStatus(str, Enum):
     FAILED = "FAILED"
 
 
+class TOperationBatchStatus(str, Enum):
+    NEW = "NEW"
+    IN_PROGRESS = "IN_PROGRESS"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
+class TOutboxChannel(str, Enum):
+    EMAIL = "EMAIL"
+    SMS = "SMS"
+
+
 TPrimaryKey = UUID4
 TEmail = constr(strip_whitespace=True, to_lower=True, regex=EMAIL_REGEXP)
 TPhone = constr(strip_whitespace=True, to_lower=True, min_length=1)
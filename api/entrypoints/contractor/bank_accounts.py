@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 
 from bootstrap import bus
 from domain.commands.contractor.bank_accounts import (
@@ -11,7 +11,7 @@ from domain.commands.contractor.bank_accounts import (
     ContractorRecipientBankAccountUpdateCommand,
 )
 from domain.responses.bank_accounts import RecipientBankAccountResponse
-from domain.types import TPrimaryKey
+from domain.types import TCurrency, TPrimaryKey
 from settings import DEFAULT_LIMIT
 
 from ..dependencies import get_current_company_id, get_current_user_id
@@ -24,10 +24,13 @@ router = APIRouter(
 
 @router.get("", response_model=List[RecipientBankAccountResponse])
 async def get_recipient_bank_accounts(
+    response: Response,
     offset: Optional[int] = 0,
     limit: Optional[int] = DEFAULT_LIMIT,
     search: Optional[str] = None,
     sort_by: Optional[str] = None,
+    cursor: Optional[str] = None,
+    currency: Optional[TCurrency] = None,
     current_contractor_id: TPrimaryKey = Depends(get_current_user_id),
     current_company_id: TPrimaryKey = Depends(get_current_company_id),
 ):
@@ -37,11 +40,16 @@ async def get_recipient_bank_accounts(
     command.limit = limit
     command.search = search
     command.sort_by = sort_by
+    command.cursor = cursor
+    command.currency = currency
     result = await bus.handler(
         command,
         current_user_id=current_contractor_id,
         current_company_id=current_company_id,
     )
+    next_cursor = command.get_next_cursor(result)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return [RecipientBankAccountResponse(**o.dict()) for o in result]
 
 
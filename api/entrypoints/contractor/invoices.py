@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 
 from bootstrap import bus
 from domain.commands.contractor.invoices import (
@@ -24,10 +24,12 @@ router = APIRouter(
 
 @router.get("", response_model=List[InvoiceResponse])
 async def get_invoices(
+    response: Response,
     offset: Optional[int] = 0,
     limit: Optional[int] = DEFAULT_LIMIT,
     search: Optional[str] = None,
     sort_by: Optional[str] = None,
+    cursor: Optional[str] = None,
     current_contractor_id: TPrimaryKey = Depends(get_current_user_id),
     current_company_id: TPrimaryKey = Depends(get_current_company_id),
 ):
@@ -37,11 +39,15 @@ async def get_invoices(
     command.limit = limit
     command.search = search
     command.sort_by = sort_by
+    command.cursor = cursor
     result = await bus.handler(
         command,
         current_user_id=current_contractor_id,
         current_company_id=current_company_id,
     )
+    next_cursor = command.get_next_cursor(result)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return [InvoiceResponse(**o.dict()) for o in result]
 
 
@@ -1,11 +1,11 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 
 from bootstrap import bus
 from domain.commands.contractor.operations import ContractorOperationListCommand, ContractorOperationRetrieveCommand
 from domain.responses.operations import OperationResponse
-from domain.types import TPrimaryKey
+from domain.types import TOperationStatus, TPrimaryKey
 from settings import DEFAULT_LIMIT
 
 from ..dependencies import get_current_company_id, get_current_user_id
@@ -18,10 +18,13 @@ router = APIRouter(
 
 @router.get("", response_model=List[OperationResponse])
 async def get_operations(
+    response: Response,
     offset: Optional[int] = 0,
     limit: Optional[int] = DEFAULT_LIMIT,
     search: Optional[str] = None,
     sort_by: Optional[str] = None,
+    cursor: Optional[str] = None,
+    status: Optional[TOperationStatus] = None,
     current_contractor_id: TPrimaryKey = Depends(get_current_user_id),
     current_company_id: TPrimaryKey = Depends(get_current_company_id),
 ):
@@ -31,11 +34,16 @@ async def get_operations(
     command.limit = limit
     command.search = search
     command.sort_by = sort_by
+    command.cursor = cursor
+    command.status = status
     result = await bus.handler(
         command,
         current_user_id=current_contractor_id,
         current_company_id=current_company_id,
     )
+    next_cursor = command.get_next_cursor(result)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return [OperationResponse(**o.dict()) for o in result]
 
 
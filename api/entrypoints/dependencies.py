@@ -8,6 +8,7 @@ from starlette.requests import Request
 
 from bootstrap import bus
 from entrypoints.exceptions import HeaderValidationException, NotAuthorizedException
+from service_layer.handlers.permissions import get_principal
 from settings import JWT_SECRET_KEY
 
 token_auth_scheme = HTTPBearer()
@@ -27,10 +28,10 @@ async def get_current_user_id(token: str = Depends(token_auth_scheme)) -> UUID:
     if expired_at < now:
         raise NotAuthorizedException("Expired access token")
 
-    async with bus.uow:
-        if not await bus.uow.users.exists(id=UUID(user_id), is_active=True):
-            raise NotAuthorizedException(detail="Please finish signup process for this user")
-    return UUID(user_id)
+    principal = await get_principal(bus.get_uow(), bus.principal_cache, UUID(user_id))
+    if not principal or not principal.is_active:
+        raise NotAuthorizedException(detail="Please finish signup process for this user")
+    return principal.id
 
 
 async def get_current_company_id(request: Request) -> UUID:
@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 
 from bootstrap import bus
 from domain.commands.employer.companies import (
@@ -25,10 +25,12 @@ router = APIRouter(
 
 @router.get("", response_model=List[CompanyResponse])
 async def get_companies(
+    response: Response,
     offset: Optional[int] = 0,
     limit: Optional[int] = DEFAULT_LIMIT,
     search: Optional[str] = None,
     sort_by: Optional[str] = None,
+    cursor: Optional[str] = None,
     current_employer_id: TPrimaryKey = Depends(get_current_user_id),
 ):
     """Get companies list for authenticated employer."""
@@ -37,7 +39,11 @@ async def get_companies(
     command.limit = limit
     command.search = search
     command.sort_by = sort_by
+    command.cursor = cursor
     result = await bus.handler(command, current_user_id=current_employer_id)
+    next_cursor = command.get_next_cursor(result)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return [CompanyResponse(**o.dict()) for o in result]
 
 
@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 
 from bootstrap import bus
 from domain.commands.employer.invoices import (
@@ -10,6 +10,7 @@ from domain.commands.employer.invoices import (
     EmployerInvoiceRetrieveCommand,
 )
 from domain.responses.invoices import InvoiceResponse
+from domain.responses.operations import OperationBatchResponse
 from domain.types import TPrimaryKey
 from settings import DEFAULT_LIMIT
 
@@ -23,10 +24,12 @@ router = APIRouter(
 
 @router.get("", response_model=List[InvoiceResponse])
 async def get_invoices(
+    response: Response,
     offset: Optional[int] = 0,
     limit: Optional[int] = DEFAULT_LIMIT,
     search: Optional[str] = None,
     sort_by: Optional[str] = None,
+    cursor: Optional[str] = None,
     current_employer_id: TPrimaryKey = Depends(get_current_user_id),
     current_company_id: TPrimaryKey = Depends(get_current_company_id),
 ):
@@ -36,11 +39,15 @@ async def get_invoices(
     command.limit = limit
     command.search = search
     command.sort_by = sort_by
+    command.cursor = cursor
     result = await bus.handler(
         command,
         current_user_id=current_employer_id,
         current_company_id=current_company_id,
     )
+    next_cursor = command.get_next_cursor(result)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return [InvoiceResponse(**o.dict()) for o in result]
 
 
@@ -76,16 +83,19 @@ async def pay_invoice(
     return InvoiceResponse(**result.dict())
 
 
-@router.patch("/bulk/pay", response_model=List[InvoiceResponse])
+@router.patch("/bulk/pay", response_model=OperationBatchResponse, status_code=202)
 async def pay_bulk_invoices(
     command: EmployerBulkInvoicePayCommand,
     current_employer_id: TPrimaryKey = Depends(get_current_user_id),
     current_company_id: TPrimaryKey = Depends(get_current_company_id),
 ):
-    """Pay bulk of invoices for authenticated employer."""
+    """Pay bulk of invoices for authenticated employer.
+
+    Operations are created in the background by the processor, poll /employer/operations/batches/{batch_id} for progress.
+    """
     result = await bus.handler(
         command,
         current_user_id=current_employer_id,
         current_company_id=current_company_id,
     )
-    return [InvoiceResponse(**o.dict()) for o in result]
+    return OperationBatchResponse(**result.dict())
@@ -1,10 +1,14 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 
 from bootstrap import bus
-from domain.commands.employer.operations import EmployerOperationListCommand, EmployerOperationRetrieveCommand
-from domain.responses.operations import OperationResponse
+from domain.commands.employer.operations import (
+    EmployerOperationBatchRetrieveCommand,
+    EmployerOperationListCommand,
+    EmployerOperationRetrieveCommand,
+)
+from domain.responses.operations import OperationBatchResponse, OperationResponse
 from domain.types import TPrimaryKey
 from settings import DEFAULT_LIMIT
 
@@ -18,10 +22,12 @@ router = APIRouter(
 
 @router.get("", response_model=List[OperationResponse])
 async def get_operations(
+    response: Response,
     offset: Optional[int] = 0,
     limit: Optional[int] = DEFAULT_LIMIT,
     search: Optional[str] = None,
     sort_by: Optional[str] = None,
+    cursor: Optional[str] = None,
     current_employer_id: TPrimaryKey = Depends(get_current_user_id),
     current_company_id: TPrimaryKey = Depends(get_current_company_id),
 ):
@@ -31,14 +37,33 @@ async def get_operations(
     command.limit = limit
     command.search = search
     command.sort_by = sort_by
+    command.cursor = cursor
     result = await bus.handler(
         command,
         current_user_id=current_employer_id,
         current_company_id=current_company_id,
     )
+    next_cursor = command.get_next_cursor(result)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return [OperationResponse(**o.dict()) for o in result]
 
 
+@router.get("/batches/{batch_id}", response_model=OperationBatchResponse)
+async def get_operation_batch(
+    batch_id: TPrimaryKey,
+    current_employer_id: TPrimaryKey = Depends(get_current_user_id),
+    current_company_id: TPrimaryKey = Depends(get_current_company_id),
+):
+    """Get progress of an operation batch for authenticated employer."""
+    result = await bus.handler(
+        EmployerOperationBatchRetrieveCommand(batch_id=batch_id),
+        current_user_id=current_employer_id,
+        current_company_id=current_company_id,
+    )
+    return OperationBatchResponse(**result.dict())
+
+
 @router.get("/{operation_id}", response_model=OperationResponse)
 async def get_operation(
     operation_id: TPrimaryKey,
@@ -0,0 +1,68 @@
+from datetime import date
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends
+
+from bootstrap import bus
+from domain.commands.employer.reports import (
+    EmployerPaymentsByContractorCommand,
+    EmployerPaymentsByCurrencyCommand,
+    EmployerPaymentsByMonthCommand,
+)
+from domain.responses.reports import ContractorPaymentsResponse, MonthlyPaymentsResponse, PaymentsResponse
+from domain.types import TPrimaryKey
+
+from ..dependencies import get_current_company_id, get_current_user_id
+
+router = APIRouter(
+    prefix="/employer/reports",
+    tags=["employer-reports"],
+)
+
+
+@router.get("/payments/months", response_model=List[MonthlyPaymentsResponse])
+async def get_payments_by_month(
+    from_month: Optional[date] = None,
+    to_month: Optional[date] = None,
+    current_employer_id: TPrimaryKey = Depends(get_current_user_id),
+    current_company_id: TPrimaryKey = Depends(get_current_company_id),
+):
+    """Get amounts paid by the company per month and currency."""
+    result = await bus.handler(
+        EmployerPaymentsByMonthCommand(from_month=from_month, to_month=to_month),
+        current_user_id=current_employer_id,
+        current_company_id=current_company_id,
+    )
+    return [MonthlyPaymentsResponse(**o.dict()) for o in result]
+
+
+@router.get("/payments/contractors", response_model=List[ContractorPaymentsResponse])
+async def get_payments_by_contractor(
+    from_month: Optional[date] = None,
+    to_month: Optional[date] = None,
+    current_employer_id: TPrimaryKey = Depends(get_current_user_id),
+    current_company_id: TPrimaryKey = Depends(get_current_company_id),
+):
+    """Get amounts paid by the company per contractor and currency."""
+    result = await bus.handler(
+        EmployerPaymentsByContractorCommand(from_month=from_month, to_month=to_month),
+        current_user_id=current_employer_id,
+        current_company_id=current_company_id,
+    )
+    return [ContractorPaymentsResponse(**o.dict()) for o in result]
+
+
+@router.get("/payments/currencies", response_model=List[PaymentsResponse])
+async def get_payments_by_currency(
+    from_month: Optional[date] = None,
+    to_month: Optional[date] = None,
+    current_employer_id: TPrimaryKey = Depends(get_current_user_id),
+    current_company_id: TPrimaryKey = Depends(get_current_company_id),
+):
+    """Get amounts paid by the company per currency."""
+    result = await bus.handler(
+        EmployerPaymentsByCurrencyCommand(from_month=from_month, to_month=to_month),
+        current_user_id=current_employer_id,
+        current_company_id=current_company_id,
+    )
+    return [PaymentsResponse(**o.dict()) for o in result]
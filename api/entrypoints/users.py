@@ -1,4 +1,4 @@
-from fastapi import APIRouter, BackgroundTasks, Depends, Response
+from fastapi import APIRouter, Depends, Response
 
 from bootstrap import bus
 from domain.commands.users import (
@@ -13,10 +13,6 @@ from domain.commands.users import (
     ProfileUpdateCommand,
     RefreshAccessTokenCommand,
     ResetPasswordCommand,
-    SendEmailCodeByEmailCommand,
-    SendInvitationCodeByEmailCommand,
-    SendPhoneCodeBySmsCommand,
-    SendResetPasswordCodeByEmailCommand,
     SignUpUserCommand,
     VerifyEmailCodeCommand,
     VerifyInvitationCodeAndInviteUserToCompanyCommand,
@@ -65,12 +61,9 @@ async def signup_user(
 @router.post("/send-email-code")
 async def send_email_code(
     command: GenerateEmailCodeCommand,
-    background_tasks: BackgroundTasks,
 ):
     """Send email code to verify email."""
-    result = await bus.handler(command)
-    send_command = SendEmailCodeByEmailCommand(user=result)
-    background_tasks.add_task(bus.handler, send_command)
+    await bus.handler(command)
 
 
 @router.post("/verify-email")
@@ -84,12 +77,9 @@ async def verify_email(
 @router.post("/send-phone-code")
 async def send_phone_code(
     command: GeneratePhoneCodeCommand,
-    background_tasks: BackgroundTasks,
 ):
     """Send phone code to verify email."""
-    result = await bus.handler(command)
-    send_command = SendPhoneCodeBySmsCommand(user=result)
-    background_tasks.add_task(bus.handler, send_command)
+    await bus.handler(command)
 
 
 @router.post("/verify-phone")
@@ -103,12 +93,9 @@ async def verify_phone(
 @router.post("/send-password-code")
 async def send_password_code(
     command: GenerateResetPasswordCodeCommand,
-    background_tasks: BackgroundTasks,
 ):
     """Send password code to verify email."""
-    result = await bus.handler(command)
-    send_command = SendResetPasswordCodeByEmailCommand(user=result)
-    background_tasks.add_task(bus.handler, send_command)
+    await bus.handler(command)
 
 
 @router.post("/reset-password")
@@ -159,13 +146,10 @@ async def change_password(
 @router.post("/send-invitation-code")
 async def send_invitation_code(
     command: GenerateInvitationCodeCommand,
-    background_tasks: BackgroundTasks,
     current_employer_id: TPrimaryKey = Depends(get_current_user_id),
 ):
     """Send email code to verify email. Only employer can invite to companies."""
-    result = await bus.handler(command, current_user_id=current_employer_id)
-    send_command = SendInvitationCodeByEmailCommand(invite_user_to_company=result)
-    background_tasks.add_task(bus.handler, send_command)
+    await bus.handler(command, current_user_id=current_employer_id)
 
 
 @router.post("/invite-user")
@@ -8,3 +8,7 @@ class Singleton(object):
 
     def init(self, *args, **kwargs):
         pass
+
+
+class ImproperlyConfigured(Exception):
+    pass
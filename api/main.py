@@ -3,7 +3,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
-from adapters.repositories.exceptions import ObjectDoesNotExist
+from adapters.repositories.exceptions import InvalidQueryParameter, ObjectDoesNotExist
 from bootstrap import bus
 from entrypoints.contractor.bank_accounts import router as contractor_bank_accounts_router
 from entrypoints.contractor.companies import router as contractor_companies_router
@@ -13,22 +13,29 @@ from entrypoints.employer.bank_accounts import router as employer_bank_accounts_
 from entrypoints.employer.companies import router as employer_companies_router
 from entrypoints.employer.invoices import router as employer_invoices_router
 from entrypoints.employer.operations import router as employer_operations_router
+from entrypoints.employer.reports import router as employer_reports_router
 from entrypoints.exceptions import HeaderValidationException, NotAuthorizedException
 from entrypoints.index import router as index_router
 from entrypoints.users import router as users_router
 from service_layer.exceptions import PermissionDeniedException, ValidationException
+from service_layer.messagebus.messagebus import report_unsupported_messages
 
 app = FastAPI(title="Paynica", version="0.0.1")
 
 
 @app.on_event("startup")
 async def startup():
+    report_unsupported_messages()
     await bus.uow.session.open()
+    await bus.start()
 
 
 @app.on_event("shutdown")
 async def shutdown():
+    # queued events may still need the DB
+    await bus.stop()
     await bus.uow.session.close()
+    await bus.password_hasher.close()
 
 
 @app.exception_handler(ObjectDoesNotExist)
@@ -48,6 +55,7 @@ async def not_authorized_callback(request: Request, exc: NotAuthorizedException)
 
 @app.exception_handler(ValidationException)
 @app.exception_handler(HeaderValidationException)
+@app.exception_handler(InvalidQueryParameter)
 async def validation_callback(request: Request, exc: ValidationException):
     return JSONResponse({"detail": exc.detail}, status_code=422)
 
@@ -59,6 +67,7 @@ app.include_router(employer_companies_router)
 app.include_router(employer_bank_accounts_router)
 app.include_router(employer_invoices_router)
 app.include_router(employer_operations_router)
+app.include_router(employer_reports_router)
 app.include_router(contractor_companies_router)
 app.include_router(contractor_bank_accounts_router)
 app.include_router(contractor_invoices_router)
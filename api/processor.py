@@ -0,0 +1,41 @@
+"""Operation and bulk payment processing process.
+
+Run from the api folder next to the API: ``python -m processor``
+"""
+
+import asyncio
+import logging
+import signal
+
+from bootstrap import bus, get_payment_provider, get_rate_table
+from service_layer.operations.batches import OperationBatchProcessor
+from service_layer.operations.processor import OperationProcessor
+
+
+async def main() -> None:
+    processor = OperationProcessor(
+        uow_factory=bus.get_uow, payment_provider=get_payment_provider(), publish=bus.publish
+    )
+    batch_processor = OperationBatchProcessor(uow_factory=bus.get_uow, rate_table=get_rate_table())
+    stopped = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stopped.set)
+    await bus.uow.session.open()
+    await bus.start()
+    await batch_processor.start()
+    await processor.start()
+    try:
+        await stopped.wait()
+    finally:
+        await processor.stop()
+        await batch_processor.stop()
+        await bus.stop()
+        await bus.uow.session.close()
+        logging.info("Operation batch processor stopped: %s", batch_processor.metrics)
+        logging.info("Operation processor stopped: %s", processor.metrics)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
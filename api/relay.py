@@ -0,0 +1,29 @@
+"""Outbox relay process.
+
+Run from the api folder next to the API: ``python -m relay``
+"""
+
+import asyncio
+import logging
+import signal
+
+from bootstrap import bus
+from service_layer.outbox.relay import OutboxRelay
+
+
+async def main() -> None:
+    relay = OutboxRelay(uow_factory=bus.get_uow, email_adapter=bus.email_adapter, sms_adapter=bus.sms_adapter)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, relay.stop)
+    await bus.uow.session.open()
+    try:
+        await relay.run()
+    finally:
+        await bus.uow.session.close()
+        logging.info("Outbox relay stopped: %s", relay.metrics)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -24,14 +24,17 @@ async def recipient_bank_account_list_handler(
     current_user_id: Optional[TPrimaryKey] = None,
     current_company_id: Optional[TPrimaryKey] = None,
 ) -> List[RecipientBankAccount]:
+    filters = {"recipient_currency": message.currency.value} if message.currency else {}
     async with uow:
         recipient_bank_accounts = await uow.recipient_bank_accounts.list(
             search=message.search,
             sort_by=message.sort_by,
             limit=message.limit,
             offset=message.offset,
+            cursor=message.cursor,
             recipient_owner_user_id=current_user_id,
             recipient_owner_company_id=current_company_id,
+            **filters,
         )
     return recipient_bank_accounts
 
@@ -105,11 +108,10 @@ async def recipient_bank_account_delete_handler(
     current_company_id: Optional[TPrimaryKey] = None,
 ) -> None:
     async with uow:
-        if not await uow.recipient_bank_accounts.exists(
+        if not await uow.recipient_bank_accounts.delete_where(
             id=message.recipient_bank_account_id,
             recipient_owner_user_id=current_user_id,
             recipient_owner_company_id=current_company_id,
         ):
             raise PermissionDeniedException(detail="User has no access to delete this recipient bank account")
-        await uow.recipient_bank_accounts.delete(message.recipient_bank_account_id)
         await uow.commit()
@@ -6,6 +6,7 @@ from domain.commands.contractor.companies import (
     ContractorCompanyRetrieveCommand,
 )
 from domain.models.companies import Company
+from domain.models.principals import Principal
 from domain.types import TPrimaryKey, TRole
 from service_layer.exceptions import PermissionDeniedException
 from service_layer.unit_of_work.db import DBUnitOfWork
@@ -20,13 +21,14 @@ async def company_list_handler(
     current_user_id: Optional[TPrimaryKey] = None,
 ) -> List[Company]:
     async with uow:
-        company_ids = [o.company_id for o in await uow.companies_m2m_contractors.filter(contractor_id=current_user_id)]
-        companies = await uow.companies.list(
+        companies = await uow.companies.list_for_contractor(
+            current_user_id,
             search=message.search,
             sort_by=message.sort_by,
             limit=message.limit,
             offset=message.offset,
-            id__in=company_ids,
+            cursor=message.cursor,
+            fields=("name",),
         )
     return companies
 
@@ -36,10 +38,11 @@ async def company_retrieve_handler(
     message: ContractorCompanyRetrieveCommand,
     uow: Optional[DBUnitOfWork] = None,
     current_user_id: Optional[TPrimaryKey] = None,
+    current_principal: Optional[Principal] = None,
 ) -> Company:
+    if message.company_id not in current_principal.company_ids:
+        raise PermissionDeniedException(detail=f"Contractor has no access to company with id {message.company_id}")
     async with uow:
-        if not await uow.companies_m2m_contractors.exists(contractor_id=current_user_id, company_id=message.company_id):
-            raise PermissionDeniedException(detail=f"Contractor has no access to company with id {message.company_id}")
         company = await uow.companies.get(id=message.company_id)
     return company
 
@@ -51,11 +54,9 @@ async def company_leave_handler(
     current_user_id: Optional[TPrimaryKey] = None,
 ) -> None:
     async with uow:
-        company_m2m_contractor = await uow.companies_m2m_contractors.first(
+        if not await uow.companies_m2m_contractors.delete_where(
             contractor_id=current_user_id,
             company_id=message.company_id,
-        )
-        if not company_m2m_contractor:
+        ):
             raise PermissionDeniedException(detail=f"Contractor has no access to company with id {message.company_id}")
-        await uow.companies_m2m_contractors.delete(company_m2m_contractor.id)
         await uow.commit()
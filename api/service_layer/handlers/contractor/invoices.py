@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import uuid4
 
 from domain.commands.contractor.invoices import (
@@ -8,10 +8,12 @@ from domain.commands.contractor.invoices import (
     ContractorInvoiceListCommand,
     ContractorInvoiceRetrieveCommand,
     ContractorInvoiceUpdateCommand,
+    InvoiceItemUpdate,
 )
+from domain.events.invoices import InvoiceCreated
 from domain.models.invoices import Invoice, InvoiceItem
 from domain.types import TPrimaryKey, TRole
-from service_layer.exceptions import PermissionDeniedException
+from service_layer.exceptions import PermissionDeniedException, ValidationException
 from service_layer.unit_of_work.db import DBUnitOfWork
 
 from ..permissions import has_role
@@ -30,6 +32,7 @@ async def invoice_list_handler(
             sort_by=message.sort_by,
             limit=message.limit,
             offset=message.offset,
+            cursor=message.cursor,
             created_by_id=current_user_id,
             for_company_id=current_company_id,
         )
@@ -45,11 +48,11 @@ async def invoice_retrieve_handler(
 ) -> Invoice:
     async with uow:
         invoice = await uow.invoices.get(
-            id=message.recipient_bank_account_id,
+            id=message.invoice_id,
             created_by_id=current_user_id,
             for_company_id=current_company_id,
+            prefetch=("items", "recipient_account"),
         )
-        invoice.items = await uow.invoice_items.filter(invoice_id=invoice.id)
     return invoice
 
 
@@ -68,20 +71,28 @@ async def invoice_create_handler(
             for_company_id=current_company_id,
             recipient_account_id=message.recipient_account_id,
         )
+        invoice.set_items(
+            [
+                InvoiceItem(
+                    id=uuid4(),
+                    created_date=invoice.created_date,
+                    invoice_id=invoice.id,
+                    amount=item.price,
+                    quantity=item.quantity,
+                    descripion=item.descripion,
+                )
+                for item in message.items
+            ]
+        )
         await uow.invoices.add(invoice)
-        invoice_items = []
-        for item in message.items:
-            invoice_item = InvoiceItem(
-                id=uuid4(),
-                created_date=datetime.utcnow(),
+        await uow.invoice_items.add_many(invoice.items)
+        uow.add_event(
+            InvoiceCreated(
                 invoice_id=invoice.id,
-                amount=item.amount,
-                quantity=item.quantity,
-                description=item.description,
+                created_by_id=invoice.created_by_id,
+                for_company_id=invoice.for_company_id,
             )
-            await uow.invoice_items.add(invoice_item)
-            invoice_items.append(invoice_item)
-        invoice.items = invoice_items
+        )
         await uow.commit()
     return invoice
 
@@ -94,43 +105,65 @@ async def invoice_update_handler(
     current_company_id: Optional[TPrimaryKey] = None,
 ) -> Invoice:
     async with uow:
+        # a concurrent payment of the invoice waits until the new total is committed
         invoice = await uow.invoices.get(
-            id=message.recipient_bank_account_id,
+            id=message.invoice_id,
             created_by_id=current_user_id,
             for_company_id=current_company_id,
+            lock=True,
         )
+        if invoice.operation_id:
+            raise ValidationException(detail="Paid invoice can't be updated")
         if message.recipient_account_id:
             invoice.recipient_account_id = message.recipient_account_id
         invoice.updated_date = datetime.utcnow()
+        invoice_items = await uow.invoice_items.filter(invoice_id=invoice.id)
+        new_items, updated_items, deleted_ids = diff_invoice_items(invoice, invoice_items, message.items)
+        await uow.invoice_items.add_many(new_items)
+        await uow.invoice_items.update_many(updated_items)
+        await uow.invoice_items.delete_many(deleted_ids)
+        invoice.set_items(updated_items + new_items)
         await uow.invoices.update(invoice)
-        invoice_items = await uow.invoice_items.filter(invoice_id=message.invoice_id)
-        for invoice_item in invoice_items:
-            message_invoice_item = next((i for i in message.items if i.id == invoice_item.id), None)
-            if message_invoice_item:
-                if message_invoice_item.amount is not None:
-                    invoice_item.amount = message_invoice_item.amount
-                if message_invoice_item.quantity is not None:
-                    invoice_item.quantity = message_invoice_item.quantity
-                if message_invoice_item.description is not None:
-                    invoice_item.description = message_invoice_item.description
-                invoice_item.updated_date = datetime.utcnow()
-                uow.invoice_items.update(invoice_item)
-            else:
-                uow.invoice_items.delete(invoice_item.id)
-        for message_invoice_item in message.items:
-            invoice_item = next((i for i in invoice_items if i.id == message_invoice_item.id), None)
-            if not invoice_item:
-                invoice_item = InvoiceItem(
+        await uow.commit()
+    return invoice
+
+
+def diff_invoice_items(
+    invoice: Invoice,
+    invoice_items: List[InvoiceItem],
+    message_items: List[InvoiceItemUpdate],
+) -> Tuple[List[InvoiceItem], List[InvoiceItem], List[TPrimaryKey]]:
+    """Split the requested items into items to create, update and delete in a single pass."""
+    now = datetime.utcnow()
+    existing = {item.id: item for item in invoice_items}
+    new_items, updated_items = [], []
+    for message_item in message_items:
+        if message_item.invoice_item_id is None:
+            if message_item.price is None or message_item.quantity is None or message_item.descripion is None:
+                raise ValidationException(detail="New invoice items require price, quantity and descripion")
+            new_items.append(
+                InvoiceItem(
                     id=uuid4(),
-                    created_date=datetime.utcnow(),
+                    created_date=now,
                     invoice_id=invoice.id,
-                    amount=message_invoice_item.amount,
-                    quantity=message_invoice_item.quantity,
-                    description=message_invoice_item.description,
+                    amount=message_item.price,
+                    quantity=message_item.quantity,
+                    descripion=message_item.descripion,
                 )
-                uow.invoice_items.add(invoice_item)
-        await uow.commit()
-    return invoice
+            )
+            continue
+        invoice_item = existing.pop(message_item.invoice_item_id, None)
+        if not invoice_item:
+            raise ValidationException(detail=f"Invoice item {message_item.invoice_item_id} doesn't exist")
+        if message_item.price is not None:
+            invoice_item.amount = message_item.price
+        if message_item.quantity is not None:
+            invoice_item.quantity = message_item.quantity
+        if message_item.descripion is not None:
+            invoice_item.descripion = message_item.descripion
+        invoice_item.updated_date = now
+        updated_items.append(invoice_item)
+    return new_items, updated_items, list(existing)
 
 
 @has_role(role=TRole.CONTRACTOR)
@@ -141,14 +174,17 @@ async def invoice_delete_handler(
     current_company_id: Optional[TPrimaryKey] = None,
 ) -> None:
     async with uow:
-        if not await uow.invoices.exists(
+        invoice = await uow.invoices.first(
             id=message.invoice_id,
             created_by_id=current_user_id,
             for_company_id=current_company_id,
-        ):
+            fields=("operation_id",),
+            lock=True,
+        )
+        if not invoice:
             raise PermissionDeniedException(detail="User has no access to delete this invoice")
-        invoice_items = await uow.invoice_items.filter(invoice_id=message.invoice_id)
-        for item in invoice_items:
-            await uow.invoice_items.delete(item.id)
+        if invoice.operation_id:
+            raise ValidationException(detail="Paid invoice can't be deleted")
+        await uow.invoice_items.delete_where(invoice_id=message.invoice_id)
         await uow.invoices.delete(message.invoice_id)
         await uow.commit()
@@ -1,7 +1,9 @@
 from typing import List, Optional
 
 from domain.commands.contractor.operations import ContractorOperationListCommand, ContractorOperationRetrieveCommand
-from domain.models.operations import Operation
+from domain.events.operations import OperationStatusChanged
+from domain.models.operations import OPERATION_STATUS_TRANSITIONS, Operation
+from domain.models.outbox import OutboxMessage
 from domain.types import TPrimaryKey, TRole
 from service_layer.unit_of_work.db import DBUnitOfWork
 
@@ -15,14 +17,18 @@ async def operation_list_handler(
     current_user_id: Optional[TPrimaryKey] = None,
     current_company_id: Optional[TPrimaryKey] = None,
 ) -> List[Operation]:
+    # enums are filtered by exact match, status is indexed
+    filters = {"status": message.status.value} if message.status else {}
     async with uow:
         operations = await uow.operations.list(
             search=message.search,
             sort_by=message.sort_by,
             limit=message.limit,
             offset=message.offset,
+            cursor=message.cursor,
             operation_recipient_user_id=current_user_id,
             operation_owner_company_id=current_company_id,
+            **filters,
         )
     return operations
 
@@ -36,10 +42,27 @@ async def operation_retrieve_handler(
 ) -> Operation:
     async with uow:
         operation = await uow.operations.get(
-            id=message.recipient_bank_account_id,
+            id=message.operation_id,
             operation_recipient_user_id=current_user_id,
             operation_owner_company_id=current_company_id,
+            prefetch=("sender_account", "recipient_account"),
         )
-        operation.sender_account = await uow.sender_bank_accounts.get(id=operation.sender_account_id)
-        operation.recipient_account = await uow.recipient_bank_accounts.get(id=operation.recipient_account_id)
     return operation
+
+
+async def send_operation_finished_by_email_handler(
+    message: OperationStatusChanged,
+    uow: Optional[DBUnitOfWork] = None,
+) -> None:
+    # contractors are emailed once their payment reaches a final status
+    if OPERATION_STATUS_TRANSITIONS.get(message.status):
+        return
+    async with uow:
+        operation = await uow.operations.get(id=message.operation_id)
+        user = await uow.users.get(id=operation.operation_recipient_user_id)
+        await uow.outbox.add(
+            OutboxMessage.email(
+                user.email, "Payment update", f"Payment {operation.id} is {message.status.value.lower()}"
+            )
+        )
+        await uow.commit()
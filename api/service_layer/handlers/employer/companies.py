@@ -5,7 +5,7 @@ from uuid import uuid4
 from domain.commands.employer.companies import EmployerCompanyCreateCommand, EmployerCompanyListCommand
 from domain.models.companies import Company, CompanyM2MEmployer
 from domain.types import TPrimaryKey, TRole
-from service_layer.exceptions import PermissionDeniedException, ValidationException
+from service_layer.exceptions import ValidationException
 from service_layer.unit_of_work.db import DBUnitOfWork
 
 from ..permissions import has_role
@@ -17,7 +17,17 @@ async def company_list_handler(
     uow: Optional[DBUnitOfWork] = None,
     current_user_id: Optional[TPrimaryKey] = None,
 ) -> List[Company]:
-    return []
+    async with uow:
+        companies = await uow.companies.list_for_employer(
+            current_user_id,
+            search=message.search,
+            sort_by=message.sort_by,
+            limit=message.limit,
+            offset=message.offset,
+            cursor=message.cursor,
+            fields=("name",),
+        )
+    return companies
 
 
 @has_role(role=TRole.EMPLOYER)
@@ -27,8 +37,6 @@ async def company_create_handler(
     current_user_id: Optional[TPrimaryKey] = None,
 ) -> Company:
     async with uow:
-        if await uow.users.exists(id=current_user_id, role=TRole.CONTRACTOR):
-            raise PermissionDeniedException(detail="Contractor cannot create a company")
         if not message.name:
             raise ValidationException(detail="Empty name")
         if await uow.companies.exists(name=message.name, owner_id=current_user_id):
@@ -0,0 +1,98 @@
+from datetime import datetime
+from typing import List, Optional, Sequence
+from uuid import uuid4
+
+from domain.commands.employer.invoices import EmployerBulkInvoicePayCommand
+from domain.events.invoices import InvoiceCreated
+from domain.models.invoices import InvoicePayment
+from domain.models.operations import OperationBatch, OperationBatchInvoice
+from domain.models.outbox import OutboxMessage
+from domain.types import TOperationBatchStatus, TPrimaryKey, TRole
+from service_layer.exceptions import ValidationException
+from service_layer.operations.batches import UNFINISHED_STATUSES
+from service_layer.unit_of_work.db import DBUnitOfWork
+
+from ..permissions import has_role
+
+
+def get_payment_errors(
+    invoice_ids: Sequence[TPrimaryKey],
+    payments: List[InvoicePayment],
+    company_id: TPrimaryKey,
+    queued_invoice_ids: Sequence[TPrimaryKey] = (),
+) -> List[str]:
+    found = {p.invoice_id for p in payments}
+    queued = set(queued_invoice_ids)
+    checks = (
+        ("Invoices don't exist", [pk for pk in invoice_ids if pk not in found]),
+        ("Invoices are already paid", [p.invoice_id for p in payments if p.operation_id]),
+        ("Invoices are already being paid", [pk for pk in invoice_ids if pk in queued]),
+        (
+            "Invoices don't have a sender bank account of this company",
+            [p.invoice_id for p in payments if p.sender_owner_company_id != company_id],
+        ),
+    )
+    return [f"{error}: {', '.join(map(str, pks))}" for error, pks in checks if pks]
+
+
+@has_role(role=TRole.EMPLOYER)
+async def invoice_bulk_pay_handler(
+    message: EmployerBulkInvoicePayCommand,
+    uow: Optional[DBUnitOfWork] = None,
+    current_user_id: Optional[TPrimaryKey] = None,
+    current_company_id: Optional[TPrimaryKey] = None,
+) -> OperationBatch:
+    invoice_ids = list(dict.fromkeys(message.invoice_ids))
+    if not invoice_ids:
+        raise ValidationException(detail="No invoices to pay")
+    async with uow:
+        # locked invoices make concurrent requests for them wait until this batch is queued
+        payments = await uow.invoices.get_payments(
+            invoice_ids, current_company_id, message.sender_account_id, lock=True
+        )
+        queued_invoice_ids = await uow.operation_batch_invoices.get_queued_invoice_ids(invoice_ids, UNFINISHED_STATUSES)
+        errors = get_payment_errors(invoice_ids, payments, current_company_id, queued_invoice_ids)
+        if errors:
+            raise ValidationException(detail="; ".join(errors))
+        batch = OperationBatch(
+            id=uuid4(),
+            created_date=datetime.utcnow(),
+            company_id=current_company_id,
+            created_by_id=current_user_id,
+            sender_account_id=message.sender_account_id,
+            status=TOperationBatchStatus.NEW,
+            invoices_count=len(invoice_ids),
+        )
+        await uow.operation_batches.add(batch)
+        await uow.operation_batch_invoices.add_many(
+            [
+                OperationBatchInvoice(
+                    id=uuid4(),
+                    created_date=batch.created_date,
+                    batch_id=batch.id,
+                    invoice_id=invoice_id,
+                    position=position,
+                )
+                for position, invoice_id in enumerate(invoice_ids)
+            ]
+        )
+        # invoices are paid by OperationBatchProcessor, the batch is polled for progress
+        await uow.commit()
+    return batch
+
+
+async def send_invoice_created_by_email_handler(
+    message: InvoiceCreated,
+    uow: Optional[DBUnitOfWork] = None,
+) -> None:
+    async with uow:
+        employers = await uow.companies_m2m_employers.filter(company_id=message.for_company_id)
+        users = await uow.users.filter(id__in=[e.employer_id for e in employers], is_active=True, fields=("email",))
+        # the worker pool only fans the invoice out, emails are delivered by the outbox relay
+        await uow.outbox.add_many(
+            [
+                OutboxMessage.email(user.email, "New invoice", f"Invoice {message.invoice_id} is waiting for payment")
+                for user in users
+            ]
+        )
+        await uow.commit()
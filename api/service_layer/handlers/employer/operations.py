@@ -0,0 +1,20 @@
+from typing import Optional
+
+from domain.commands.employer.operations import EmployerOperationBatchRetrieveCommand
+from domain.models.operations import OperationBatch
+from domain.types import TPrimaryKey, TRole
+from service_layer.unit_of_work.db import DBUnitOfWork
+
+from ..permissions import has_role
+
+
+@has_role(role=TRole.EMPLOYER)
+async def operation_batch_retrieve_handler(
+    message: EmployerOperationBatchRetrieveCommand,
+    uow: Optional[DBUnitOfWork] = None,
+    current_user_id: Optional[TPrimaryKey] = None,
+    current_company_id: Optional[TPrimaryKey] = None,
+) -> OperationBatch:
+    async with uow:
+        batch = await uow.operation_batches.get(id=message.batch_id, company_id=current_company_id)
+    return batch
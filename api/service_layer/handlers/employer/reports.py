@@ -0,0 +1,74 @@
+from datetime import date, datetime
+from typing import List, Optional, Sequence, Tuple
+
+from domain.commands.employer.reports import (
+    EmployerPaymentsByContractorCommand,
+    EmployerPaymentsByCurrencyCommand,
+    EmployerPaymentsByMonthCommand,
+    EmployerPaymentsReportCommand,
+)
+from domain.models.reports import PaymentReportRow
+from domain.types import TPrimaryKey, TRole
+from service_layer.exceptions import ValidationException
+from service_layer.unit_of_work.db import DBUnitOfWork
+from settings import REPORT_MAX_MONTHS, REPORT_MONTHS
+
+from ..permissions import has_role
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def get_report_months(message: EmployerPaymentsReportCommand) -> Tuple[date, date]:
+    # reports cover a bounded range of months, so they cost the same however long the history is
+    to_month = (message.to_month or datetime.utcnow().date()).replace(day=1)
+    from_month = (message.from_month or add_months(to_month, 1 - REPORT_MONTHS)).replace(day=1)
+    if from_month > to_month:
+        raise ValidationException(detail="from_month is after to_month")
+    if from_month < add_months(to_month, 1 - REPORT_MAX_MONTHS):
+        raise ValidationException(detail=f"Reports cover at most {REPORT_MAX_MONTHS} months")
+    return from_month, to_month
+
+
+async def get_report(
+    message: EmployerPaymentsReportCommand,
+    uow: DBUnitOfWork,
+    company_id: TPrimaryKey,
+    group_by: Sequence[str],
+) -> List[PaymentReportRow]:
+    from_month, to_month = get_report_months(message)
+    async with uow:
+        rows = await uow.payment_summaries.report(company_id, group_by, from_month, to_month)
+    return rows
+
+
+@has_role(role=TRole.EMPLOYER)
+async def payments_by_month_handler(
+    message: EmployerPaymentsByMonthCommand,
+    uow: Optional[DBUnitOfWork] = None,
+    current_user_id: Optional[TPrimaryKey] = None,
+    current_company_id: Optional[TPrimaryKey] = None,
+) -> List[PaymentReportRow]:
+    return await get_report(message, uow, current_company_id, ("month", "currency"))
+
+
+@has_role(role=TRole.EMPLOYER)
+async def payments_by_contractor_handler(
+    message: EmployerPaymentsByContractorCommand,
+    uow: Optional[DBUnitOfWork] = None,
+    current_user_id: Optional[TPrimaryKey] = None,
+    current_company_id: Optional[TPrimaryKey] = None,
+) -> List[PaymentReportRow]:
+    return await get_report(message, uow, current_company_id, ("contractor_id", "currency"))
+
+
+@has_role(role=TRole.EMPLOYER)
+async def payments_by_currency_handler(
+    message: EmployerPaymentsByCurrencyCommand,
+    uow: Optional[DBUnitOfWork] = None,
+    current_user_id: Optional[TPrimaryKey] = None,
+    current_company_id: Optional[TPrimaryKey] = None,
+) -> List[PaymentReportRow]:
+    return await get_report(message, uow, current_company_id, ("currency",))
@@ -1,24 +1,74 @@
+import inspect
 from functools import wraps
 from typing import Optional
 
-from domain.types import TRole
+from adapters.principal_cache.generic import AbstractPrincipalCache
+from domain.models.principals import Principal
+from domain.types import TPrimaryKey, TRole
 from service_layer.exceptions import PermissionDeniedException, ServiceException
+from service_layer.unit_of_work.generic import AbstractUnitOfWork
+
+
+async def get_principal(
+    uow: AbstractUnitOfWork,
+    principal_cache: Optional[AbstractPrincipalCache],
+    user_id: TPrimaryKey,
+) -> Optional[Principal]:
+    # only role and is_active are cached, they are shared by all workers and change rarely
+    if principal_cache:
+        principal = await principal_cache.get(user_id)
+        if principal:
+            return principal
+    async with uow:
+        # runs on every request, so only the columns the principal needs are read
+        user = await uow.users.first(id=user_id, fields=("role", "is_active"))
+    if not user:
+        return None
+    principal = Principal(id=user.id, role=user.role, is_active=user.is_active)
+    if principal_cache:
+        await principal_cache.set(principal)
+    return principal
+
+
+async def get_principal_with_companies(
+    uow: AbstractUnitOfWork,
+    principal_cache: Optional[AbstractPrincipalCache],
+    user_id: TPrimaryKey,
+) -> Optional[Principal]:
+    principal = await get_principal(uow, principal_cache, user_id)
+    if not principal:
+        return None
+    # memberships are loaded for every message, so a worker never sees companies the user has left
+    async with uow:
+        if principal.role == TRole.EMPLOYER:
+            companies_m2m = await uow.companies_m2m_employers.filter(employer_id=user_id, fields=("company_id",))
+        else:
+            companies_m2m = await uow.companies_m2m_contractors.filter(contractor_id=user_id, fields=("company_id",))
+    return principal.copy(update={"company_ids": {o.company_id for o in companies_m2m}})
 
 
 def has_role(function=None, role: Optional[TRole] = TRole.EMPLOYER):
     def decorator(fn):
+        fn_params = inspect.signature(fn).parameters
+
         @wraps(fn)
         async def wrap(*args, **kwargs):
-            uow = kwargs.get("uow")
             current_user_id = kwargs.get("current_user_id")
-            if not uow:
-                raise ServiceException(detail="No uow in arguments")
+            current_company_id = kwargs.get("current_company_id")
+            if "current_principal" in fn_params:
+                current_principal = kwargs.get("current_principal")
+            else:
+                current_principal = kwargs.pop("current_principal", None)
             if not current_user_id:
                 raise ServiceException(detail="No current_user_id in arguments")
-            if not await uow.users.exists(id=current_user_id, role=role):
+            if not current_principal or current_principal.role != role:
                 raise PermissionDeniedException(detail=f"User dosn't have role {role}")
+            if current_company_id and current_company_id not in current_principal.company_ids:
+                raise PermissionDeniedException(detail=f"User has no access to company with id {current_company_id}")
             return await fn(*args, **kwargs)
 
+        # dependencies which message bus has to pass to the wrapper besides the handler parameters
+        wrap.dependencies = ("current_principal",)
         return wrap
 
     if function:
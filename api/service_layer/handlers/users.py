@@ -4,8 +4,8 @@ from uuid import UUID, uuid4
 
 import jwt
 
-from adapters.email.email import EmailAdapter
-from adapters.sms.sms import SmsAdapter
+from adapters.password_hasher.generic import AbstractPasswordHasher
+from adapters.principal_cache.generic import AbstractPrincipalCache
 from domain.commands.users import (
     ChangePasswordCommand,
     GenerateAccessTokenCommand,
@@ -18,16 +18,14 @@ from domain.commands.users import (
     ProfileUpdateCommand,
     RefreshAccessTokenCommand,
     ResetPasswordCommand,
-    SendEmailCodeByEmailCommand,
-    SendInvitationCodeByEmailCommand,
-    SendPhoneCodeBySmsCommand,
-    SendResetPasswordCodeByEmailCommand,
     SignUpUserCommand,
     VerifyEmailCodeCommand,
     VerifyInvitationCodeAndInviteUserToCompanyCommand,
     VerifyPhoneCodeCommand,
 )
 from domain.models.companies import CompanyM2MContractor, CompanyM2MEmployer, InviteUserToCompany
+from domain.models.outbox import OutboxMessage
+from domain.models.principals import Principal
 from domain.models.users import User
 from domain.responses.users import GenerateAccessTokenResponse, RefreshAccessTokenResponse
 from domain.types import TPrimaryKey, TRole
@@ -40,12 +38,13 @@ from ..exceptions import PermissionDeniedException, ValidationException
 async def generate_access_token_handler(
     message: GenerateAccessTokenCommand,
     uow: Optional[DBUnitOfWork] = None,
+    password_hasher: Optional[AbstractPasswordHasher] = None,
 ) -> GenerateAccessTokenResponse:
     async with uow:
         user = await uow.users.get(email=message.email)
         if not user.is_active:
             raise PermissionDeniedException(detail="Please finish signup process for this user")
-        if not await user.verify_password(message.password) or not user.is_active:
+        if not await user.verify_password(message.password, password_hasher.hash) or not user.is_active:
             raise PermissionDeniedException(detail="Invalid credentials")
 
     now = datetime.utcnow()
@@ -124,32 +123,33 @@ async def refresh_access_token_handler(
 async def signup_user_handler(
     message: SignUpUserCommand,
     uow: Optional[DBUnitOfWork] = None,
+    password_hasher: Optional[AbstractPasswordHasher] = None,
 ) -> User:
+    user = User(
+        id=uuid4(),
+        created_date=datetime.utcnow(),
+        email=message.email,
+        role=message.role,
+        is_active=False,
+        is_onboarded=False,
+    )
+    await user.set_password(message.password, password_hasher.hash)
     async with uow:
-        if await uow.users.exists(email=message.email, is_active=True):
+        # an inactive user with the same role signs up again with a new password
+        stored_user = await uow.users.upsert(
+            user,
+            conflict_fields=("email",),
+            update_fields=("password",),
+            role=message.role,
+            is_active=False,
+        )
+        if not stored_user:
+            existing_user = await uow.users.first(email=message.email, fields=("is_active",))
+            if existing_user and not existing_user.is_active:
+                raise ValidationException(detail="User with other role and this email already exists")
             raise ValidationException(detail="Active user with this email already exists")
-
-        other_role = TRole.CONTRACTOR if message.role == TRole.EMPLOYER else TRole.EMPLOYER
-        if await uow.users.exists(email=message.email, role=other_role):
-            raise ValidationException(detail="User with other role and this email already exists")
-
-        user = await uow.users.first(email=message.email, role=message.role, is_active=False)
-        if user:
-            await user.set_password(message.password)
-            await uow.users.update(user)
-        else:
-            user = User(
-                id=uuid4(),
-                created_date=datetime.utcnow(),
-                email=message.email,
-                role=message.role,
-                is_active=False,
-                is_onboarded=False,
-            )
-            await user.set_password(message.password)
-            await uow.users.add(user)
         await uow.commit()
-    return user
+    return stored_user
 
 
 async def generate_email_code_handler(
@@ -163,24 +163,17 @@ async def generate_email_code_handler(
         await user.randomly_set_email_code()
         user.updated_date = datetime.utcnow()
         await uow.users.update(user)
+        await uow.outbox.add(
+            OutboxMessage.email(user.email, "Email verification", f"Verification code: {user.email_code}")
+        )
         await uow.commit()
     return user
 
 
-async def send_email_code_by_email_handler(
-    message: SendEmailCodeByEmailCommand,
-    email_adapter: Optional[EmailAdapter] = None,
-) -> None:
-    await email_adapter.send(
-        message.user.email,
-        "Email verification",
-        f"Verification code: {message.user.email_code}",
-    )
-
-
 async def verify_email_code_handler(
     message: VerifyEmailCodeCommand,
     uow: Optional[DBUnitOfWork] = None,
+    principal_cache: Optional[AbstractPrincipalCache] = None,
 ) -> User:
     async with uow:
         user = await uow.users.get(email_code=message.email_code)
@@ -189,6 +182,8 @@ async def verify_email_code_handler(
         user.updated_date = datetime.utcnow()
         await uow.users.update(user)
         await uow.commit()
+    if principal_cache:
+        await principal_cache.invalidate(user.id)
     return user
 
 
@@ -203,23 +198,15 @@ async def generate_phone_code_handler(
         await user.randomly_set_phone_code()
         user.updated_date = datetime.utcnow()
         await uow.users.update(user)
+        await uow.outbox.add(OutboxMessage.sms(user.phone, f"Code: {user.phone_code}"))
         await uow.commit()
     return user
 
 
-async def send_phone_code_by_sms_handler(
-    message: SendPhoneCodeBySmsCommand,
-    sms_adapter: Optional[SmsAdapter] = None,
-) -> None:
-    await sms_adapter.send(
-        message.user.phone,
-        f"Code: {message.user.phone_code}",
-    )
-
-
 async def verify_phone_code_handler(
     message: VerifyPhoneCodeCommand,
     uow: Optional[DBUnitOfWork] = None,
+    principal_cache: Optional[AbstractPrincipalCache] = None,
 ) -> User:
     async with uow:
         user = await uow.users.get(phone_code=message.phone_code)
@@ -228,6 +215,8 @@ async def verify_phone_code_handler(
         user.updated_date = datetime.utcnow()
         await uow.users.update(user)
         await uow.commit()
+    if principal_cache:
+        await principal_cache.invalidate(user.id)
     return user
 
 
@@ -240,28 +229,21 @@ async def generate_reset_password_code_handler(
         await user.randomly_set_password_code()
         user.updated_date = datetime.utcnow()
         await uow.users.update(user)
+        await uow.outbox.add(
+            OutboxMessage.email(user.email, "Reset password", f"Verification code: {user.password_code}")
+        )
         await uow.commit()
     return user
 
 
-async def send_reset_password_code_handler(
-    message: SendResetPasswordCodeByEmailCommand,
-    email_adapter: Optional[EmailAdapter] = None,
-) -> None:
-    await email_adapter.send(
-        message.user.email,
-        "Reset password",
-        f"Verification code: {message.user.password_code}",
-    )
-
-
 async def reset_password_handler(
     message: ResetPasswordCommand,
     uow: Optional[DBUnitOfWork] = None,
+    password_hasher: Optional[AbstractPasswordHasher] = None,
 ) -> Optional[User]:
     async with uow:
         user = await uow.users.get(password_code=message.password_code)
-        await user.set_password(message.password)
+        await user.set_password(message.password, password_hasher.hash)
         user.updated_date = datetime.utcnow()
         await uow.users.update(user)
         await uow.commit()
@@ -272,6 +254,7 @@ async def generate_invitation_code_handler(
     message: GenerateInvitationCodeCommand,
     uow: Optional[DBUnitOfWork] = None,
     current_user_id: Optional[TPrimaryKey] = None,
+    current_principal: Optional[Principal] = None,
 ) -> InviteUserToCompany:
     invite_user_to_company = InviteUserToCompany(
         id=uuid4(),
@@ -280,57 +263,48 @@ async def generate_invitation_code_handler(
         email=message.email,
         created_date=datetime.utcnow(),
     )
+    await invite_user_to_company.randomly_set_invitation_code()
     async with uow:
-        if not await uow.companies.exists(id=message.company_id):
+        preconditions = await uow.invite_users_to_companies.get_preconditions(message.company_id, message.email)
+        if not preconditions.company_exists:
             raise ValidationException(detail="Company with this company_id doesn't exist")
-        sender_user = await uow.users.first(id=current_user_id)
-        if sender_user.role == TRole.EMPLOYER and not await uow.companies_m2m_employers.exists(
-            company_id=message.company_id, employer_id=sender_user.id
-        ):
-            raise ValidationException(detail="Company with this company_id doesn't have authenticated current user")
-        if sender_user.role == TRole.CONTRACTOR and not await uow.companies_m2m_contractors.exists(
-            company_id=message.company_id, contractor_id=sender_user.id
-        ):
+        if message.company_id not in current_principal.company_ids:
             raise ValidationException(detail="Company with this company_id doesn't have authenticated current user")
+        if preconditions.user_in_company:
+            raise ValidationException(detail="User is already in this company")
+        if preconditions.invitation_exists:
+            raise ValidationException(detail="Invitation with this email and company_id already exists")
 
-        user = await uow.users.first(email=invite_user_to_company.email)
-        if not user:
-            user = User(
-                id=uuid4(),
-                created_date=datetime.utcnow(),
-                email=message.email,
-                role=TRole.CONTRACTOR,
-                is_active=False,
-                is_onboarded=False,
+        if not preconditions.user_id:
+            await uow.users.get_or_create(
+                User(
+                    id=uuid4(),
+                    created_date=datetime.utcnow(),
+                    email=message.email,
+                    role=TRole.CONTRACTOR,
+                    is_active=False,
+                    is_onboarded=False,
+                ),
+                conflict_fields=("email",),
             )
-            await uow.users.add(user)
-        if user.role == TRole.EMPLOYER and await uow.companies_m2m_employers.exists(
-            company_id=message.company_id, employer_id=user.id
-        ):
-            raise ValidationException(detail="User is already in this company")
-        if user.role == TRole.CONTRACTOR and await uow.companies_m2m_contractors.exists(
-            company_id=message.company_id, contractor_id=user.id
-        ):
-            raise ValidationException(detail="User is already in this company")
-        if await uow.invite_users_to_companies.exists(email=message.email, company_id=message.company_id):
+        # concurrent invitations are caught by the unique email and company_id
+        invite_user_to_company, created = await uow.invite_users_to_companies.get_or_create(
+            invite_user_to_company,
+            conflict_fields=("email", "company_id"),
+        )
+        if not created:
             raise ValidationException(detail="Invitation with this email and company_id already exists")
-        await invite_user_to_company.randomly_set_invitation_code()
-        await uow.invite_users_to_companies.add(invite_user_to_company)
+        await uow.outbox.add(
+            OutboxMessage.email(
+                invite_user_to_company.email,
+                "Invitation",
+                f"Invitation code: {invite_user_to_company.invitation_code}",
+            )
+        )
         await uow.commit()
     return invite_user_to_company
 
 
-async def send_invitation_code_by_email_handler(
-    message: SendInvitationCodeByEmailCommand,
-    email_adapter: Optional[EmailAdapter] = None,
-) -> None:
-    await email_adapter.send(
-        message.invite_user_to_company.email,
-        "Invitation",
-        f"Invitation code: {message.invite_user_to_company.invitation_code}",
-    )
-
-
 async def invite_user_handler(
     message: VerifyInvitationCodeAndInviteUserToCompanyCommand,
     uow: Optional[DBUnitOfWork] = None,
@@ -363,6 +337,7 @@ async def profile_update_handler(
     message: ProfileUpdateCommand,
     uow: Optional[DBUnitOfWork] = None,
     current_user_id: Optional[TPrimaryKey] = None,
+    principal_cache: Optional[AbstractPrincipalCache] = None,
 ) -> User:
     async with uow:
         user = await uow.users.get(id=current_user_id)
@@ -387,6 +362,8 @@ async def profile_update_handler(
         user.updated_date = datetime.utcnow()
         await uow.users.update(user)
         await uow.commit()
+    if principal_cache:
+        await principal_cache.invalidate(user.id)
     return user
 
 
@@ -404,21 +381,25 @@ async def profile_delete_handler(
     message: ProfileDeleteCommand,
     uow: Optional[DBUnitOfWork] = None,
     current_user_id: Optional[TPrimaryKey] = None,
+    principal_cache: Optional[AbstractPrincipalCache] = None,
 ) -> TPrimaryKey:
     async with uow:
         await uow.users.delete(current_user_id)
         await uow.commit()
+    if principal_cache:
+        await principal_cache.invalidate(current_user_id)
     return current_user_id
 
 
 async def change_password_handler(
     message: ChangePasswordCommand,
     uow: Optional[DBUnitOfWork] = None,
+    password_hasher: Optional[AbstractPasswordHasher] = None,
     current_user_id: Optional[TPrimaryKey] = None,
 ) -> User:
     async with uow:
         user = await uow.users.get(id=current_user_id)
-        await user.set_password(message.password)
+        await user.set_password(message.password, password_hasher.hash)
         user.updated_date = datetime.utcnow()
         await uow.users.update(user)
         await uow.commit()
@@ -1,24 +1,42 @@
 import abc
-from typing import Optional
+from typing import Callable, Optional
 
 from pydantic.types import UUID4
 
 from adapters.email.email import EmailAdapter
+from adapters.principal_cache.generic import AbstractPrincipalCache
 from adapters.repositories.generic import AbstractRepository
 from adapters.sms.sms import SmsAdapter
 from service_layer.handlers.generic import AbstractMessage
 from service_layer.unit_of_work.db import DBUnitOfWork
 
+from .workers import EventWorkerPool
+
 
 class AbstractMessageBus(abc.ABC):
     uow: DBUnitOfWork
+    uow_factory: Optional[Callable[[], DBUnitOfWork]]
     sms_adapter: SmsAdapter
     email_adapter: EmailAdapter
+    principal_cache: Optional[AbstractPrincipalCache]
+    event_workers: EventWorkerPool
+
+    @abc.abstractmethod
+    def get_uow(self) -> DBUnitOfWork:
+        raise NotImplementedError
 
     @abc.abstractmethod
     async def clean(self) -> None:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    async def start(self) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def stop(self) -> None:
+        raise NotImplementedError
+
     @abc.abstractmethod
     async def handler(self, message: AbstractMessage, current_user_pk: Optional[UUID4] = None) -> AbstractRepository:
         raise NotImplementedError
@@ -1,9 +1,15 @@
 import inspect
-from typing import Optional
+import logging
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from pydantic.types import UUID4
 
 from adapters.email.generic import AbstractEmailAdapter
+from adapters.password_hasher.generic import AbstractPasswordHasher
+from adapters.payment_provider.generic import AbstractPaymentProvider
+from adapters.principal_cache.generic import AbstractPrincipalCache
+from adapters.rate_table.generic import AbstractRateTable
 from adapters.sms.generic import AbstractSmsAdapter
 from domain.commands import users as users_commands
 from domain.commands.contractor import bank_accounts as contractor_bank_accounts_commands
@@ -14,6 +20,10 @@ from domain.commands.employer import bank_accounts as employer_bank_accounts_com
 from domain.commands.employer import companies as employer_companies_commands
 from domain.commands.employer import invoices as employer_invoices_commands
 from domain.commands.employer import operations as employer_operations_commands
+from domain.commands.employer import reports as employer_reports_commands
+from domain.events import invoices as invoices_events
+from domain.events import operations as operations_events
+from domain.events.generic import AbstractEvent
 from domain.responses.generic import AbstractReponse
 from service_layer.exceptions import ServiceException
 from service_layer.handlers import users as users_handlers
@@ -22,10 +32,15 @@ from service_layer.handlers.contractor import companies as contractor_companies_
 from service_layer.handlers.contractor import invoices as contractor_invoices_handlers
 from service_layer.handlers.contractor import operations as contractor_operations_handlers
 from service_layer.handlers.employer import companies as employer_companies_handlers
+from service_layer.handlers.employer import invoices as employer_invoices_handlers
+from service_layer.handlers.employer import operations as employer_operations_handlers
+from service_layer.handlers.employer import reports as employer_reports_handlers
 from service_layer.handlers.generic import AbstractMessage
+from service_layer.handlers.permissions import get_principal_with_companies
 from service_layer.unit_of_work.generic import AbstractUnitOfWork
 
 from .generic import AbstractMessageBus
+from .workers import EventWorkerPool
 
 COMMANDS = {
     # sign in process
@@ -35,19 +50,15 @@ COMMANDS = {
     users_commands.SignUpUserCommand: users_handlers.signup_user_handler,
     # email verification and user activation
     users_commands.GenerateEmailCodeCommand: users_handlers.generate_email_code_handler,
-    users_commands.SendEmailCodeByEmailCommand: users_handlers.send_email_code_by_email_handler,
     users_commands.VerifyEmailCodeCommand: users_handlers.verify_email_code_handler,
     # phone verification and user activation
     users_commands.GeneratePhoneCodeCommand: users_handlers.generate_phone_code_handler,
-    users_commands.SendPhoneCodeBySmsCommand: users_handlers.send_phone_code_by_sms_handler,
     users_commands.VerifyPhoneCodeCommand: users_handlers.verify_phone_code_handler,
     # reset password process
     users_commands.GenerateResetPasswordCodeCommand: users_handlers.generate_reset_password_code_handler,
-    users_commands.SendResetPasswordCodeByEmailCommand: users_handlers.send_reset_password_code_handler,
     users_commands.ResetPasswordCommand: users_handlers.reset_password_handler,
     # invitation process
     users_commands.GenerateInvitationCodeCommand: users_handlers.generate_invitation_code_handler,
-    users_commands.SendInvitationCodeByEmailCommand: users_handlers.send_invitation_code_by_email_handler,
     users_commands.VerifyInvitationCodeAndInviteUserToCompanyCommand: users_handlers.invite_user_handler,
     # profile
     users_commands.ProfileUpdateCommand: users_handlers.profile_update_handler,
@@ -79,7 +90,7 @@ COMMANDS = {
     employer_invoices_commands.EmployerInvoiceListCommand: None,
     employer_invoices_commands.EmployerInvoiceRetrieveCommand: None,
     employer_invoices_commands.EmployerInvoicePayCommand: None,
-    employer_invoices_commands.EmployerBulkInvoicePayCommand: None,
+    employer_invoices_commands.EmployerBulkInvoicePayCommand: employer_invoices_handlers.invoice_bulk_pay_handler,
     contractor_invoices_commands.ContractorInvoiceListCommand: contractor_invoices_handlers.invoice_list_handler,
     contractor_invoices_commands.ContractorInvoiceCreateCommand: contractor_invoices_handlers.invoice_create_handler,
     contractor_invoices_commands.ContractorInvoiceUpdateCommand: contractor_invoices_handlers.invoice_update_handler,
@@ -88,17 +99,60 @@ COMMANDS = {
     # operations
     employer_operations_commands.EmployerOperationListCommand: None,
     employer_operations_commands.EmployerOperationRetrieveCommand: None,
+    employer_operations_commands.EmployerOperationBatchRetrieveCommand: employer_operations_handlers.operation_batch_retrieve_handler,
     contractor_operations_commands.ContractorOperationListCommand: contractor_operations_handlers.operation_list_handler,
     contractor_operations_commands.ContractorOperationRetrieveCommand: contractor_operations_handlers.operation_retrieve_handler,
+    # reports
+    employer_reports_commands.EmployerPaymentsByMonthCommand: employer_reports_handlers.payments_by_month_handler,
+    employer_reports_commands.EmployerPaymentsByContractorCommand: employer_reports_handlers.payments_by_contractor_handler,
+    employer_reports_commands.EmployerPaymentsByCurrencyCommand: employer_reports_handlers.payments_by_currency_handler,
 }
 
-EVENTS = {}
+# every handler of an event runs separately, after the command which raised it is committed
+EVENTS = {
+    invoices_events.InvoiceCreated: [employer_invoices_handlers.send_invoice_created_by_email_handler],
+    operations_events.OperationStatusChanged: [contractor_operations_handlers.send_operation_finished_by_email_handler],
+}
+
+logger = logging.getLogger(__name__)
+
+# everything MessageBus.handler can inject, other handler parameters keep their defaults
+BUS_DEPENDENCIES = (
+    "uow",
+    "sms_adapter",
+    "email_adapter",
+    "principal_cache",
+    "rate_table",
+    "password_hasher",
+    "current_user_id",
+    "current_company_id",
+    "current_principal",
+)
 
 
-def filter_dependencies(handler, dependencies):
+def get_dependency_names(handler: Callable) -> Tuple[str, ...]:
+    # handler parameters and the ones its decorators consume, e.g. has_role
     params = inspect.signature(handler).parameters
-    filtered_dependencies = {name: dependency for name, dependency in dependencies.items() if name in params}
-    return filtered_dependencies
+    extra_params = getattr(handler, "dependencies", ())
+    return tuple(name for name in BUS_DEPENDENCIES if name in params or name in extra_params)
+
+
+# signatures are inspected once, not on every message
+HANDLER_DEPENDENCIES: Dict[Callable, Tuple[str, ...]] = {
+    handler: get_dependency_names(handler)
+    for handler in [*COMMANDS.values(), *(h for handlers in EVENTS.values() for h in handlers)]
+    if handler
+}
+
+
+def get_unsupported_messages() -> List[type]:
+    return [message_type for message_type, handler in COMMANDS.items() if handler is None]
+
+
+def report_unsupported_messages() -> None:
+    unsupported = get_unsupported_messages()
+    if unsupported:
+        logger.warning("Messages without handlers: %s", ", ".join(m.__name__ for m in unsupported))
 
 
 class MessageBus(AbstractMessageBus):
@@ -107,15 +161,47 @@ class MessageBus(AbstractMessageBus):
         uow: AbstractUnitOfWork,
         sms_adapter: AbstractSmsAdapter,
         email_adapter: AbstractEmailAdapter,
+        uow_factory: Optional[Callable[[], AbstractUnitOfWork]] = None,
+        principal_cache: Optional[AbstractPrincipalCache] = None,
+        rate_table: Optional[AbstractRateTable] = None,
+        password_hasher: Optional[AbstractPasswordHasher] = None,
+        payment_provider: Optional[AbstractPaymentProvider] = None,
+        event_workers: Optional[EventWorkerPool] = None,
     ) -> None:
         self.uow = uow
+        self.uow_factory = uow_factory
         self.sms_adapter = sms_adapter
         self.email_adapter = email_adapter
+        self.principal_cache = principal_cache
+        self.rate_table = rate_table
+        self.password_hasher = password_hasher
+        self.payment_provider = payment_provider
+        # not started pool runs event handlers inline
+        self.event_workers = event_workers or EventWorkerPool()
+
+    async def start(self) -> None:
+        await self.event_workers.start()
+
+    async def stop(self) -> None:
+        await self.event_workers.stop()
+
+    def get_uow(self) -> AbstractUnitOfWork:
+        # every message gets its own uow (connection, transaction and repositories)
+        # if a factory is configured, otherwise the shared uow is used
+        if self.uow_factory:
+            return self.uow_factory()
+        return self.uow
 
     async def clean(self) -> None:
         await self.uow.clean()
         await self.sms_adapter.clean()
         await self.email_adapter.clean()
+        if self.principal_cache:
+            await self.principal_cache.clean()
+        if self.rate_table:
+            await self.rate_table.clean()
+        if self.payment_provider:
+            await self.payment_provider.clean()
 
     async def handler(
         self,
@@ -124,20 +210,46 @@ class MessageBus(AbstractMessageBus):
         current_company_id: Optional[UUID4] = None,
     ) -> AbstractReponse:
         message_type = type(message)
-        handlers = COMMANDS
-        handler_fn = handlers.get(message_type)
+        handler_fn = COMMANDS.get(message_type)
         if not handler_fn:
             raise ServiceException(detail=f"Unsupported message type {message_type}")
-        return await handler_fn(
-            message,
-            **filter_dependencies(
-                handler_fn,
-                dict(
-                    uow=self.uow,
-                    sms_adapter=self.sms_adapter,
-                    email_adapter=self.email_adapter,
-                    current_user_id=current_user_id,
-                    current_company_id=current_company_id,
-                ),
-            ),
+        return await self.call(handler_fn, message, current_user_id, current_company_id)
+
+    async def publish(self, event: AbstractEvent) -> None:
+        for handler_fn in EVENTS.get(type(event), ()):
+            await self.event_workers.submit(partial(self.call, handler_fn, event))
+
+    async def call(
+        self,
+        handler_fn: Callable,
+        message: AbstractMessage,
+        current_user_id: Optional[UUID4] = None,
+        current_company_id: Optional[UUID4] = None,
+    ) -> Any:
+        dependency_names = HANDLER_DEPENDENCIES[handler_fn]
+        needs_principal = "current_principal" in dependency_names and current_user_id
+        # handlers without DB access (e.g. sending emails) don't get a uow
+        uow = self.get_uow() if "uow" in dependency_names or needs_principal else None
+        available = dict(
+            uow=uow,
+            sms_adapter=self.sms_adapter,
+            email_adapter=self.email_adapter,
+            principal_cache=self.principal_cache,
+            rate_table=self.rate_table,
+            password_hasher=self.password_hasher,
+            current_user_id=current_user_id,
+            current_company_id=current_company_id,
+            current_principal=None,
         )
+        if needs_principal:
+            # principal is loaded once per message and handlers check roles/memberships in memory
+            available["current_principal"] = await get_principal_with_companies(
+                uow, self.principal_cache, current_user_id
+            )
+        try:
+            return await handler_fn(message, **{name: available[name] for name in dependency_names})
+        finally:
+            # committed changes are published even if the handler failed afterwards
+            if uow:
+                for event in uow.collect_events():
+                    await self.publish(event)
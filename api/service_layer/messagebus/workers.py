@@ -0,0 +1,83 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional
+
+from settings import EVENT_MAX_QUEUE_SIZE, EVENT_MAX_RETRIES, EVENT_RETRY_DELAY, EVENT_WORKERS
+
+logger = logging.getLogger(__name__)
+
+Job = Callable[[], Awaitable[None]]
+
+
+class EventWorkerPool:
+    """Runs event handlers in background tasks, outside of the request that raised the events.
+
+    At most ``max_queue_size`` jobs wait in the queue, the rest of the publishers wait for
+    a free slot (backpressure). Failed jobs are retried with exponential backoff.
+    Until the pool is started jobs run inline, in the publisher's task.
+    """
+
+    def __init__(
+        self,
+        workers: int = EVENT_WORKERS,
+        max_queue_size: int = EVENT_MAX_QUEUE_SIZE,
+        max_retries: int = EVENT_MAX_RETRIES,
+        retry_delay: float = EVENT_RETRY_DELAY,
+    ) -> None:
+        self.workers = workers
+        self.max_queue_size = max_queue_size
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def started(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        if self.started:
+            return
+        self._queue = asyncio.Queue(self.max_queue_size)
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        # queued jobs are finished before the workers are cancelled
+        if not self.started:
+            return
+        await self._queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    async def submit(self, job: Job) -> None:
+        if not self.started:
+            await self._run(job)
+            return
+        await self._queue.put(job)
+
+    async def join(self) -> None:
+        if self.started:
+            await self._queue.join()
+
+    async def _work(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        for attempt in range(self.max_retries + 1):
+            try:
+                await job()
+                return
+            except Exception:
+                if attempt == self.max_retries:
+                    logger.exception("Event job %s failed after %s attempts", job, attempt + 1)
+                    return
+                logger.warning("Event job %s failed, retrying", job, exc_info=True)
+                await asyncio.sleep(self.retry_delay * 2**attempt)
@@ -0,0 +1,191 @@
+import asyncio
+import contextlib
+import logging
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+from uuid import uuid4
+
+from pydantic import BaseModel
+
+from adapters.rate_table.generic import AbstractRateTable
+from domain.models.invoices import InvoicePayment
+from domain.models.operations import Operation, OperationBatch
+from domain.types import TOperationBatchStatus, TOperationStatus, TPrimaryKey
+from service_layer.pricing.engine import PricingEngine
+from service_layer.unit_of_work.generic import AbstractUnitOfWork
+from settings import BULK_BATCH_SIZE, BULK_PAY_MAX_ATTEMPTS, BULK_PAY_POLL_INTERVAL, BULK_PAY_WORKERS
+
+logger = logging.getLogger(__name__)
+
+# statuses of batches with invoices left to pay, same order as in the partial index
+UNFINISHED_STATUSES = (TOperationBatchStatus.NEW, TOperationBatchStatus.IN_PROGRESS)
+
+
+def group_payments(payments: List[InvoicePayment]) -> Dict[Tuple[TPrimaryKey, TPrimaryKey], List[InvoicePayment]]:
+    # an operation moves money between two accounts, so it has one currency pair
+    groups = defaultdict(list)
+    for payment in payments:
+        groups[(payment.sender_account_id, payment.recipient_account_id)].append(payment)
+    return groups
+
+
+def build_operation(batch: OperationBatch, payments: List[InvoicePayment], created_date: datetime) -> Operation:
+    payment = payments[0]
+    amount = sum(p.amount for p in payments)
+    return Operation(
+        id=uuid4(),
+        created_date=created_date,
+        batch_id=batch.id,
+        operation_owner_company_id=batch.company_id,
+        operation_sender_user_id=batch.created_by_id,
+        operation_recipient_user_id=payment.created_by_id,
+        sender_account_id=payment.sender_account_id,
+        sender_bank_account_type=payment.sender_bank_account_type,
+        sender_currency=payment.sender_currency,
+        sender_country_alpha3=payment.sender_country_alpha3,
+        recipient_account_id=payment.recipient_account_id,
+        recipient_bank_account_type=payment.recipient_bank_account_type,
+        recipient_currency=payment.recipient_currency,
+        recipient_country_alpha3=payment.recipient_country_alpha3,
+        # invoices are issued in the recipient's currency, the sender's side is priced by PricingEngine
+        recipient_amount=amount,
+        status=TOperationStatus.NEW,
+    )
+
+
+class OperationBatchProcessorMetrics(BaseModel):
+    chunks: int = 0
+    invoices: int = 0
+    operations: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+
+
+class OperationBatchProcessor:
+    """Pays the invoices of bulk payment batches.
+
+    ``workers`` tasks poll side by side, each one claims an unfinished batch with ``SKIP LOCKED``
+    and pays its next chunk of invoices in the same transaction as ``processed_count``,
+    so a restarted or failed worker continues after the last committed chunk.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], AbstractUnitOfWork],
+        rate_table: AbstractRateTable,
+        workers: int = BULK_PAY_WORKERS,
+        chunk_size: int = BULK_BATCH_SIZE,
+        poll_interval: float = BULK_PAY_POLL_INTERVAL,
+        max_attempts: int = BULK_PAY_MAX_ATTEMPTS,
+    ) -> None:
+        self.uow_factory = uow_factory
+        self.rate_table = rate_table
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.metrics = OperationBatchProcessorMetrics()
+        self._stopped = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    async def pay_next_chunk(self, uow: AbstractUnitOfWork, batch: OperationBatch) -> int:
+        invoice_ids = await uow.operation_batch_invoices.get_invoice_ids(
+            batch.id, batch.processed_count, self.chunk_size
+        )
+        payments = await uow.invoices.get_payments(invoice_ids, batch.company_id, batch.sender_account_id, lock=True)
+        # invoices paid since the batch was requested are skipped
+        payments = [p for p in payments if not p.operation_id and p.sender_owner_company_id == batch.company_id]
+        now = datetime.utcnow()
+        operations, links = [], []
+        for group in group_payments(payments).values():
+            operation = build_operation(batch, group, now)
+            operations.append(operation)
+            links += [(p.invoice_id, operation.id, p.sender_account_id) for p in group]
+        snapshot = batch.get_rate_snapshot()
+        if snapshot is None:
+            snapshot = await self.rate_table.get_snapshot()
+            batch.set_rate_snapshot(snapshot)
+        PricingEngine(snapshot).price(operations)
+        await uow.operations.add_many(operations)
+        await uow.invoices.link_operations(links, now)
+        # positions of deleted invoices are skipped as well
+        processed_count = min(batch.processed_count + self.chunk_size, batch.invoices_count)
+        batch.skipped_count += processed_count - batch.processed_count - len(payments)
+        batch.processed_count = processed_count
+        batch.operations_count += len(operations)
+        if batch.processed_count == batch.invoices_count:
+            batch.status = TOperationBatchStatus.COMPLETED
+        else:
+            batch.status = TOperationBatchStatus.IN_PROGRESS
+        batch.error = None
+        batch.updated_date = now
+        await uow.operation_batches.update(batch)
+        self.metrics.invoices += len(invoice_ids)
+        self.metrics.operations += len(operations)
+        return len(invoice_ids)
+
+    async def fail(self, claimed: OperationBatch, error: Exception) -> None:
+        uow = self.uow_factory()
+        async with uow:
+            batch = await uow.operation_batches.get(id=claimed.id)
+            if batch.rates_date is None and claimed.rates_date is not None:
+                # the chunk is rolled back, but its retry is priced with the same rates
+                batch.rates, batch.rates_date = claimed.rates, claimed.rates_date
+            batch.attempts += 1
+            batch.error = getattr(error, "detail", None) or repr(error)
+            if batch.attempts >= self.max_attempts:
+                batch.status = TOperationBatchStatus.FAILED
+            # the failed batch goes to the end of the queue
+            batch.updated_date = datetime.utcnow()
+            await uow.operation_batches.update(batch)
+            await uow.commit()
+
+    async def run_once(self) -> bool:
+        started_at = time.perf_counter()
+        batch = None
+        uow = self.uow_factory()
+        try:
+            async with uow:
+                batches = await uow.operation_batches.claim(UNFINISHED_STATUSES, limit=1)
+                if not batches:
+                    return False
+                batch = batches[0]
+                await self.pay_next_chunk(uow, batch)
+                await uow.commit()
+        except Exception as e:
+            if not batch:
+                raise
+            # the chunk is rolled back and retried by the next polls from processed_count
+            logger.exception("Operation batch %s chunk failed", batch.id)
+            self.metrics.errors += 1
+            await self.fail(batch, e)
+            return False
+        self.metrics.chunks += 1
+        self.metrics.total_seconds += time.perf_counter() - started_at
+        return True
+
+    async def work(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                paid = await self.run_once()
+            except Exception:
+                logger.exception("Operation batch processing failed")
+                paid = False
+            if not paid:
+                # the next chunk is paid right away while there are unfinished batches
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._stopped.wait(), self.poll_interval)
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._stopped.clear()
+        self._tasks = [asyncio.create_task(self.work()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        # claimed chunks are finished before the workers exit
+        self._stopped.set()
+        await asyncio.gather(*self._tasks)
+        self._tasks = []
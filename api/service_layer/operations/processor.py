@@ -0,0 +1,156 @@
+import asyncio
+import contextlib
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, List, Optional
+
+from pydantic import BaseModel
+
+from adapters.payment_provider.generic import AbstractPaymentProvider
+from domain.events.generic import AbstractEvent
+from domain.events.operations import OperationStatusChanged
+from domain.models.operations import Operation
+from domain.types import TOperationStatus
+from service_layer.unit_of_work.generic import AbstractUnitOfWork
+from settings import OPERATION_BATCH_SIZE, OPERATION_LEASE, OPERATION_POLL_INTERVAL, OPERATION_WORKERS
+
+logger = logging.getLogger(__name__)
+
+# statuses advanced by the provider, same order as in the partial index
+PROCESSED_STATUSES = (TOperationStatus.NEW, TOperationStatus.IN_PROGRESS, TOperationStatus.ACCEPTED)
+
+
+class OperationProcessorMetrics(BaseModel):
+    polls: int = 0
+    processed: int = 0
+    transitions: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+
+    @property
+    def transitions_per_second(self) -> float:
+        if not self.total_seconds:
+            return 0.0
+        return self.transitions / self.total_seconds
+
+
+class OperationProcessor:
+    """Moves operations through their statuses with the payment provider.
+
+    ``workers`` tasks poll side by side, each one claims a batch of operations with ``SKIP LOCKED``
+    and leases it for ``lease`` seconds, asks the provider about all of them concurrently outside
+    of any transaction and stores the advanced operations with one UPDATE.
+    Every status change is published as OperationStatusChanged once it is committed.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], AbstractUnitOfWork],
+        payment_provider: AbstractPaymentProvider,
+        publish: Optional[Callable[[AbstractEvent], Awaitable[None]]] = None,
+        workers: int = OPERATION_WORKERS,
+        batch_size: int = OPERATION_BATCH_SIZE,
+        poll_interval: float = OPERATION_POLL_INTERVAL,
+        lease: float = OPERATION_LEASE,
+    ) -> None:
+        self.uow_factory = uow_factory
+        self.payment_provider = payment_provider
+        self.publish = publish
+        self.workers = workers
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.lease = lease
+        self.metrics = OperationProcessorMetrics()
+        self._stopped = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    async def get_next_status(self, operation: Operation) -> TOperationStatus:
+        if operation.status == TOperationStatus.NEW:
+            return await self.payment_provider.create_payment(operation)
+        return await self.payment_provider.get_payment_status(operation)
+
+    async def run_once(self) -> int:
+        started_at = time.perf_counter()
+        claimed_date = datetime.utcnow()
+        uow = self.uow_factory()
+        async with uow:
+            operations = await uow.operations.claim(PROCESSED_STATUSES, limit=self.batch_size, due_date=claimed_date)
+            if not operations:
+                return 0
+            # the claim is leased instead of locked while the provider is called,
+            # checked operations go to the end of the queue as well
+            for operation in operations:
+                operation.lease_expiry_date = claimed_date + timedelta(seconds=self.lease)
+            await uow.operations.update_many(operations, fields=["lease_expiry_date"])
+            await uow.commit()
+        results = await asyncio.gather(*(self.get_next_status(o) for o in operations), return_exceptions=True)
+        claimed = {o.id: (o.status, result) for o, result in zip(operations, results)}
+
+        uow = self.uow_factory()
+        async with uow:
+            now = datetime.utcnow()
+            advanced = []
+            for operation in await uow.operations.get_many(list(claimed), lock=True):
+                claimed_status, status = claimed[operation.id]
+                if isinstance(status, BaseException):
+                    logger.warning("Operation %s wasn't advanced: %r", operation.id, status)
+                    self.metrics.errors += 1
+                    continue
+                # an expired lease was taken over by another worker which has stored the status already
+                if status == operation.status or operation.status != claimed_status:
+                    continue
+                try:
+                    operation.set_status(status)
+                except ValueError:
+                    logger.exception("Operation %s got unexpected status from the provider", operation.id)
+                    operation.set_status(TOperationStatus.FAILED)
+                operation.updated_date = now
+                uow.add_event(
+                    OperationStatusChanged(
+                        operation_id=operation.id,
+                        operation_owner_company_id=operation.operation_owner_company_id,
+                        previous_status=claimed_status,
+                        status=operation.status,
+                    )
+                )
+                advanced.append(operation)
+            if advanced:
+                await uow.operations.update_many(advanced, fields=["status", "updated_date"])
+            # same transaction as the status, every operation is counted in the reports exactly once
+            await uow.payment_summaries.add_operations(
+                [o.id for o in advanced if o.status == TOperationStatus.COMPLETED], now
+            )
+            await uow.commit()
+        self.metrics.polls += 1
+        self.metrics.processed += len(operations)
+        self.metrics.transitions += len(advanced)
+        self.metrics.total_seconds += time.perf_counter() - started_at
+        if self.publish:
+            for event in uow.collect_events():
+                await self.publish(event)
+        return len(advanced)
+
+    async def work(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                transitions = await self.run_once()
+            except Exception:
+                logger.exception("Operation processing failed")
+                transitions = 0
+            if transitions < self.batch_size:
+                # busy batches are followed by the next poll right away
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._stopped.wait(), self.poll_interval)
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._stopped.clear()
+        self._tasks = [asyncio.create_task(self.work()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        # claimed batches are finished before the workers exit
+        self._stopped.set()
+        await asyncio.gather(*self._tasks)
+        self._tasks = []
@@ -0,0 +1,117 @@
+import asyncio
+import contextlib
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+
+from pydantic import BaseModel
+
+from adapters.email.generic import AbstractEmailAdapter
+from adapters.sms.generic import AbstractSmsAdapter
+from domain.models.outbox import OutboxMessage
+from domain.types import TOutboxChannel
+from service_layer.unit_of_work.generic import AbstractUnitOfWork
+from settings import OUTBOX_BATCH_SIZE, OUTBOX_MAX_ATTEMPTS, OUTBOX_POLL_INTERVAL, OUTBOX_RETRY_DELAY
+
+logger = logging.getLogger(__name__)
+
+# columns written back after delivery
+RESULT_FIELDS = ["attempts", "next_attempt_date", "sent_date", "failed_date", "error", "updated_date"]
+
+
+class OutboxRelayMetrics(BaseModel):
+    batches: int = 0
+    sent: int = 0
+    failed: int = 0
+    total_seconds: float = 0.0
+
+    @property
+    def messages_per_second(self) -> float:
+        if not self.total_seconds:
+            return 0.0
+        return (self.sent + self.failed) / self.total_seconds
+
+
+class OutboxRelay:
+    """Delivers the messages which committed transactions wrote to the outbox.
+
+    Every poll claims a batch of pending messages with ``SKIP LOCKED``, so several relays can
+    run side by side, sends the batch concurrently and stores the results with one UPDATE.
+    Failed messages are retried with exponential backoff, after ``max_attempts`` they are marked as failed
+    and leave the pending index.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], AbstractUnitOfWork],
+        email_adapter: AbstractEmailAdapter,
+        sms_adapter: AbstractSmsAdapter,
+        batch_size: int = OUTBOX_BATCH_SIZE,
+        poll_interval: float = OUTBOX_POLL_INTERVAL,
+        max_attempts: int = OUTBOX_MAX_ATTEMPTS,
+        retry_delay: float = OUTBOX_RETRY_DELAY,
+    ) -> None:
+        self.uow_factory = uow_factory
+        self.email_adapter = email_adapter
+        self.sms_adapter = sms_adapter
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.metrics = OutboxRelayMetrics()
+        self._stopped = asyncio.Event()
+
+    async def deliver(self, message: OutboxMessage) -> None:
+        if message.channel == TOutboxChannel.SMS:
+            await self.sms_adapter.send(message.recipient, message.body)
+        else:
+            await self.email_adapter.send(message.recipient, message.subject, message.body)
+
+    async def run_once(self) -> int:
+        started_at = time.perf_counter()
+        uow = self.uow_factory()
+        async with uow:
+            messages = await uow.outbox.claim(limit=self.batch_size, due_date=datetime.utcnow())
+            if not messages:
+                return 0
+            results = await asyncio.gather(*(self.deliver(m) for m in messages), return_exceptions=True)
+            now = datetime.utcnow()
+            for message, result in zip(messages, results):
+                message.attempts += 1
+                message.updated_date = now
+                if isinstance(result, BaseException):
+                    logger.warning("Outbox message %s failed: %r", message.id, result)
+                    message.error = repr(result)
+                    if message.attempts >= self.max_attempts:
+                        message.failed_date = now
+                    else:
+                        message.next_attempt_date = now + timedelta(
+                            seconds=self.retry_delay * 2 ** (message.attempts - 1)
+                        )
+                    self.metrics.failed += 1
+                else:
+                    message.sent_date = now
+                    message.error = None
+                    self.metrics.sent += 1
+            await uow.outbox.update_many(messages, fields=RESULT_FIELDS)
+            await uow.commit()
+        self.metrics.batches += 1
+        self.metrics.total_seconds += time.perf_counter() - started_at
+        return len(messages)
+
+    async def run(self) -> None:
+        self._stopped.clear()
+        while not self._stopped.is_set():
+            try:
+                claimed = await self.run_once()
+            except Exception:
+                logger.exception("Outbox relay poll failed")
+                claimed = 0
+            if claimed < self.batch_size:
+                # the outbox is drained, full batches are followed by the next poll right away
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._stopped.wait(), self.poll_interval)
+
+    def stop(self) -> None:
+        self._stopped.set()
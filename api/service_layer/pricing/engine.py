@@ -0,0 +1,58 @@
+from collections import defaultdict
+from decimal import ROUND_HALF_EVEN, Context, Decimal
+from typing import Dict, List, Sequence, Tuple
+
+from domain.models.operations import Operation
+from domain.models.pricing import RateSnapshot
+from domain.types import TCurrency
+from settings import OUR_FEE_PERCENT, PROVIDER_FEE_PERCENT
+
+# amounts are stored with 2 decimal places
+CENT = Decimal("0.01")
+# wide enough for products of any stored amount and rate, only quantize rounds
+PRICING_CONTEXT = Context(prec=50, rounding=ROUND_HALF_EVEN)
+
+
+class PricingEngine:
+    """Fees and currency conversion of operations, priced with one rate snapshot.
+
+    Recipients get the invoiced amount in their currency. Senders pay it converted to their
+    currency plus our and the provider's fee, every value is rounded once, to a cent.
+    """
+
+    def __init__(
+        self,
+        snapshot: RateSnapshot,
+        our_fee_percent: Decimal = OUR_FEE_PERCENT,
+        provider_fee_percent: Decimal = PROVIDER_FEE_PERCENT,
+    ) -> None:
+        self.snapshot = snapshot
+        self.our_fee_rate = our_fee_percent / 100
+        self.provider_fee_rate = provider_fee_percent / 100
+
+    def quote(
+        self, source: TCurrency, target: TCurrency, amounts: Sequence[Decimal]
+    ) -> List[Tuple[Decimal, Decimal, Decimal]]:
+        # (sender amount, our fee, provider fee) of every recipient amount of the currency pair
+        rate = self.snapshot.get_rate(source, target)
+        our_fee_rate, provider_fee_rate = self.our_fee_rate, self.provider_fee_rate
+        multiply, quantize = PRICING_CONTEXT.multiply, Decimal.quantize
+        quotes = []
+        for amount in amounts:
+            converted = quantize(multiply(amount, rate), CENT, context=PRICING_CONTEXT)
+            our_fee = quantize(multiply(converted, our_fee_rate), CENT, context=PRICING_CONTEXT)
+            provider_fee = quantize(multiply(converted, provider_fee_rate), CENT, context=PRICING_CONTEXT)
+            quotes.append((converted + our_fee + provider_fee, our_fee, provider_fee))
+        return quotes
+
+    def price(self, operations: Sequence[Operation]) -> None:
+        # the rate is looked up once per currency pair, not per operation
+        groups: Dict[Tuple[TCurrency, TCurrency], List[Operation]] = defaultdict(list)
+        for operation in operations:
+            groups[(operation.recipient_currency, operation.sender_currency)].append(operation)
+        for (source, target), group in groups.items():
+            quotes = self.quote(source, target, [o.recipient_amount for o in group])
+            for operation, (sender_amount, our_fee, provider_fee) in zip(group, quotes):
+                operation.sender_amount = sender_amount
+                operation.our_fee = our_fee
+                operation.provider_fee = provider_fee
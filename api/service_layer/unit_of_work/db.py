@@ -3,7 +3,7 @@ from tortoise.backends.asyncpg.client import TransactionWrapper
 from tortoise.exceptions import TransactionManagementError as ORMTransactionManagementError
 from tortoise.transactions import current_transaction_map
 
-from adapters.repositories.db import bank_accounts, companies, invoices, operations, users
+from adapters.repositories.db import bank_accounts, companies, invoices, operations, outbox, reports, users
 from adapters.repositories.session.db import DBSession
 
 from .generic import AbstractUnitOfWork
@@ -15,6 +15,8 @@ class DBUnitOfWork(AbstractUnitOfWork):
         self.wrapped_connection = None
         self.connection_name = None
         self.token = None
+        self.new_events = []
+        self.committed_events = []
 
     async def __aenter__(self):
         connection = Tortoise.get_connection("default")
@@ -34,6 +36,10 @@ class DBUnitOfWork(AbstractUnitOfWork):
         self.invoices = invoices.InvoicesDBRepository(self.session)
         self.invoice_items = invoices.InvoiceItemsDBRepository(self.session)
         self.operations = operations.OperationsDBRepository(self.session)
+        self.operation_batches = operations.OperationBatchesDBRepository(self.session)
+        self.operation_batch_invoices = operations.OperationBatchInvoicesDBRepository(self.session)
+        self.outbox = outbox.OutboxDBRepository(self.session)
+        self.payment_summaries = reports.PaymentSummariesDBRepository(self.session)
 
     async def __aexit__(self, exc_type: any, exc_val: any, exc_tb: any) -> None:
         if not self.wrapped_connection or not self.token:
@@ -55,7 +61,9 @@ class DBUnitOfWork(AbstractUnitOfWork):
     async def commit(self):
         if self.wrapped_connection:
             await self.session.commit(self.wrapped_connection)
+        self.commit_events()
 
     async def rollback(self):
         if self.wrapped_connection:
             await self.session.rollback(self.wrapped_connection)
+        self.rollback_events()
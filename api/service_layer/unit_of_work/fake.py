@@ -1,4 +1,4 @@
-from adapters.repositories.fake import bank_accounts, companies, invoices, operations, users
+from adapters.repositories.fake import bank_accounts, companies, invoices, operations, outbox, reports, users
 from adapters.repositories.session.fake import FakeSession
 
 from .generic import AbstractUnitOfWork
@@ -8,9 +8,12 @@ class FakeUnitOfWork(AbstractUnitOfWork):
     def __init__(self, session=None):
         self.session = session or FakeSession()
         self.transaction = None
+        self.new_events = []
+        self.committed_events = []
 
     async def __aenter__(self):
-        await self.session.start(None)
+        self.transaction = object()
+        await self.session.start(self.transaction)
         self.users = users.UsersFakeRepository(self.session)
         self.companies = companies.CompanyFakeRepository(self.session)
         self.companies_m2m_contractors = companies.CompanyM2MContractorFakeRepository(self.session)
@@ -21,6 +24,10 @@ class FakeUnitOfWork(AbstractUnitOfWork):
         self.invoices = invoices.InvoicesFakeRepository(self.session)
         self.invoice_items = invoices.InvoiceItemsFakeRepository(self.session)
         self.operations = operations.OperationsFakeRepository(self.session)
+        self.operation_batches = operations.OperationBatchesFakeRepository(self.session)
+        self.operation_batch_invoices = operations.OperationBatchInvoicesFakeRepository(self.session)
+        self.outbox = outbox.OutboxFakeRepository(self.session)
+        self.payment_summaries = reports.PaymentSummariesFakeRepository(self.session)
 
     async def __aexit__(self, *args, **kwargs):
         await self.rollback()
@@ -31,7 +38,9 @@ class FakeUnitOfWork(AbstractUnitOfWork):
     async def commit(self):
         if self.transaction:
             await self.session.commit(self.transaction)
+        self.commit_events()
 
     async def rollback(self):
         if self.transaction:
             await self.session.rollback(self.transaction)
+        self.rollback_events()
@@ -1,6 +1,8 @@
 import abc
+from typing import List
 
-from adapters.repositories.db import bank_accounts, companies, invoices, operations, users
+from adapters.repositories.db import bank_accounts, companies, invoices, operations, outbox, reports, users
+from domain.events.generic import AbstractEvent
 
 
 class AbstractUnitOfWork(abc.ABC):
@@ -14,6 +16,27 @@ class AbstractUnitOfWork(abc.ABC):
     invoices: invoices.InvoicesDBRepository
     invoice_items: invoices.InvoiceItemsDBRepository
     operations: operations.OperationsDBRepository
+    operation_batches: operations.OperationBatchesDBRepository
+    operation_batch_invoices: operations.OperationBatchInvoicesDBRepository
+    outbox: outbox.OutboxDBRepository
+    payment_summaries: reports.PaymentSummariesDBRepository
+    # events raised by handlers, published by the message bus only once they are committed
+    new_events: List[AbstractEvent]
+    committed_events: List[AbstractEvent]
+
+    def add_event(self, event: AbstractEvent) -> None:
+        self.new_events.append(event)
+
+    def collect_events(self) -> List[AbstractEvent]:
+        events, self.committed_events = self.committed_events, []
+        return events
+
+    def commit_events(self) -> None:
+        self.committed_events += self.new_events
+        self.new_events = []
+
+    def rollback_events(self) -> None:
+        self.new_events = []
 
     @abc.abstractmethod
     async def clean(self):
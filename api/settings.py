@@ -1,4 +1,5 @@
 import os
+from decimal import Decimal
 
 from environs import Env
 
@@ -23,10 +24,50 @@ JWT_SECRET_KEY = env.str("JWT_SECRET_KEY")
 JWT_ACCESS_TOKEN_EXPIRED_AT = env.int("JWT_ACCESS_TOKEN_EXPIRED_AT")  # in sec
 JWT_REFRESH_TOKEN_EXPIRED_AT = env.int("JWT_REFRESH_TOKEN_EXPIRED_AT")  # in sec
 
+# PASSWORD HASHER
+PASSWORD_HASHER_EXECUTOR = env.str("PASSWORD_HASHER_EXECUTOR", "thread")  # thread or process
+PASSWORD_HASHER_MAX_WORKERS = env.int("PASSWORD_HASHER_MAX_WORKERS", 4)
+PASSWORD_HASHER_MAX_QUEUE_SIZE = env.int("PASSWORD_HASHER_MAX_QUEUE_SIZE", 64)
+
+# PRINCIPAL CACHE
+PRINCIPAL_CACHE_TTL = env.int("PRINCIPAL_CACHE_TTL", 60)  # in sec
+PRINCIPAL_CACHE_MAX_SIZE = env.int("PRINCIPAL_CACHE_MAX_SIZE", 10000)
 
 # PAGINATION
 DEFAULT_LIMIT = env.int("DEFAULT_LIMIT", 25)
 
+# BULK OPERATIONS
+BULK_BATCH_SIZE = env.int("BULK_BATCH_SIZE", 1000)  # rows per statement
+BULK_PAY_WORKERS = env.int("BULK_PAY_WORKERS", 2)
+BULK_PAY_POLL_INTERVAL = env.float("BULK_PAY_POLL_INTERVAL", 1.0)  # in sec, when there are no unfinished batches
+BULK_PAY_MAX_ATTEMPTS = env.int("BULK_PAY_MAX_ATTEMPTS", 3)  # failed chunks before the batch fails
+
+# EVENTS
+EVENT_WORKERS = env.int("EVENT_WORKERS", 4)
+EVENT_MAX_QUEUE_SIZE = env.int("EVENT_MAX_QUEUE_SIZE", 1000)
+EVENT_MAX_RETRIES = env.int("EVENT_MAX_RETRIES", 3)
+EVENT_RETRY_DELAY = env.float("EVENT_RETRY_DELAY", 0.5)  # in sec, doubled on every retry
+
+# OUTBOX
+OUTBOX_BATCH_SIZE = env.int("OUTBOX_BATCH_SIZE", 100)  # messages claimed per poll
+OUTBOX_POLL_INTERVAL = env.float("OUTBOX_POLL_INTERVAL", 1.0)  # in sec, when the outbox is drained
+OUTBOX_MAX_ATTEMPTS = env.int("OUTBOX_MAX_ATTEMPTS", 5)
+OUTBOX_RETRY_DELAY = env.float("OUTBOX_RETRY_DELAY", 30.0)  # in sec, doubled after every failed attempt
+
+# PRICING
+OUR_FEE_PERCENT = env.decimal("OUR_FEE_PERCENT", Decimal("0.5"))
+PROVIDER_FEE_PERCENT = env.decimal("PROVIDER_FEE_PERCENT", Decimal("0.2"))
+
+# OPERATIONS PROCESSING
+OPERATION_WORKERS = env.int("OPERATION_WORKERS", 4)
+OPERATION_BATCH_SIZE = env.int("OPERATION_BATCH_SIZE", 100)  # operations claimed per poll
+OPERATION_POLL_INTERVAL = env.float("OPERATION_POLL_INTERVAL", 1.0)  # in sec, when there is nothing to advance
+OPERATION_LEASE = env.float("OPERATION_LEASE", 30.0)  # in sec, a claimed operation isn't claimed again before that
+
+# REPORTS
+REPORT_MONTHS = env.int("REPORT_MONTHS", 12)  # default range of reports
+REPORT_MAX_MONTHS = env.int("REPORT_MAX_MONTHS", 36)
+
 # ORM
 TORTOISE_ORM = {
     "connections": {"default": DATABASE_URI},
@@ -38,6 +79,8 @@ TORTOISE_ORM = {
                 "adapters.orm.models.bank_accounts",
                 "adapters.orm.models.invoices",
                 "adapters.orm.models.operations",
+                "adapters.orm.models.outbox",
+                "adapters.orm.models.reports",
                 "aerich.models",
             ],
             "default_connection": "default",
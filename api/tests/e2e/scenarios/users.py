@@ -30,7 +30,7 @@ async def signup_user(
         db_user = db_users[-1]
     assert db_user.email == email
     assert db_user.role == role
-    assert await db_user.verify_password(password)
+    assert await db_user.verify_password(password, bus.password_hasher.hash)
     assert not db_user.is_active
     assert not db_user.is_onboarded
     return db_user
@@ -112,7 +112,7 @@ async def signin_generate_access_token(async_client: AsyncClient, email: str, pa
     async with bus.uow:
         user = await bus.uow.users.get(id=uuid.UUID(decoded_token_data["user_id"]))
     assert user.email == email
-    assert await user.verify_password(password)
+    assert await user.verify_password(password, bus.password_hasher.hash)
     assert decoded_token_data["refresh_token"] == token_data["refresh_token"]
     assert decoded_token_data["access_token_expired_at"] == token_data["access_token_expired_at"]
     assert decoded_token_data["refresh_token_expired_at"] == token_data["refresh_token_expired_at"]
@@ -135,7 +135,7 @@ async def signin_refresh_access_token(async_client: AsyncClient, email: str, pas
     async with bus.uow:
         user = await bus.uow.users.get(id=uuid.UUID(decoded_token_data["user_id"]))
     assert user.email == email
-    assert await user.verify_password(password)
+    assert await user.verify_password(password, bus.password_hasher.hash)
     assert decoded_token_data["access_token_expired_at"] == token_data["access_token_expired_at"]
     assert decoded_token_data["refresh_token"] == old_token_data["refresh_token"]
     assert decoded_token_data["refresh_token_expired_at"] == old_token_data["refresh_token_expired_at"]
@@ -159,8 +159,8 @@ async def reset_password(
         db_users = await bus.uow.users.all()
         db_user = db_users[-1]
 
-    assert await db_user.verify_password(old_password)
-    assert not await db_user.verify_password(new_password)
+    assert await db_user.verify_password(old_password, bus.password_hasher.hash)
+    assert not await db_user.verify_password(new_password, bus.password_hasher.hash)
     password_code = db_user.password_code
     response = await async_client.post(
         "/users/reset-password",
@@ -175,8 +175,8 @@ async def reset_password(
     async with bus.uow:
         db_users = await bus.uow.users.all()
         db_user = db_users[-1]
-    assert not await db_user.verify_password(old_password)
-    assert await db_user.verify_password(new_password)
+    assert not await db_user.verify_password(old_password, bus.password_hasher.hash)
+    assert await db_user.verify_password(new_password, bus.password_hasher.hash)
     return db_user
 
 
@@ -252,8 +252,8 @@ async def change_password(async_client: AsyncClient, email: str, password: str,
 
     for field in ("password",):
         if field in data:
-            assert await db_user.verify_password(data.get("password"))
-            assert await db_user.verify_password(data.get("repeat_password"))
+            assert await db_user.verify_password(data.get("password"), bus.password_hasher.hash)
+            assert await db_user.verify_password(data.get("repeat_password"), bus.password_hasher.hash)
 
     return user_data
 
@@ -263,6 +263,8 @@ async def delete_profile(async_client: AsyncClient, email: str, password: str) -
     access_token = response["access_token"]
     response = await async_client.delete("/users/profile", headers={"Authorization": "Bearer {}".format(access_token)})
     assert response.status_code == 200, response.text
+    response = await async_client.get("/users/profile", headers={"Authorization": "Bearer {}".format(access_token)})
+    assert response.status_code == 401, response.text
 
 
 async def invite_user(
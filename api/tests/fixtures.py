@@ -1,13 +1,106 @@
+import os
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
 import pytest
 from httpx import AsyncClient
+from tortoise import Tortoise
+from tortoise.exceptions import BaseORMException
+
+from adapters.email.fake import FakeEmailAdapter
+from adapters.password_hasher.fake import FakePasswordHasher
+from adapters.principal_cache.memory import InMemoryPrincipalCache
+from adapters.rate_table.fake import FakeRateTable
+from adapters.repositories.session.db import DBSession
+from adapters.repositories.session.fake import FakeSession
+from adapters.sms.fake import FakeSmsAdapter
+from domain.models.companies import Company, CompanyM2MContractor
+from domain.models.operations import Operation
+from domain.models.users import User
+from domain.types import TBankAccountType, TCountry, TCurrency, TOperationStatus, TRole
+from main import app
+from main import bus as app_bus
+from main import shutdown, startup
+from service_layer.messagebus.messagebus import MessageBus
+from service_layer.unit_of_work.db import DBUnitOfWork
+from service_layer.unit_of_work.fake import FakeUnitOfWork
 
-from main import app, bus, shutdown, startup
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), "../adapters/orm/migrations/models")
 
 
 @pytest.fixture
 async def async_client():
     async with AsyncClient(app=app, base_url="http://test") as client:
         await startup()
-        await bus.clean()  # clean test every run
+        await app_bus.clean()  # clean test every run
         yield client
         await shutdown()
+
+
+@pytest.fixture
+async def db_uow():
+    session = DBSession()
+    try:
+        await session.open()
+    except (OSError, BaseORMException):
+        pytest.skip("PostgreSQL is not available")
+    # indexes come from the migrations, not from generate_schemas
+    connection = Tortoise.get_connection("default")
+    for name in sorted(os.listdir(MIGRATIONS_DIR)):
+        with open(os.path.join(MIGRATIONS_DIR, name)) as f:
+            upgrade = f.read().split("-- downgrade --")[0]
+        await connection.execute_script(upgrade)
+    yield DBUnitOfWork(session=session)
+    await session.close()
+
+
+@pytest.fixture
+async def bus():
+    session = FakeSession()
+    return MessageBus(
+        uow=FakeUnitOfWork(session=session),
+        uow_factory=lambda: FakeUnitOfWork(session=session),
+        sms_adapter=FakeSmsAdapter(),
+        email_adapter=FakeEmailAdapter(),
+        principal_cache=InMemoryPrincipalCache(),
+        rate_table=FakeRateTable(),
+        password_hasher=FakePasswordHasher(),
+    )
+
+
+async def create_contractor_with_company(bus: MessageBus):
+    contractor = User(id=uuid.uuid4(), email="contractor@test.com", role=TRole.CONTRACTOR, is_active=True)
+    company = Company(id=uuid.uuid4(), name="company", owner_id=uuid.uuid4(), created_date=datetime.utcnow())
+    async with bus.uow:
+        await bus.uow.users.add(contractor)
+        await bus.uow.companies.add(company)
+        await bus.uow.companies_m2m_contractors.add(
+            CompanyM2MContractor(id=uuid.uuid4(), company_id=company.id, contractor_id=contractor.id)
+        )
+    return contractor, company
+
+
+def build_operation(currency: TCurrency = TCurrency.USD, **fields) -> Operation:
+    # a NEW operation between random users, fields override the defaults
+    return Operation(
+        **{
+            "id": uuid.uuid4(),
+            "created_date": datetime.utcnow(),
+            "operation_owner_company_id": uuid.uuid4(),
+            "operation_sender_user_id": uuid.uuid4(),
+            "operation_recipient_user_id": uuid.uuid4(),
+            "sender_bank_account_type": TBankAccountType.BUSINESS,
+            "sender_currency": currency,
+            "sender_country_alpha3": TCountry.USA,
+            "sender_amount": Decimal("10.07"),
+            "our_fee": Decimal("0.05"),
+            "provider_fee": Decimal("0.02"),
+            "recipient_bank_account_type": TBankAccountType.PERSONAL,
+            "recipient_currency": currency,
+            "recipient_country_alpha3": TCountry.USA,
+            "recipient_amount": Decimal("10.00"),
+            "status": TOperationStatus.NEW,
+            **fields,
+        }
+    )
@@ -0,0 +1,75 @@
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from tortoise import Tortoise
+
+from adapters.orm.models.invoices import ORMInvoiceItem
+from adapters.orm.models.users import ORMUser
+from adapters.repositories.db.users import UsersDBRepository
+from adapters.repositories.exceptions import InvalidQueryParameter
+from domain.models.invoices import InvoiceItem
+from domain.models.users import User
+from domain.types import TRole
+from settings import TORTOISE_ORM
+
+
+@pytest.fixture
+async def orm():
+    # models only need to be initialized, nothing is sent to the DB
+    await Tortoise.init(config={**TORTOISE_ORM, "connections": {"default": "sqlite://:memory:"}})
+    yield
+    await Tortoise.close_connections()
+
+
+@pytest.mark.asyncio
+async def test_orm_to_pydantic(orm):
+    db_obj = ORMUser(id=uuid.uuid4(), created_date=datetime.utcnow(), email="user@test.com", role=TRole.CONTRACTOR)
+    for validate in (False, True):
+        user = db_obj.to_pydantic(validate=validate)
+        assert isinstance(user, User)
+        assert user.role is TRole.CONTRACTOR
+        assert (user.id, user.email, user.is_active) == (db_obj.id, "user@test.com", False)
+        assert user.phone is None
+
+
+@pytest.mark.asyncio
+async def test_orm_from_pydantic(orm):
+    item = InvoiceItem(id=uuid.uuid4(), invoice_id=uuid.uuid4(), amount=Decimal("1.50"), quantity=2, descripion="item")
+    db_obj = ORMInvoiceItem()
+    db_obj.from_pydantic(item)
+    assert (db_obj.id, db_obj.invoice_id, db_obj.amount, db_obj.quantity) == (item.id, item.invoice_id, item.amount, 2)
+    assert db_obj.updated_date is None
+    assert db_obj.to_pydantic() == item
+
+
+@pytest.mark.asyncio
+async def test_orm_only(orm):
+    repository = UsersDBRepository(session=None)
+    assert repository.get_fields(["role", "is_active"]) == ["id", "role", "is_active"]
+    with pytest.raises(InvalidQueryParameter):
+        repository.get_fields(["companies"])
+    queryset = repository.get_queryset(repository.get_fields(["role"]), [], id=uuid.uuid4())
+    assert '"password"' not in queryset.sql()
+    # partial rows become partial models
+    db_obj = ORMUser._init_from_db(id=uuid.uuid4(), role="EMPLOYER")
+    user = db_obj.to_pydantic()
+    assert user.dict(exclude_unset=True) == {"id": db_obj.id, "role": TRole.EMPLOYER}
+
+
+@pytest.mark.asyncio
+async def test_orm_update_writes_changed_fields(orm):
+    await Tortoise.generate_schemas()
+    repository = UsersDBRepository(session=None)
+    await ORMUser.create(id=uuid.uuid4(), created_date=datetime.utcnow(), email="user@test.com", role=TRole.CONTRACTOR)
+    user = await repository.get(email="user@test.com")
+    assert user.changed_fields == frozenset()
+    # concurrent write to a column the handler does not touch
+    await ORMUser.filter(id=user.id).update(password="new")
+    user.first_name = "First"
+    assert user.changed_fields == {"first_name"}
+    await repository.update(user)
+    assert user.changed_fields == frozenset()
+    db_obj = await ORMUser.get(id=user.id)
+    assert (db_obj.first_name, db_obj.password) == ("First", "new")
@@ -0,0 +1,90 @@
+import contextlib
+import datetime
+import json
+import logging
+import uuid
+from typing import List
+
+import pytest
+from tortoise.transactions import in_transaction
+
+from adapters.repositories.exceptions import ObjectDoesNotExist
+from domain.types import TRole
+from service_layer.operations.batches import UNFINISHED_STATUSES
+from service_layer.operations.processor import PROCESSED_STATUSES
+from service_layer.unit_of_work.db import DBUnitOfWork
+
+
+def walk(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from walk(child)
+
+
+def unindexed_scans(plan: dict) -> List[str]:
+    # enable_seqscan=off turns unindexed filters into full index scans, so a scan has to narrow rows by an index
+    return [
+        f"{node['Node Type']} on {node.get('Relation Name')}"
+        for node in walk(plan)
+        if node["Node Type"] == "Seq Scan"
+        or (node["Node Type"] in ("Index Scan", "Index Only Scan") and "Filter" in node and "Index Cond" not in node)
+    ]
+
+
+async def repository_queries(uow: DBUnitOfWork) -> None:
+    pk = uuid.uuid4()
+    async with uow:
+        await uow.users.first(id=pk)
+        await uow.users.first(email="user@test.com", role=TRole.CONTRACTOR, is_active=False)
+        await uow.users.exists(email="user@test.com", is_active=True)
+        await uow.users.exists(phone="+79990000000")
+        await uow.users.first(email_code="0" * 32)
+        await uow.users.first(phone_code="000000")
+        await uow.users.first(password_code="0" * 32)
+        await uow.companies.exists(name="company", owner_id=pk)
+        await uow.companies_m2m_contractors.filter(contractor_id=pk)
+        await uow.companies_m2m_employers.filter(employer_id=pk)
+        await uow.companies.list_for_contractor(pk)
+        await uow.companies.list_for_employer(pk)
+        await uow.invite_users_to_companies.first(invitation_code="0" * 32)
+        await uow.invite_users_to_companies.exists(email="user@test.com", company_id=pk)
+        await uow.invite_users_to_companies.get_preconditions(pk, "user@test.com")
+        await uow.invoices.list(created_by_id=pk, for_company_id=pk)
+        await uow.invoice_items.filter(invoice_id=pk)
+        await uow.invoices.get_payments([pk], pk, pk)
+        await uow.operation_batches.first(id=pk, company_id=pk)
+        await uow.operation_batches.claim(UNFINISHED_STATUSES, limit=1)
+        await uow.operation_batch_invoices.get_invoice_ids(pk, 0, 1000)
+        await uow.operation_batch_invoices.get_queued_invoice_ids([pk], UNFINISHED_STATUSES)
+        await uow.operations.list(operation_recipient_user_id=pk, operation_owner_company_id=pk)
+        await uow.operations.claim(PROCESSED_STATUSES, limit=100, due_date=datetime.datetime.utcnow())
+        await uow.operations.get_many([pk], lock=True)
+        await uow.recipient_bank_accounts.list(recipient_owner_user_id=pk, recipient_owner_company_id=pk)
+        await uow.outbox.claim(limit=100, due_date=datetime.datetime.utcnow())
+        for group_by in (("month", "currency"), ("contractor_id", "currency"), ("currency",)):
+            await uow.payment_summaries.report(pk, group_by, datetime.date(2026, 1, 1), datetime.date(2026, 12, 1))
+        with contextlib.suppress(ObjectDoesNotExist):
+            await uow.users.get(email="user@test.com")
+
+
+@pytest.mark.asyncio
+async def test_repository_queries_use_indexes(db_uow, caplog):
+    with caplog.at_level(logging.DEBUG, logger="tortoise.db_client"):
+        await repository_queries(db_uow)
+    # raw queries are logged with their $n parameters, EXPLAIN needs them too
+    queries = {
+        r.args[0]: r.args[1] if len(r.args) > 1 else None
+        for r in caplog.records
+        if r.args and str(r.args[0]).startswith("SELECT")
+    }
+    assert queries
+
+    unindexed = {}
+    async with in_transaction() as connection:
+        await connection.execute_script("SET LOCAL enable_seqscan = off")
+        for query, values in queries.items():
+            _, rows = await connection.execute_query(f"EXPLAIN (FORMAT JSON) {query}", values)
+            scans = unindexed_scans(json.loads(rows[0]["QUERY PLAN"])[0]["Plan"])
+            if scans:
+                unindexed[query] = scans
+    assert not unindexed, unindexed
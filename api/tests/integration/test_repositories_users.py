@@ -0,0 +1,33 @@
+import uuid
+from datetime import datetime
+
+import pytest
+
+from domain.models.users import User
+from domain.types import TRole
+
+
+def new_user(email: str, role: TRole = TRole.CONTRACTOR) -> User:
+    return User(id=uuid.uuid4(), created_date=datetime.utcnow(), email=email, role=role, password="old")
+
+
+@pytest.mark.asyncio
+async def test_users_get_or_create(db_uow):
+    email = f"{uuid.uuid4().hex}@test.com"
+    async with db_uow:
+        user, created = await db_uow.users.get_or_create(new_user(email), conflict_fields=("email",))
+        assert created
+        existing, created = await db_uow.users.get_or_create(new_user(email), conflict_fields=("email",))
+        assert not created and existing.id == user.id
+
+
+@pytest.mark.asyncio
+async def test_users_upsert(db_uow):
+    email = f"{uuid.uuid4().hex}@test.com"
+    async with db_uow:
+        user = await db_uow.users.upsert(new_user(email), ("email",), ("password",), is_active=False)
+        other = new_user(email)
+        other.password = "new"
+        stored = await db_uow.users.upsert(other, ("email",), ("password",), is_active=False)
+        assert (stored.id, stored.password) == (user.id, "new")
+        assert await db_uow.users.upsert(other, ("email",), ("password",), role=TRole.EMPLOYER) is None
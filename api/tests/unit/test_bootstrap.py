@@ -0,0 +1,19 @@
+import pytest
+
+import bootstrap
+from bootstrap import Bootstrap, FakeBootstrap, get_payment_provider, get_rate_table
+from generic import ImproperlyConfigured
+
+
+def test_bootstrap_without_payment_provider_and_rate_table(monkeypatch):
+    monkeypatch.setattr(bootstrap, "bus", Bootstrap().init())
+    with pytest.raises(ImproperlyConfigured):
+        get_payment_provider()
+    with pytest.raises(ImproperlyConfigured):
+        get_rate_table()
+
+
+def test_fake_bootstrap(monkeypatch):
+    monkeypatch.setattr(bootstrap, "bus", FakeBootstrap().init())
+    assert get_payment_provider()
+    assert get_rate_table()
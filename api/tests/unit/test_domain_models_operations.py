@@ -0,0 +1,19 @@
+import uuid
+
+import pytest
+
+from domain.models.operations import Operation
+from domain.types import TOperationStatus
+
+
+def test_operation_set_status():
+    operation = Operation.construct(id=uuid.uuid4(), status=TOperationStatus.NEW)
+    operation.set_status(TOperationStatus.IN_PROGRESS)
+    assert operation.status == TOperationStatus.IN_PROGRESS
+    with pytest.raises(ValueError):
+        operation.set_status(TOperationStatus.NEW)
+    operation.set_status(TOperationStatus.ACCEPTED)
+    operation.set_status(TOperationStatus.COMPLETED)
+    # completed operations are final
+    with pytest.raises(ValueError):
+        operation.set_status(TOperationStatus.FAILED)
@@ -2,6 +2,7 @@ import uuid
 
 import pytest
 
+from adapters.password_hasher.fake import FakePasswordHasher
 from domain.models.users import User
 from domain.types import TRole
 
@@ -16,7 +17,9 @@ async def test_verify_password():
         first_name="first name",
         last_name="last name",
     )
+    hasher = FakePasswordHasher()
     assert not user.password
-    assert not await user.verify_password("password")
-    await user.set_password("password")
-    assert await user.verify_password("password")
+    assert not await user.verify_password("password", hasher.hash)
+    await user.set_password("password", hasher.hash)
+    assert await user.verify_password("password", hasher.hash)
+    assert not await user.verify_password("other password", hasher.hash)
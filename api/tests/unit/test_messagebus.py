@@ -1,9 +1,21 @@
+import asyncio
+import logging
+
 import pytest
 
 from adapters.email.fake import FakeEmailAdapter
+from adapters.password_hasher.fake import FakePasswordHasher
+from adapters.repositories.session.fake import FakeSession
 from adapters.sms.fake import FakeSmsAdapter
 from domain.commands.generic import AbstractCommand
-from service_layer.messagebus.messagebus import MessageBus
+from domain.commands.users import GenerateEmailCodeCommand, SignUpUserCommand
+from domain.events.generic import AbstractEvent
+from domain.types import TRole
+from service_layer.handlers.contractor.companies import company_retrieve_handler
+from service_layer.handlers.users import generate_email_code_handler
+from service_layer.messagebus import messagebus
+from service_layer.messagebus.messagebus import MessageBus, get_dependency_names, report_unsupported_messages
+from service_layer.messagebus.workers import EventWorkerPool
 from service_layer.unit_of_work.fake import FakeUnitOfWork
 
 
@@ -11,6 +23,10 @@ class InvalidMessage(AbstractCommand):
     pass
 
 
+class SomethingHappened(AbstractEvent):
+    pass
+
+
 @pytest.mark.asyncio
 async def test_messagebus():
     uow = FakeUnitOfWork()
@@ -23,3 +39,97 @@ async def test_messagebus():
     )
     with pytest.raises(Exception):
         await bus.handler(InvalidMessage())
+
+
+@pytest.mark.asyncio
+async def test_messagebus_uow_factory():
+    session = FakeSession()
+    uows = []
+
+    def uow_factory():
+        uow = FakeUnitOfWork(session=session)
+        uows.append(uow)
+        return uow
+
+    bus = MessageBus(
+        uow=FakeUnitOfWork(session=session),
+        uow_factory=uow_factory,
+        sms_adapter=FakeSmsAdapter(),
+        email_adapter=FakeEmailAdapter(),
+        password_hasher=FakePasswordHasher(),
+    )
+    user = await bus.handler(
+        SignUpUserCommand(
+            email="test@test.com",
+            role=TRole.EMPLOYER,
+            password="password",
+            repeat_password="password",
+        )
+    )
+    result = await bus.handler(GenerateEmailCodeCommand(email="test@test.com"))
+    assert len(uows) == 2
+    assert uows[0] is not uows[1]
+    assert result.id == user.id
+    assert result.email_code
+
+
+def test_messagebus_dependency_names(caplog):
+    assert get_dependency_names(generate_email_code_handler) == ("uow",)
+    # has_role consumes the principal even if the handler doesn't declare it
+    assert "current_principal" in get_dependency_names(company_retrieve_handler)
+    with caplog.at_level(logging.WARNING):
+        report_unsupported_messages()
+    assert "EmployerCompanyUpdateCommand" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_messagebus_publishes_committed_events(monkeypatch):
+    published = []
+
+    async def raise_events(message, uow=None):
+        async with uow:
+            uow.add_event(SomethingHappened())
+            await uow.commit()
+            uow.add_event(SomethingHappened())
+            await uow.rollback()
+
+    async def on_something_happened(message):
+        published.append(message)
+
+    monkeypatch.setitem(messagebus.EVENTS, SomethingHappened, [on_something_happened])
+    monkeypatch.setitem(messagebus.HANDLER_DEPENDENCIES, raise_events, ("uow",))
+    monkeypatch.setitem(messagebus.HANDLER_DEPENDENCIES, on_something_happened, ())
+    bus = MessageBus(
+        uow=FakeUnitOfWork(),
+        uow_factory=FakeUnitOfWork,
+        sms_adapter=FakeSmsAdapter(),
+        email_adapter=FakeEmailAdapter(),
+        password_hasher=FakePasswordHasher(),
+        event_workers=EventWorkerPool(workers=2),
+    )
+    await bus.start()
+    await bus.call(raise_events, InvalidMessage())
+    await bus.stop()
+    assert published == [SomethingHappened()]
+
+
+@pytest.mark.asyncio
+async def test_event_worker_pool_retries_with_backpressure():
+    pool = EventWorkerPool(workers=1, max_queue_size=1, max_retries=2, retry_delay=0)
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise RuntimeError
+
+    await pool.start()
+    await pool.submit(flaky)
+    await pool.submit(flaky)
+    # the only worker is busy and the queue is full
+    blocked = asyncio.create_task(pool.submit(flaky))
+    await asyncio.sleep(0)
+    assert not blocked.done()
+    await blocked
+    await pool.stop()
+    assert len(attempts) == 5
@@ -0,0 +1,134 @@
+import asyncio
+from functools import partial
+from typing import List
+
+import pytest
+
+from adapters.payment_provider.fake import FakePaymentProvider
+from adapters.repositories.session.fake import FakeSession
+from domain.events.operations import OperationStatusChanged
+from domain.models.operations import Operation
+from domain.models.users import User
+from domain.types import TOperationStatus, TRole
+from service_layer.operations.processor import OperationProcessor
+from service_layer.unit_of_work.fake import FakeUnitOfWork
+
+from ..fixtures import build_operation
+
+
+async def add_operations(session: FakeSession, count: int) -> List[Operation]:
+    operations = [build_operation() for _ in range(count)]
+    uow = FakeUnitOfWork(session=session)
+    async with uow:
+        await uow.operations.add_many(operations)
+    return operations
+
+
+@pytest.mark.asyncio
+async def test_operation_processor_advances_statuses():
+    session = FakeSession()
+    [operation] = await add_operations(session, 1)
+    events = []
+
+    async def publish(event):
+        events.append(event)
+
+    processor = OperationProcessor(
+        uow_factory=partial(FakeUnitOfWork, session=session),
+        payment_provider=FakePaymentProvider(),
+        publish=publish,
+        batch_size=10,
+        lease=0,
+    )
+    assert await processor.run_once() == 1
+    assert operation.status == TOperationStatus.IN_PROGRESS
+    assert await processor.run_once() == 1
+    assert await processor.run_once() == 1
+    assert operation.status == TOperationStatus.COMPLETED
+    # completed operations aren't claimed anymore
+    assert await processor.run_once() == 0
+    assert events == [
+        OperationStatusChanged(
+            operation_id=operation.id,
+            operation_owner_company_id=operation.operation_owner_company_id,
+            previous_status=previous_status,
+            status=status,
+        )
+        for previous_status, status in (
+            (TOperationStatus.NEW, TOperationStatus.IN_PROGRESS),
+            (TOperationStatus.IN_PROGRESS, TOperationStatus.ACCEPTED),
+            (TOperationStatus.ACCEPTED, TOperationStatus.COMPLETED),
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_operation_processor_workers_skip_locked_operations():
+    session = FakeSession()
+    operations = await add_operations(session, 20)
+    processor = OperationProcessor(
+        uow_factory=partial(FakeUnitOfWork, session=session),
+        payment_provider=FakePaymentProvider(latency=0.01),
+        workers=4,
+        batch_size=5,
+    )
+    # every worker claims its own batch while the others wait for the provider
+    assert await asyncio.gather(*(processor.run_once() for _ in range(4))) == [5, 5, 5, 5]
+    assert all(o.status == TOperationStatus.IN_PROGRESS for o in operations)
+    assert session.locks == {}
+
+
+@pytest.mark.asyncio
+async def test_operation_processor_leases_claimed_operations():
+    session = FakeSession()
+    [operation] = await add_operations(session, 1)
+    provider = FakePaymentProvider(rejection_rate=0.5)
+    processor = OperationProcessor(
+        uow_factory=partial(FakeUnitOfWork, session=session), payment_provider=provider, lease=60
+    )
+    assert await processor.run_once() == 1
+    status = operation.status
+    # checked operations aren't claimed again until the lease expires
+    assert await processor.run_once() == 0
+    assert operation.status == status
+    # a resubmitted payment gets its stored status instead of a new one
+    for _ in range(10):
+        assert await provider.create_payment(operation) == status
+
+
+@pytest.mark.asyncio
+async def test_operation_processor_skips_operations_advanced_by_another_worker():
+    session = FakeSession()
+    [operation] = await add_operations(session, 1)
+    provider = FakePaymentProvider(latency=0.01)
+    processors = [
+        OperationProcessor(uow_factory=partial(FakeUnitOfWork, session=session), payment_provider=provider, lease=0)
+        for _ in range(2)
+    ]
+
+    async def run_after_claim(processor):
+        await asyncio.sleep(0.005)
+        return await processor.run_once()
+
+    # the second worker claims the operation while the first one waits for the provider
+    assert sorted(await asyncio.gather(processors[0].run_once(), run_after_claim(processors[1]))) == [0, 1]
+    assert operation.status == TOperationStatus.IN_PROGRESS
+
+
+@pytest.mark.asyncio
+async def test_operation_processor_emails_finished_payments(bus):
+    operation = build_operation()
+    async with bus.uow:
+        await bus.uow.users.add(
+            User(id=operation.operation_recipient_user_id, email="contractor@test.com", role=TRole.CONTRACTOR)
+        )
+        await bus.uow.operations.add(operation)
+    processor = OperationProcessor(
+        uow_factory=bus.get_uow, payment_provider=FakePaymentProvider(), publish=bus.publish, lease=0
+    )
+    for _ in range(3):
+        assert await processor.run_once() == 1
+    # only the final status is emailed
+    async with bus.uow:
+        messages = await bus.uow.outbox.filter(recipient="contractor@test.com")
+    assert [(m.subject, m.body) for m in messages] == [("Payment update", f"Payment {operation.id} is completed")]
@@ -0,0 +1,93 @@
+from datetime import timedelta
+from functools import partial
+
+import pytest
+
+from adapters.email.fake import FakeEmailAdapter
+from adapters.email.local import LocalEmailAdapter
+from adapters.password_hasher.fake import FakePasswordHasher
+from adapters.repositories.session.fake import FakeSession
+from adapters.sms.fake import FakeSmsAdapter
+from domain.commands.users import GenerateEmailCodeCommand, SignUpUserCommand
+from domain.models.outbox import OutboxMessage
+from domain.types import TRole
+from service_layer.messagebus.messagebus import MessageBus
+from service_layer.outbox.relay import OutboxRelay
+from service_layer.unit_of_work.fake import FakeUnitOfWork
+
+
+@pytest.mark.asyncio
+async def test_outbox_relay_delivers_committed_messages():
+    session = FakeSession()
+    email_adapter = FakeEmailAdapter()
+    bus = MessageBus(
+        uow=FakeUnitOfWork(session=session),
+        uow_factory=partial(FakeUnitOfWork, session=session),
+        sms_adapter=FakeSmsAdapter(),
+        email_adapter=FakeEmailAdapter(),
+        password_hasher=FakePasswordHasher(),
+    )
+    await bus.handler(
+        SignUpUserCommand(email="test@test.com", role=TRole.EMPLOYER, password="password", repeat_password="password")
+    )
+    user = await bus.handler(GenerateEmailCodeCommand(email="test@test.com"))
+    # nothing is sent by the command itself
+    assert bus.email_adapter._emails == []
+
+    relay = OutboxRelay(
+        uow_factory=bus.get_uow, email_adapter=email_adapter, sms_adapter=FakeSmsAdapter(), batch_size=10
+    )
+    assert await relay.run_once() == 1
+    assert await relay.run_once() == 0
+    assert email_adapter._emails == [
+        {"email": "test@test.com", "subject": "Email verification", "body": f"Verification code: {user.email_code}"}
+    ]
+    assert relay.metrics.sent == 1
+
+
+@pytest.mark.asyncio
+async def test_outbox_relay_retries_failed_messages():
+    session = FakeSession()
+    uow = FakeUnitOfWork(session=session)
+    async with uow:
+        await uow.outbox.add(OutboxMessage.email("test@test.com", "Invitation", "Invitation code"))
+    relay = OutboxRelay(
+        uow_factory=partial(FakeUnitOfWork, session=session),
+        email_adapter=LocalEmailAdapter(failure_rate=1.0),
+        sms_adapter=FakeSmsAdapter(),
+        max_attempts=2,
+        retry_delay=0,
+    )
+    assert await relay.run_once() == 1
+    assert await relay.run_once() == 1
+    # gives up after max_attempts
+    assert await relay.run_once() == 0
+    async with uow:
+        message = (await uow.outbox.all())[0]
+    assert message.attempts == 2
+    assert message.sent_date is None
+    assert message.failed_date is not None
+    assert "ConnectionError" in message.error
+    assert relay.metrics.failed == 2
+
+
+@pytest.mark.asyncio
+async def test_outbox_relay_backs_off_failed_messages():
+    session = FakeSession()
+    uow = FakeUnitOfWork(session=session)
+    async with uow:
+        await uow.outbox.add(OutboxMessage.email("test@test.com", "Invitation", "Invitation code"))
+    relay = OutboxRelay(
+        uow_factory=partial(FakeUnitOfWork, session=session),
+        email_adapter=LocalEmailAdapter(failure_rate=1.0),
+        sms_adapter=FakeSmsAdapter(),
+        retry_delay=60,
+    )
+    assert await relay.run_once() == 1
+    # the next attempt waits for the retry delay
+    assert await relay.run_once() == 0
+    async with uow:
+        message = (await uow.outbox.all())[0]
+    assert message.attempts == 1
+    assert message.failed_date is None
+    assert message.next_attempt_date - message.updated_date == timedelta(seconds=60)
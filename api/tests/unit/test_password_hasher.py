@@ -0,0 +1,36 @@
+import asyncio
+import hashlib
+import os
+
+import pytest
+
+from adapters.password_hasher.fake import FakePasswordHasher
+from adapters.password_hasher.pool import PoolPasswordHasher
+
+
+@pytest.mark.asyncio
+async def test_pool_password_hasher():
+    hasher = PoolPasswordHasher(executor="thread", max_workers=2, max_queue_size=2, iterations=1000)
+    salt = os.urandom(16)
+    password_hashes = await asyncio.gather(*[hasher.hash("password", salt) for _ in range(6)])
+    await hasher.close()
+    assert set(password_hashes) == {hashlib.pbkdf2_hmac("sha256", b"password", salt, 1000)}
+    assert hasher.metrics.submitted == 6
+    assert hasher.metrics.completed == 6
+    assert hasher.metrics.failed == 0
+    assert hasher.metrics.in_flight == 0
+    assert hasher.metrics.max_in_flight == 2
+    assert hasher.metrics.waited > 0
+
+
+@pytest.mark.asyncio
+async def test_pool_password_hasher_matches_fake_hasher():
+    salt = os.urandom(16)
+    hasher = PoolPasswordHasher(executor="thread", max_workers=1)
+    assert await hasher.hash("password", salt) == await FakePasswordHasher().hash("password", salt)
+    await hasher.close()
+
+
+def test_pool_password_hasher_invalid_executor():
+    with pytest.raises(ValueError):
+        PoolPasswordHasher(executor="invalid")
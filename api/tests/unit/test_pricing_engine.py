@@ -0,0 +1,23 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from domain.models.pricing import RateSnapshot
+from domain.types import TCurrency
+from service_layer.pricing.engine import PricingEngine
+
+
+def test_pricing_engine_quote():
+    snapshot = RateSnapshot(created_date=datetime.utcnow(), rates={(TCurrency.EUR, TCurrency.USD): Decimal("1.0875")})
+    engine = PricingEngine(snapshot, our_fee_percent=Decimal("0.5"), provider_fee_percent=Decimal("0.2"))
+    # 2.175 is rounded half to even, to 2.18
+    assert engine.quote(TCurrency.EUR, TCurrency.USD, [Decimal("2.00"), Decimal("100.00")]) == [
+        (Decimal("2.19"), Decimal("0.01"), Decimal("0.00")),
+        (Decimal("109.51"), Decimal("0.54"), Decimal("0.22")),
+    ]
+    assert engine.quote(TCurrency.USD, TCurrency.USD, [Decimal("10.00")]) == [
+        (Decimal("10.07"), Decimal("0.05"), Decimal("0.02"))
+    ]
+    with pytest.raises(ValueError):
+        engine.quote(TCurrency.USD, TCurrency.EUR, [Decimal("10.00")])
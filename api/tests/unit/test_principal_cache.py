@@ -0,0 +1,31 @@
+import uuid
+
+import pytest
+
+from adapters.principal_cache.memory import InMemoryPrincipalCache
+from domain.models.principals import Principal
+from domain.types import TRole
+
+
+@pytest.mark.asyncio
+async def test_principal_cache():
+    cache = InMemoryPrincipalCache(ttl=60, max_size=2)
+    principals = [Principal(id=uuid.uuid4(), role=TRole.EMPLOYER, is_active=True) for _ in range(3)]
+    for principal in principals:
+        await cache.set(principal)
+    # least recently used principal is evicted
+    assert not await cache.get(principals[0].id)
+    assert await cache.get(principals[1].id) == principals[1]
+    assert await cache.get(principals[2].id) == principals[2]
+    await cache.invalidate(principals[1].id)
+    assert not await cache.get(principals[1].id)
+    assert cache.hits == 2
+    assert cache.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_principal_cache_ttl():
+    cache = InMemoryPrincipalCache(ttl=-1)
+    principal = Principal(id=uuid.uuid4(), role=TRole.CONTRACTOR, is_active=False)
+    await cache.set(principal)
+    assert not await cache.get(principal.id)
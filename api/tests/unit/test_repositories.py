@@ -0,0 +1,97 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from adapters.repositories.exceptions import InvalidQueryParameter
+from adapters.repositories.fake.bank_accounts import RecipientBankAccountFakeRepository
+from adapters.repositories.fake.companies import CompanyFakeRepository
+from adapters.repositories.fake.operations import OperationsFakeRepository
+from adapters.repositories.session.fake import FakeSession
+from domain.commands.generic import AbstractListCommand
+from domain.cursors import encode_cursor
+from domain.models.companies import Company
+
+
+@pytest.mark.asyncio
+async def test_fake_repository_list_search_sort():
+    repository = CompanyFakeRepository(session=FakeSession())
+    owner_id = uuid.uuid4()
+    for name in ("Beta Ltd", "alpha inc", "Gamma Ltd"):
+        await repository.add(Company(id=uuid.uuid4(), name=name, owner_id=owner_id))
+
+    companies = await repository.list(sort_by="name")
+    assert [c.name for c in companies] == ["Beta Ltd", "Gamma Ltd", "alpha inc"]
+    companies = await repository.list(search="LTD", sort_by="-name")
+    assert [c.name for c in companies] == ["Gamma Ltd", "Beta Ltd"]
+    companies = await repository.list(search="ltd", sort_by="name", offset=1, limit=1)
+    assert [c.name for c in companies] == ["Gamma Ltd"]
+
+
+@pytest.mark.asyncio
+async def test_fake_repository_list_invalid_sort_by():
+    repository = CompanyFakeRepository(session=FakeSession())
+    with pytest.raises(InvalidQueryParameter):
+        await repository.list(sort_by="owner_id")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("repository_cls", [OperationsFakeRepository, RecipientBankAccountFakeRepository])
+async def test_fake_repository_list_search_not_supported(repository_cls):
+    # enum columns are filtered by exact match instead of icontains
+    repository = repository_cls(session=FakeSession())
+    with pytest.raises(InvalidQueryParameter):
+        await repository.list(search="USD")
+
+
+@pytest.mark.asyncio
+async def test_fake_repository_list_cursor():
+    repository = CompanyFakeRepository(session=FakeSession())
+    owner_id = uuid.uuid4()
+    created_date = datetime.utcnow()
+    for i in range(5):
+        # two companies share created_date to check the id tie-breaker
+        await repository.add(
+            Company(id=uuid.uuid4(), name=str(i), owner_id=owner_id, created_date=created_date - timedelta(days=i // 2))
+        )
+    command = AbstractListCommand(limit=2)
+    pages = []
+    while True:
+        companies = await repository.list(limit=command.limit, cursor=command.cursor)
+        pages.append(companies)
+        command.cursor = command.get_next_cursor(companies)
+        if not command.cursor:
+            break
+    assert [len(page) for page in pages] == [2, 2, 1]
+    listed = [c for page in pages for c in page]
+    assert listed == await repository.list(limit=5)
+    assert len({c.id for c in listed}) == 5
+
+    with pytest.raises(InvalidQueryParameter):
+        await repository.list(cursor="invalid")
+    with pytest.raises(InvalidQueryParameter):
+        await repository.list(cursor=encode_cursor(listed[0]), sort_by="name")
+
+
+@pytest.mark.asyncio
+async def test_fake_repository_invalid_prefetch():
+    repository = CompanyFakeRepository(session=FakeSession())
+    with pytest.raises(InvalidQueryParameter):
+        await repository.list(prefetch=["owner"])
+
+
+@pytest.mark.asyncio
+async def test_fake_repository_fields():
+    repository = CompanyFakeRepository(session=FakeSession())
+    company = Company(id=uuid.uuid4(), name="company", owner_id=uuid.uuid4(), created_date=datetime.utcnow())
+    await repository.add(company)
+    result = await repository.first(id=company.id, fields=["name"])
+    assert result.dict(exclude_unset=True) == {"id": company.id, "name": "company"}
+    [result] = await repository.list(fields=["name"])
+    assert result.dict(exclude_unset=True) == {
+        "id": company.id,
+        "created_date": company.created_date,
+        "name": "company",
+    }
+    # stored objects stay complete
+    assert await repository.get(id=company.id) == company
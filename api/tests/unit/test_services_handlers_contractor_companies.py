@@ -0,0 +1,64 @@
+import uuid
+
+import pytest
+
+from adapters.email.fake import FakeEmailAdapter
+from adapters.principal_cache.memory import InMemoryPrincipalCache
+from adapters.sms.fake import FakeSmsAdapter
+from domain.commands.contractor.companies import (
+    ContractorCompanyLeaveCommand,
+    ContractorCompanyListCommand,
+    ContractorCompanyRetrieveCommand,
+)
+from domain.models.companies import Company
+from service_layer.exceptions import PermissionDeniedException
+from service_layer.messagebus.messagebus import MessageBus
+from service_layer.unit_of_work.fake import FakeUnitOfWork
+
+from ..fixtures import create_contractor_with_company
+
+
+@pytest.mark.asyncio
+async def test_company_retrieve_handler(bus):
+    contractor, company = await create_contractor_with_company(bus)
+    result = await bus.handler(ContractorCompanyRetrieveCommand(company_id=company.id), current_user_id=contractor.id)
+    assert result.id == company.id
+    # memberships are not cached across messages
+    assert (await bus.principal_cache.get(contractor.id)).company_ids == set()
+
+    with pytest.raises(PermissionDeniedException):
+        await bus.handler(ContractorCompanyRetrieveCommand(company_id=uuid.uuid4()), current_user_id=contractor.id)
+
+
+@pytest.mark.asyncio
+async def test_company_leave_handler_revokes_access(bus):
+    contractor, company = await create_contractor_with_company(bus)
+    await bus.handler(ContractorCompanyLeaveCommand(company_id=company.id), current_user_id=contractor.id)
+    with pytest.raises(PermissionDeniedException):
+        await bus.handler(ContractorCompanyRetrieveCommand(company_id=company.id), current_user_id=contractor.id)
+
+
+@pytest.mark.asyncio
+async def test_company_leave_handler_revokes_access_on_other_workers(bus):
+    contractor, company = await create_contractor_with_company(bus)
+    # another worker shares the database, but not the principal cache
+    other_bus = MessageBus(
+        uow=FakeUnitOfWork(session=bus.uow.session),
+        uow_factory=lambda: FakeUnitOfWork(session=bus.uow.session),
+        sms_adapter=FakeSmsAdapter(),
+        email_adapter=FakeEmailAdapter(),
+        principal_cache=InMemoryPrincipalCache(),
+    )
+    await other_bus.handler(ContractorCompanyRetrieveCommand(company_id=company.id), current_user_id=contractor.id)
+    await bus.handler(ContractorCompanyLeaveCommand(company_id=company.id), current_user_id=contractor.id)
+    with pytest.raises(PermissionDeniedException):
+        await other_bus.handler(ContractorCompanyRetrieveCommand(company_id=company.id), current_user_id=contractor.id)
+
+
+@pytest.mark.asyncio
+async def test_company_list_handler(bus):
+    contractor, company = await create_contractor_with_company(bus)
+    async with bus.uow:
+        await bus.uow.companies.add(Company(id=uuid.uuid4(), name="other", owner_id=uuid.uuid4()))
+    result = await bus.handler(ContractorCompanyListCommand(), current_user_id=contractor.id)
+    assert [c.id for c in result] == [company.id]
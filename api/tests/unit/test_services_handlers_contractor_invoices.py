@@ -0,0 +1,161 @@
+import uuid
+from decimal import Decimal
+
+import pytest
+
+from domain.commands.contractor.invoices import (
+    ContractorInvoiceCreateCommand,
+    ContractorInvoiceDeleteCommand,
+    ContractorInvoiceRetrieveCommand,
+    ContractorInvoiceUpdateCommand,
+    InvoiceItemCreate,
+    InvoiceItemUpdate,
+)
+from domain.models.bank_accounts import RecipientBankAccount
+from domain.models.companies import CompanyM2MEmployer
+from domain.models.users import User
+from domain.types import TBankAccountType, TCountry, TCurrency, TRole
+from service_layer.exceptions import PermissionDeniedException, ValidationException
+
+from ..fixtures import create_contractor_with_company
+
+
+@pytest.mark.asyncio
+async def test_invoice_create_handler(bus):
+    contractor, company = await create_contractor_with_company(bus)
+    employer = User(id=uuid.uuid4(), email="employer@test.com", role=TRole.EMPLOYER, is_active=True)
+    async with bus.uow:
+        await bus.uow.users.add(employer)
+        await bus.uow.companies_m2m_employers.add(
+            CompanyM2MEmployer(id=uuid.uuid4(), company_id=company.id, employer_id=employer.id)
+        )
+    command = ContractorInvoiceCreateCommand(
+        for_company_id=company.id,
+        recipient_account_id=uuid.uuid4(),
+        items=[InvoiceItemCreate(price=Decimal("10.50"), quantity=i + 1, descripion=f"item {i}") for i in range(3)],
+    )
+    invoice = await bus.handler(command, current_user_id=contractor.id, current_company_id=company.id)
+    assert [(i.amount, i.quantity, i.descripion) for i in invoice.items] == [
+        (Decimal("10.50"), i + 1, f"item {i}") for i in range(3)
+    ]
+    async with bus.uow:
+        items = await bus.uow.invoice_items.filter(invoice_id=invoice.id)
+    assert {i.id for i in items} == {i.id for i in invoice.items}
+    async with bus.uow:
+        assert (await bus.uow.invoices.get(id=invoice.id)).total_amount == Decimal("63.00")
+    # employers of the company are notified after the commit
+    async with bus.uow:
+        messages = await bus.uow.outbox.filter(recipient="employer@test.com")
+    assert [(m.subject, m.body) for m in messages] == [("New invoice", f"Invoice {invoice.id} is waiting for payment")]
+
+
+@pytest.mark.asyncio
+async def test_invoice_update_handler(bus):
+    contractor, company = await create_contractor_with_company(bus)
+    command = ContractorInvoiceCreateCommand(
+        for_company_id=company.id,
+        recipient_account_id=uuid.uuid4(),
+        items=[InvoiceItemCreate(price=Decimal("1"), quantity=1, descripion=f"item {i}") for i in range(3)],
+    )
+    invoice = await bus.handler(command, current_user_id=contractor.id, current_company_id=company.id)
+    kept, deleted = invoice.items[0], invoice.items[1:]
+    command = ContractorInvoiceUpdateCommand(
+        invoice_id=invoice.id,
+        items=[
+            InvoiceItemUpdate(invoice_item_id=kept.id, quantity=5),
+            InvoiceItemUpdate(price=Decimal("2"), quantity=2, descripion="new item"),
+        ],
+    )
+    invoice = await bus.handler(command, current_user_id=contractor.id, current_company_id=company.id)
+    async with bus.uow:
+        items = {i.id: i for i in await bus.uow.invoice_items.filter(invoice_id=invoice.id)}
+    assert set(items) == {i.id for i in invoice.items}
+    assert kept.id in items and not any(i.id in items for i in deleted)
+    assert (items[kept.id].amount, items[kept.id].quantity) == (Decimal("1"), 5)
+    assert [(i.amount, i.descripion) for i in items.values() if i.id != kept.id] == [(Decimal("2"), "new item")]
+    async with bus.uow:
+        assert (await bus.uow.invoices.get(id=invoice.id)).total_amount == Decimal("9")
+
+    command = ContractorInvoiceUpdateCommand(
+        invoice_id=invoice.id, items=[InvoiceItemUpdate(invoice_item_id=deleted[0].id)]
+    )
+    with pytest.raises(ValidationException):
+        await bus.handler(command, current_user_id=contractor.id, current_company_id=company.id)
+
+
+@pytest.mark.asyncio
+async def test_invoice_retrieve_handler(bus):
+    contractor, company = await create_contractor_with_company(bus)
+    recipient_account = RecipientBankAccount(
+        id=uuid.uuid4(),
+        recipient_owner_user_id=contractor.id,
+        recipient_bank_account_type=TBankAccountType.PERSONAL,
+        recipient_currency=TCurrency.USD,
+        recipient_country_alpha3=TCountry.USA,
+    )
+    async with bus.uow:
+        await bus.uow.recipient_bank_accounts.add(recipient_account)
+    command = ContractorInvoiceCreateCommand(
+        for_company_id=company.id,
+        recipient_account_id=recipient_account.id,
+        items=[InvoiceItemCreate(price=Decimal("1"), quantity=1, descripion="item")],
+    )
+    invoice = await bus.handler(command, current_user_id=contractor.id, current_company_id=company.id)
+    result = await bus.handler(
+        ContractorInvoiceRetrieveCommand(invoice_id=invoice.id),
+        current_user_id=contractor.id,
+        current_company_id=company.id,
+    )
+    assert result.recipient_account == recipient_account
+    assert [i.id for i in result.items] == [i.id for i in invoice.items]
+
+
+@pytest.mark.asyncio
+async def test_invoice_delete_handler(bus):
+    contractor, company = await create_contractor_with_company(bus)
+    command = ContractorInvoiceCreateCommand(
+        for_company_id=company.id,
+        recipient_account_id=uuid.uuid4(),
+        items=[InvoiceItemCreate(price=Decimal("1"), quantity=1, descripion=f"item {i}") for i in range(3)],
+    )
+    invoice = await bus.handler(command, current_user_id=contractor.id, current_company_id=company.id)
+    command = ContractorInvoiceDeleteCommand(invoice_id=invoice.id)
+    with pytest.raises(PermissionDeniedException):
+        await bus.handler(command, current_user_id=contractor.id, current_company_id=uuid.uuid4())
+    await bus.handler(command, current_user_id=contractor.id, current_company_id=company.id)
+    async with bus.uow:
+        assert not await bus.uow.invoices.exists(id=invoice.id)
+        assert not await bus.uow.invoice_items.exists(invoice_id=invoice.id)
+        assert await bus.uow.invoice_items.delete_where(invoice_id=invoice.id) == 0
+
+
+@pytest.mark.asyncio
+async def test_paid_invoice_update_and_delete_handlers(bus):
+    contractor, company = await create_contractor_with_company(bus)
+    command = ContractorInvoiceCreateCommand(
+        for_company_id=company.id,
+        recipient_account_id=uuid.uuid4(),
+        items=[InvoiceItemCreate(price=Decimal("1"), quantity=1, descripion="item")],
+    )
+    invoice = await bus.handler(command, current_user_id=contractor.id, current_company_id=company.id)
+    async with bus.uow:
+        invoice.operation_id = uuid.uuid4()
+        await bus.uow.invoices.update(invoice)
+
+    command = ContractorInvoiceUpdateCommand(
+        invoice_id=invoice.id, items=[InvoiceItemUpdate(invoice_item_id=invoice.items[0].id, quantity=5)]
+    )
+    with pytest.raises(ValidationException) as e:
+        await bus.handler(command, current_user_id=contractor.id, current_company_id=company.id)
+    assert e.value.detail == "Paid invoice can't be updated"
+    with pytest.raises(ValidationException) as e:
+        await bus.handler(
+            ContractorInvoiceDeleteCommand(invoice_id=invoice.id),
+            current_user_id=contractor.id,
+            current_company_id=company.id,
+        )
+    assert e.value.detail == "Paid invoice can't be deleted"
+    async with bus.uow:
+        stored = await bus.uow.invoices.get(id=invoice.id)
+        assert stored.total_amount == Decimal("1")
+        assert await bus.uow.invoice_items.exists(invoice_id=invoice.id)
@@ -0,0 +1,24 @@
+import uuid
+
+import pytest
+
+from domain.commands.employer.companies import EmployerCompanyCreateCommand, EmployerCompanyListCommand
+from domain.models.users import User
+from domain.types import TRole
+
+
+@pytest.mark.asyncio
+async def test_company_list_handler(bus):
+    employers = [
+        User(id=uuid.uuid4(), email=f"employer{i}@test.com", role=TRole.EMPLOYER, is_active=True) for i in range(2)
+    ]
+    async with bus.uow:
+        for employer in employers:
+            await bus.uow.users.add(employer)
+    for name in ("b", "a"):
+        await bus.handler(EmployerCompanyCreateCommand(name=name), current_user_id=employers[0].id)
+    await bus.handler(EmployerCompanyCreateCommand(name="other"), current_user_id=employers[1].id)
+
+    command = EmployerCompanyListCommand(sort_by="name")
+    result = await bus.handler(command, current_user_id=employers[0].id)
+    assert [c.name for c in result] == ["a", "b"]
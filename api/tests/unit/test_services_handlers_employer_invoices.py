@@ -0,0 +1,239 @@
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from domain.commands.employer.invoices import EmployerBulkInvoicePayCommand
+from domain.commands.employer.operations import EmployerOperationBatchRetrieveCommand
+from domain.models.bank_accounts import RecipientBankAccount, SenderBankAccount
+from domain.models.companies import Company, CompanyM2MEmployer
+from domain.models.invoices import Invoice, InvoiceItem
+from domain.models.users import User
+from domain.types import TBankAccountType, TCountry, TCurrency, TOperationBatchStatus, TRole
+from service_layer.exceptions import ValidationException
+from service_layer.messagebus.messagebus import MessageBus
+from service_layer.operations.batches import OperationBatchProcessor
+from service_layer.pricing.engine import PricingEngine
+
+
+async def create_invoice(bus: MessageBus, company: Company, recipient_account: RecipientBankAccount, amounts):
+    invoice = Invoice(
+        id=uuid.uuid4(),
+        created_date=datetime.utcnow(),
+        created_by_id=recipient_account.recipient_owner_user_id,
+        for_company_id=company.id,
+        recipient_account_id=recipient_account.id,
+    )
+    invoice.set_items(
+        [
+            InvoiceItem(id=uuid.uuid4(), invoice_id=invoice.id, amount=amount, quantity=2, descripion="work")
+            for amount in amounts
+        ]
+    )
+    async with bus.uow:
+        await bus.uow.invoices.add(invoice)
+        await bus.uow.invoice_items.add_many(invoice.items)
+    return invoice
+
+
+async def create_company_with_accounts(bus: MessageBus):
+    employer = User(id=uuid.uuid4(), email="employer@test.com", role=TRole.EMPLOYER, is_active=True)
+    company = Company(id=uuid.uuid4(), name="company", owner_id=employer.id)
+    sender_account = SenderBankAccount(
+        id=uuid.uuid4(),
+        sender_owner_company_id=company.id,
+        sender_bank_account_type=TBankAccountType.BUSINESS,
+        sender_currency=TCurrency.USD,
+        sender_country_alpha3=TCountry.USA,
+    )
+    recipient_accounts = [
+        RecipientBankAccount(
+            id=uuid.uuid4(),
+            recipient_owner_user_id=uuid.uuid4(),
+            recipient_bank_account_type=TBankAccountType.PERSONAL,
+            recipient_currency=currency,
+            recipient_country_alpha3=TCountry.USA,
+        )
+        for currency in (TCurrency.USD, TCurrency.EUR)
+    ]
+    async with bus.uow:
+        await bus.uow.users.add(employer)
+        await bus.uow.companies.add(company)
+        await bus.uow.companies_m2m_employers.add(
+            CompanyM2MEmployer(id=uuid.uuid4(), company_id=company.id, employer_id=employer.id)
+        )
+        await bus.uow.sender_bank_accounts.add(sender_account)
+        await bus.uow.recipient_bank_accounts.add_many(recipient_accounts)
+    return employer, company, sender_account, recipient_accounts
+
+
+@pytest.mark.asyncio
+async def test_invoice_bulk_pay_handler(bus):
+    employer, company, sender_account, recipient_accounts = await create_company_with_accounts(bus)
+    invoices = [
+        await create_invoice(bus, company, recipient_accounts[0], [Decimal("10.00"), Decimal("1.50")]),
+        await create_invoice(bus, company, recipient_accounts[0], [Decimal("5.00")]),
+        await create_invoice(bus, company, recipient_accounts[1], [Decimal("7.00")]),
+    ]
+    context = dict(current_user_id=employer.id, current_company_id=company.id)
+
+    with pytest.raises(ValidationException) as e:
+        await bus.handler(EmployerBulkInvoicePayCommand(invoice_ids=[i.id for i in invoices]), **context)
+    assert e.value.detail.startswith("Invoices don't have a sender bank account of this company")
+
+    command = EmployerBulkInvoicePayCommand(
+        invoice_ids=[i.id for i in invoices],
+        sender_account_id=sender_account.id,
+    )
+    batch = await bus.handler(command, **context)
+    assert batch.status == TOperationBatchStatus.NEW
+    processor = OperationBatchProcessor(uow_factory=bus.get_uow, rate_table=bus.rate_table)
+    assert await processor.run_once()
+    assert not await processor.run_once()
+    batch = await bus.handler(EmployerOperationBatchRetrieveCommand(batch_id=batch.id), **context)
+    assert (batch.status, batch.invoices_count, batch.processed_count, batch.operations_count) == (
+        TOperationBatchStatus.COMPLETED,
+        3,
+        3,
+        2,
+    )
+
+    async with bus.uow:
+        operations = await bus.uow.operations.filter(batch_id=batch.id)
+        paid = await bus.uow.invoices.filter(id__in=[i.id for i in invoices])
+    amounts = {o.recipient_account_id: (o.sender_amount, o.recipient_amount, o.our_fee) for o in operations}
+    # invoices of the same accounts are paid by one operation, senders pay in their currency with fees
+    assert amounts == {
+        recipient_accounts[0].id: (Decimal("33.23"), Decimal("33.00"), Decimal("0.16")),
+        recipient_accounts[1].id: (Decimal("15.33"), Decimal("14.00"), Decimal("0.08")),
+    }
+    assert bus.rate_table.requests == 1
+    assert {i.operation_id for i in paid} == {o.id for o in operations}
+    assert {i.sender_account_id for i in paid} == {sender_account.id}
+
+    with pytest.raises(ValidationException) as e:
+        await bus.handler(command, **context)
+    assert e.value.detail.startswith("Invoices are already paid")
+
+
+@pytest.mark.asyncio
+async def test_invoice_bulk_pay_handler_rejects_queued_invoices(bus):
+    employer, company, sender_account, recipient_accounts = await create_company_with_accounts(bus)
+    invoices = [await create_invoice(bus, company, recipient_accounts[0], [Decimal("1.00")]) for _ in range(3)]
+    context = dict(current_user_id=employer.id, current_company_id=company.id)
+    command = EmployerBulkInvoicePayCommand(invoice_ids=[i.id for i in invoices], sender_account_id=sender_account.id)
+    batch = await bus.handler(command, **context)
+
+    with pytest.raises(ValidationException) as e:
+        await bus.handler(
+            EmployerBulkInvoicePayCommand(invoice_ids=[invoices[0].id], sender_account_id=sender_account.id),
+            **context,
+        )
+    assert e.value.detail == f"Invoices are already being paid: {invoices[0].id}"
+
+    # invoices deleted before their chunk is paid are counted in the batch progress
+    async with bus.uow:
+        await bus.uow.invoices.delete(invoices[1].id)
+    processor = OperationBatchProcessor(uow_factory=bus.get_uow, rate_table=bus.rate_table)
+    assert await processor.run_once()
+    batch = await bus.handler(EmployerOperationBatchRetrieveCommand(batch_id=batch.id), **context)
+    assert (batch.status, batch.processed_count, batch.operations_count, batch.skipped_count) == (
+        TOperationBatchStatus.COMPLETED,
+        3,
+        1,
+        1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_operation_batch_processor_resumes_after_failure(bus, monkeypatch):
+    employer, company, sender_account, recipient_accounts = await create_company_with_accounts(bus)
+    invoices = [await create_invoice(bus, company, recipient_accounts[i % 2], [Decimal("1.00")]) for i in range(3)]
+    context = dict(current_user_id=employer.id, current_company_id=company.id)
+    command = EmployerBulkInvoicePayCommand(invoice_ids=[i.id for i in invoices], sender_account_id=sender_account.id)
+    batch = await bus.handler(command, **context)
+
+    processor = OperationBatchProcessor(uow_factory=bus.get_uow, rate_table=bus.rate_table, chunk_size=2)
+    assert await processor.run_once()
+    batch = await bus.handler(EmployerOperationBatchRetrieveCommand(batch_id=batch.id), **context)
+    assert (batch.status, batch.processed_count, batch.operations_count) == (TOperationBatchStatus.IN_PROGRESS, 2, 2)
+
+    def unpriceable(self, operations):
+        raise ValueError("No exchange rate from EUR to USD")
+
+    monkeypatch.setattr(PricingEngine, "price", unpriceable)
+    assert not await processor.run_once()
+    batch = await bus.handler(EmployerOperationBatchRetrieveCommand(batch_id=batch.id), **context)
+    assert (batch.status, batch.processed_count, batch.attempts) == (TOperationBatchStatus.IN_PROGRESS, 2, 1)
+    assert "No exchange rate" in batch.error
+    monkeypatch.undo()
+
+    async def unavailable():
+        raise ConnectionError("rates are unavailable")
+
+    # a restarted processor continues after the last committed chunk with the rates of the first one
+    monkeypatch.setattr(bus.rate_table, "get_snapshot", unavailable)
+    processor = OperationBatchProcessor(uow_factory=bus.get_uow, rate_table=bus.rate_table, chunk_size=2)
+    assert await processor.run_once()
+    batch = await bus.handler(EmployerOperationBatchRetrieveCommand(batch_id=batch.id), **context)
+    assert (batch.status, batch.processed_count, batch.operations_count) == (TOperationBatchStatus.COMPLETED, 3, 3)
+    assert batch.error is None
+    assert bus.rate_table.requests == 1
+    async with bus.uow:
+        paid = await bus.uow.invoices.filter(id__in=[i.id for i in invoices])
+    assert all(i.operation_id for i in paid)
+
+
+@pytest.mark.asyncio
+async def test_operation_batch_processor_keeps_rate_snapshot_of_failed_chunk(bus, monkeypatch):
+    employer, company, sender_account, recipient_accounts = await create_company_with_accounts(bus)
+    invoice = await create_invoice(bus, company, recipient_accounts[0], [Decimal("1.00")])
+    context = dict(current_user_id=employer.id, current_company_id=company.id)
+    command = EmployerBulkInvoicePayCommand(invoice_ids=[invoice.id], sender_account_id=sender_account.id)
+    batch = await bus.handler(command, **context)
+
+    def unpriceable(self, operations):
+        raise ValueError("No exchange rate from EUR to USD")
+
+    monkeypatch.setattr(PricingEngine, "price", unpriceable)
+    processor = OperationBatchProcessor(uow_factory=bus.get_uow, rate_table=bus.rate_table)
+    assert not await processor.run_once()
+    monkeypatch.undo()
+    async with bus.uow:
+        batch = await bus.uow.operation_batches.get(id=batch.id)
+    snapshot = batch.get_rate_snapshot()
+    assert snapshot.rates == bus.rate_table.rates
+    assert (batch.processed_count, batch.attempts) == (0, 1)
+
+    # the retry is priced with the stored rates even if the rates changed since
+    bus.rate_table.rates = {}
+    assert await processor.run_once()
+    async with bus.uow:
+        batch = await bus.uow.operation_batches.get(id=batch.id)
+        operations = await bus.uow.operations.filter(batch_id=batch.id)
+    assert (batch.status, batch.rates_date) == (TOperationBatchStatus.COMPLETED, snapshot.created_date)
+    assert [o.sender_amount for o in operations] == [Decimal("2.01")]
+    assert bus.rate_table.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_operation_batch_processor_fails_batch(bus, monkeypatch):
+    employer, company, sender_account, recipient_accounts = await create_company_with_accounts(bus)
+    invoice = await create_invoice(bus, company, recipient_accounts[0], [Decimal("1.00")])
+    context = dict(current_user_id=employer.id, current_company_id=company.id)
+    command = EmployerBulkInvoicePayCommand(invoice_ids=[invoice.id], sender_account_id=sender_account.id)
+    batch = await bus.handler(command, **context)
+
+    async def unavailable():
+        raise ConnectionError("rates are unavailable")
+
+    monkeypatch.setattr(bus.rate_table, "get_snapshot", unavailable)
+    processor = OperationBatchProcessor(uow_factory=bus.get_uow, rate_table=bus.rate_table, max_attempts=2)
+    assert not await processor.run_once()
+    assert not await processor.run_once()
+    # failed batches are not claimed again
+    assert not await processor.run_once()
+    batch = await bus.handler(EmployerOperationBatchRetrieveCommand(batch_id=batch.id), **context)
+    assert (batch.status, batch.processed_count, batch.attempts) == (TOperationBatchStatus.FAILED, 0, 2)
+    assert processor.metrics.errors == 2
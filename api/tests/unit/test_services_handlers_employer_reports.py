@@ -0,0 +1,92 @@
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from adapters.payment_provider.fake import FakePaymentProvider
+from domain.commands.employer.reports import (
+    EmployerPaymentsByContractorCommand,
+    EmployerPaymentsByCurrencyCommand,
+    EmployerPaymentsByMonthCommand,
+)
+from domain.models.companies import Company, CompanyM2MEmployer
+from domain.models.invoices import Invoice
+from domain.models.users import User
+from domain.types import TCurrency, TOperationStatus, TRole
+from service_layer.exceptions import ValidationException
+from service_layer.operations.processor import OperationProcessor
+
+from ..fixtures import build_operation
+
+
+@pytest.mark.asyncio
+async def test_payment_reports(bus):
+    employer = User(id=uuid.uuid4(), email="employer@test.com", role=TRole.EMPLOYER, is_active=True)
+    company = Company(id=uuid.uuid4(), name="company", owner_id=employer.id)
+    contractor_ids = [uuid.uuid4(), uuid.uuid4()]
+    operations = [
+        build_operation(
+            TCurrency.USD,
+            operation_owner_company_id=company.id,
+            operation_sender_user_id=employer.id,
+            operation_recipient_user_id=contractor_ids[0],
+        ),
+        build_operation(
+            TCurrency.USD,
+            operation_owner_company_id=company.id,
+            operation_sender_user_id=employer.id,
+            operation_recipient_user_id=contractor_ids[0],
+        ),
+        build_operation(
+            TCurrency.EUR,
+            operation_owner_company_id=company.id,
+            operation_sender_user_id=employer.id,
+            operation_recipient_user_id=contractor_ids[1],
+        ),
+    ]
+    async with bus.uow:
+        await bus.uow.users.add(employer)
+        await bus.uow.companies.add(company)
+        await bus.uow.companies_m2m_employers.add(
+            CompanyM2MEmployer(id=uuid.uuid4(), company_id=company.id, employer_id=employer.id)
+        )
+        await bus.uow.operations.add_many(operations)
+        await bus.uow.invoices.add_many(
+            [
+                Invoice(
+                    id=uuid.uuid4(),
+                    created_by_id=operation.operation_recipient_user_id,
+                    for_company_id=company.id,
+                    recipient_account_id=uuid.uuid4(),
+                    operation_id=operation.id,
+                )
+                for operation in (operations[0], *operations)
+            ]
+        )
+    processor = OperationProcessor(uow_factory=bus.get_uow, payment_provider=FakePaymentProvider(), lease=0)
+    # summaries are updated once, when operations are completed
+    for _ in range(4):
+        await processor.run_once()
+    assert {o.status for o in operations} == {TOperationStatus.COMPLETED}
+
+    context = dict(current_user_id=employer.id, current_company_id=company.id)
+    month = datetime.utcnow().date().replace(day=1)
+    rows = await bus.handler(EmployerPaymentsByMonthCommand(), **context)
+    assert [(r.month, r.currency, r.amount, r.fees, r.operations_count, r.invoices_count) for r in rows] == [
+        (month, TCurrency.EUR, Decimal("10.07"), Decimal("0.07"), 1, 1),
+        (month, TCurrency.USD, Decimal("20.14"), Decimal("0.14"), 2, 3),
+    ]
+    rows = await bus.handler(EmployerPaymentsByContractorCommand(), **context)
+    assert {(r.contractor_id, r.currency, r.amount) for r in rows} == {
+        (contractor_ids[0], TCurrency.USD, Decimal("20.14")),
+        (contractor_ids[1], TCurrency.EUR, Decimal("10.07")),
+    }
+    rows = await bus.handler(EmployerPaymentsByCurrencyCommand(from_month=date(month.year - 1, 1, 1)), **context)
+    assert [(r.currency, r.amount) for r in rows] == [
+        (TCurrency.EUR, Decimal("10.07")),
+        (TCurrency.USD, Decimal("20.14")),
+    ]
+
+    with pytest.raises(ValidationException):
+        await bus.handler(EmployerPaymentsByMonthCommand(from_month=date(2000, 1, 1)), **context)
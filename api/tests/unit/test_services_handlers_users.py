@@ -0,0 +1,81 @@
+import uuid
+
+import pytest
+
+from domain.commands.users import GenerateInvitationCodeCommand, SignUpUserCommand
+from domain.models.companies import Company, CompanyM2MEmployer
+from domain.models.principals import Principal
+from domain.types import TRole
+from service_layer.exceptions import ValidationException
+from service_layer.handlers.users import generate_invitation_code_handler
+
+
+def signup(email: str, role: TRole, password: str = "password") -> SignUpUserCommand:
+    return SignUpUserCommand(email=email, role=role, password=password, repeat_password=password)
+
+
+@pytest.mark.asyncio
+async def test_signup_user_handler(bus):
+    user = await bus.handler(signup("user@test.com", TRole.CONTRACTOR))
+    again = await bus.handler(signup("user@test.com", TRole.CONTRACTOR, password="new password"))
+    assert again.id == user.id
+    assert await again.verify_password("new password", bus.password_hasher.hash)
+    with pytest.raises(ValidationException) as e:
+        await bus.handler(signup("user@test.com", TRole.EMPLOYER))
+    assert e.value.detail == "User with other role and this email already exists"
+
+    async with bus.uow:
+        user = await bus.uow.users.get(id=user.id)
+        user.is_active = True
+        await bus.uow.users.update(user)
+    with pytest.raises(ValidationException) as e:
+        await bus.handler(signup("user@test.com", TRole.CONTRACTOR))
+    assert e.value.detail == "Active user with this email already exists"
+
+
+@pytest.mark.asyncio
+async def test_generate_invitation_code_handler(bus):
+    company = Company(id=uuid.uuid4(), name="company", owner_id=uuid.uuid4())
+    principal = Principal(id=company.owner_id, role=TRole.EMPLOYER, is_active=True, company_ids={company.id})
+    async with bus.uow:
+        await bus.uow.companies.add(company)
+    command = GenerateInvitationCodeCommand(company_id=company.id, email="invited@test.com")
+    invite = await generate_invitation_code_handler(
+        command, uow=bus.uow, current_user_id=company.owner_id, current_principal=principal
+    )
+    assert invite.invitation_code
+    async with bus.uow:
+        user = await bus.uow.users.get(email="invited@test.com")
+    assert (user.role, user.is_active) == (TRole.CONTRACTOR, False)
+    with pytest.raises(ValidationException) as e:
+        await generate_invitation_code_handler(
+            command, uow=bus.uow, current_user_id=company.owner_id, current_principal=principal
+        )
+    assert e.value.detail == "Invitation with this email and company_id already exists"
+
+
+@pytest.mark.asyncio
+async def test_generate_invitation_code_handler_preconditions(bus):
+    company = Company(id=uuid.uuid4(), name="company", owner_id=uuid.uuid4())
+    principal = Principal(id=company.owner_id, role=TRole.EMPLOYER, is_active=True, company_ids={company.id})
+    command = GenerateInvitationCodeCommand(company_id=company.id, email="employer@test.com")
+    with pytest.raises(ValidationException) as e:
+        await generate_invitation_code_handler(
+            command, uow=bus.uow, current_user_id=company.owner_id, current_principal=principal
+        )
+    assert e.value.detail == "Company with this company_id doesn't exist"
+
+    await bus.handler(signup("employer@test.com", TRole.EMPLOYER))
+    async with bus.uow:
+        await bus.uow.companies.add(company)
+        employer = await bus.uow.users.get(email="employer@test.com")
+        await bus.uow.companies_m2m_employers.add(
+            CompanyM2MEmployer(id=uuid.uuid4(), company_id=company.id, employer_id=employer.id)
+        )
+        preconditions = await bus.uow.invite_users_to_companies.get_preconditions(company.id, employer.email)
+    assert (preconditions.user_id, preconditions.user_role) == (employer.id, TRole.EMPLOYER)
+    with pytest.raises(ValidationException) as e:
+        await generate_invitation_code_handler(
+            command, uow=bus.uow, current_user_id=company.owner_id, current_principal=principal
+        )
+    assert e.value.detail == "User is already in this company"